@@ -7,6 +7,7 @@
 from rbnics.backends.abstract.abs import abs
 from rbnics.backends.abstract.affine_expansion_storage import AffineExpansionStorage
 from rbnics.backends.abstract.assign import assign
+from rbnics.backends.abstract.axpy import axpy
 from rbnics.backends.abstract.basis_functions_matrix import BasisFunctionsMatrix
 from rbnics.backends.abstract.copy import copy
 from rbnics.backends.abstract.eigen_solver import EigenSolver
@@ -47,6 +48,7 @@ __all__ = [
     "abs",
     "AffineExpansionStorage",
     "assign",
+    "axpy",
     "BasisFunctionsMatrix",
     "copy",
     "EigenSolver",
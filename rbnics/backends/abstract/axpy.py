@@ -0,0 +1,13 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from rbnics.utils.decorators import abstract_backend
+
+
+# Add a * object_from to object_to in place
+@abstract_backend
+def axpy(object_to, a, object_from):
+    pass
@@ -16,6 +16,14 @@ class EigenSolver(object, metaclass=ABCMeta):
     def set_parameters(self, parameters):
         pass
 
+    @abstractmethod
+    def set_initial_space(self, initial_space):
+        """
+        Provide a list of functions spanning an initial guess of the eigenspace, e.g. eigenvectors
+        computed for a nearby parameter.
+        """
+        pass
+
     @abstractmethod
     def solve(self, n_eigs=None):
         pass
@@ -13,7 +13,9 @@ class GramSchmidt(object, metaclass=ABCMeta):
         pass
 
     # Apply one iteration of Gram Schmidt procedure to orthonormalize the new basis function
-    # with respect to the provided basis functions matrix
+    # with respect to the provided basis functions matrix. A list of new basis functions can also be provided,
+    # in which case the whole list is first orthogonalized with respect to the basis functions, and then
+    # each of them is orthonormalized with respect to the previous ones in the list
     @abstractmethod
     def apply(self, new_basis_function, basis_functions, component=None):
         pass
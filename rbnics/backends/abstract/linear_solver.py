@@ -17,6 +17,10 @@ class LinearSolver(object, metaclass=ABCMeta):
     def __init__(self, problem_wrapper, solution):
         pass
 
+    @abstractmethod
+    def set_rhs(self, rhs):
+        pass
+
     @abstractmethod
     def set_parameters(self, parameters):
         pass
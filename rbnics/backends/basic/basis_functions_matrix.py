@@ -280,6 +280,8 @@ def BasisFunctionsMatrix(backend, wrapping, online_backend, online_wrapping):
                 for component_name in self._components_name:
                     output._components[component_name].enrich(self._components[component_name][N_start:N_stop],
                                                               copy=False)
+                    output._components[component_name]._dense_local_content_source = (
+                        self._components[component_name], N_start)
                 self._precomputed_slices[N_start, N_stop] = output
             return self._precomputed_slices[N_start, N_stop]
 
@@ -310,6 +312,8 @@ def BasisFunctionsMatrix(backend, wrapping, online_backend, online_wrapping):
                 for component_name in self._components_name:
                     output._components[component_name].enrich(self._components[component_name][
                         N_start[component_name]:N_stop[component_name]], copy=False)
+                    output._components[component_name]._dense_local_content_source = (
+                        self._components[component_name], N_start[component_name])
                 self._precomputed_slices[N_start_key, N_stop_key] = output
             return self._precomputed_slices[N_start_key, N_stop_key]
 
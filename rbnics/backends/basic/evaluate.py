@@ -14,6 +14,11 @@ def evaluate(backend, wrapping, online_backend, online_wrapping):
         def __call__(self, function, at):
             return wrapping.evaluate_sparse_function_at_dofs(function, at.get_dofs_list())
 
+        @overload(backend.Function.Type(), (backend.ReducedMesh, backend.ReducedVertices), int)
+        def __call__(self, function, at, index):
+            # Evaluate only at the location with the provided index
+            return wrapping.evaluate_sparse_function_at_dofs(function, at.get_dofs_list()[index:index + 1])[0]
+
         @overload(backend.FunctionsList, (backend.ReducedMesh, backend.ReducedVertices))
         def __call__(self, functions_list, at):
             out_size = len(at.get_dofs_list())
@@ -47,6 +52,16 @@ def evaluate(backend, wrapping, online_backend, online_wrapping):
         def __call__(self, vector, at):
             return wrapping.evaluate_sparse_vector_at_dofs(vector, at.get_dofs_list())
 
+        @overload(backend.Matrix.Type(), backend.ReducedMesh, int)
+        def __call__(self, matrix, at, index):
+            # Evaluate only at the location with the provided index
+            return wrapping.evaluate_and_vectorize_sparse_matrix_at_dofs(matrix, at.get_dofs_list()[index:index + 1])[0]
+
+        @overload(backend.Vector.Type(), backend.ReducedMesh, int)
+        def __call__(self, vector, at, index):
+            # Evaluate only at the location with the provided index
+            return wrapping.evaluate_sparse_vector_at_dofs(vector, at.get_dofs_list()[index:index + 1])[0]
+
         @overload(backend.TensorsList, backend.ReducedMesh)
         def __call__(self, tensors_list, at):
             out_size = len(at.get_dofs_list())
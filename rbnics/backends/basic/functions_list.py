@@ -34,6 +34,8 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping,
             self.mpi_comm = wrapping.get_mpi_comm(space)
             self._list = list()  # of functions
             self._precomputed_slices = Cache()  # from tuple to FunctionsList
+            self._dense_local_content = ((), None)  # contiguous copy of the local content, used by some backends
+            self._dense_local_content_source = None  # functions list (and offset) this one is a slice of, if any
 
         def enrich(self, functions, component=None, weights=None, copy=True):
             # Append to storage
@@ -95,6 +97,7 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping,
 
         def clear(self):
             self._list = list()
+            self._dense_local_content = ((), None)
             # Reset precomputed slices
             self._precomputed_slices.clear()
 
@@ -170,6 +173,7 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping,
                 output.__init__(self.space)
                 if start < stop:
                     output._list = self._list[key]
+                output._dense_local_content_source = (self, start)
                 self._precomputed_slices[start, stop] = output
             return self._precomputed_slices[start, stop]
 
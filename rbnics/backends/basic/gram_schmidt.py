@@ -20,19 +20,38 @@ def GramSchmidt(backend, wrapping):
             self.inner_product = inner_product
 
         def apply(self, new_basis_function, basis_functions, component=None):
-            inner_product = self.inner_product
-
-            transpose = backend.transpose
+            if isinstance(new_basis_function, (list, tuple)):
+                return self._apply_block(new_basis_function, basis_functions, component)
 
             new_basis_function = self._extend_or_restrict_if_needed(new_basis_function, component)
+            new_basis_function = self._project(new_basis_function, basis_functions)
+            return self._normalize(new_basis_function)
 
-            for b in basis_functions:
-                new_basis_function = wrapping.gram_schmidt_projection_step(new_basis_function, inner_product, b,
-                                                                           transpose)
+        def _apply_block(self, new_basis_functions, basis_functions, component):
+            # Project the whole block against the basis functions first, and then orthonormalize within the block,
+            # so that the (possibly large) basis functions are never concatenated with the block
+            new_basis_functions = [
+                self._project(self._extend_or_restrict_if_needed(new_basis_function, component), basis_functions)
+                for new_basis_function in new_basis_functions]
+            orthonormalized_new_basis_functions = list()
+            for new_basis_function in new_basis_functions:
+                new_basis_function = self._project(new_basis_function, orthonormalized_new_basis_functions)
+                orthonormalized_new_basis_functions.append(self._normalize(new_basis_function))
+            return orthonormalized_new_basis_functions
+
+        def _project(self, new_basis_function, basis_functions):
+            # Classical Gram Schmidt with reorthogonalization: each pass projects against all basis functions at once
+            for _ in range(2):
+                new_basis_function = wrapping.gram_schmidt_projection_step(new_basis_function, self.inner_product,
+                                                                           basis_functions)
+            return new_basis_function
+
+        def _normalize(self, new_basis_function):
+            transpose = backend.transpose
+            inner_product = self.inner_product
             norm_new_basis_function = sqrt(transpose(new_basis_function) * inner_product * new_basis_function)
             if norm_new_basis_function != 0.:
                 new_basis_function /= norm_new_basis_function
-
             return new_basis_function
 
         @overload(backend.Function.Type(), (None, str))
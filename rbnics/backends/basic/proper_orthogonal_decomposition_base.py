@@ -5,7 +5,10 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from math import sqrt
-from numpy import abs, cumsum as compute_retained_energy, isclose, sum as compute_total_energy
+from numpy import abs, argsort, asarray, cumsum as compute_retained_energy, dot, isclose, sum as compute_total_energy
+from numpy.linalg import eigh, qr
+from numpy.random import default_rng
+from rbnics.utils.config import config
 from rbnics.utils.io import ExportableList
 
 
@@ -37,6 +40,10 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
         # the tensor one.
 
         def apply(self, Nmax, tol):
+            if (config.get("backends", "randomized POD") and self.inner_product is not None
+                    and Nmax + _randomized_oversampling < len(self.snapshots_matrix)):
+                return self._apply_randomized(Nmax, tol)
+
             inner_product = self.inner_product
             snapshots_matrix = self.snapshots_matrix
             transpose = backend.transpose
@@ -54,17 +61,25 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
                 "spectrum": "largest real"
             }
             eigensolver.set_parameters(parameters)
-            eigensolver.solve()
 
             Neigs = len(self.snapshots_matrix)
             Nmax = min(Nmax, Neigs)
+            if 0 < Nmax < Neigs:
+                # Only compute the required eigenvalues, since the total energy is the trace of the correlation matrix
+                eigensolver.solve(Nmax)
+                total_energy = compute_total_energy([abs(correlation[i, i]) for i in range(Neigs)])
+                Neigs = Nmax
+            else:
+                eigensolver.solve()
+                total_energy = None
             assert len(self.eigenvalues) == 0
             for i in range(Neigs):
                 (eig_i_real, eig_i_complex) = eigensolver.get_eigenvalue(i)
                 assert isclose(eig_i_complex, 0.)
                 self.eigenvalues.append(eig_i_real)
 
-            total_energy = compute_total_energy([abs(e) for e in self.eigenvalues])
+            if total_energy is None:
+                total_energy = compute_total_energy([abs(e) for e in self.eigenvalues])
             retained_energy = compute_retained_energy([abs(e) for e in self.eigenvalues])
             assert len(self.retained_energy) == 0
             if total_energy > 0.:
@@ -91,9 +106,69 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
 
             return (self.eigenvalues[:N], eigenvectors, basis_functions, N)
 
+        # Randomized variant of apply: the dominant eigenpairs of the correlation matrix are approximated by
+        # a randomized range finder, which only requires the action of the correlation matrix on a few vectors.
+        # Only Nmax + oversampling eigenvalues are computed, while the total energy is computed exactly.
+        def _apply_randomized(self, Nmax, tol):
+            inner_product = self.inner_product
+            snapshots_matrix = self.snapshots_matrix
+            transpose = backend.transpose
+            Nsnapshots = len(snapshots_matrix)
+            Neigs = Nmax + _randomized_oversampling
+
+            def correlation_times(vectors):
+                # Apply the correlation matrix to the whole block of vectors at once
+                vectors_matrix = online_backend.OnlineMatrix(Nsnapshots, vectors.shape[1])
+                vectors_matrix[:, :] = vectors
+                return asarray(transpose(snapshots_matrix) * inner_product * (snapshots_matrix * vectors_matrix))
+
+            # Find an orthonormal basis of the dominant range of the correlation matrix, with a fixed seed
+            # so that all processes draw the same random vectors
+            (range_basis, _) = qr(correlation_times(
+                default_rng(_randomized_seed).standard_normal((Nsnapshots, Neigs))))
+            for _ in range(_randomized_power_iterations):
+                (range_basis, _) = qr(correlation_times(range_basis))
+
+            # Solve the eigenvalue problem for the correlation matrix projected onto such range
+            projected_correlation = dot(range_basis.T, correlation_times(range_basis))
+            (eigs, eigv) = eigh((projected_correlation + projected_correlation.T) / 2.)
+            idx = argsort(eigs)[::-1]
+            eigs = eigs[idx]
+            eigv = dot(range_basis, eigv[:, idx])
+
+            assert len(self.eigenvalues) == 0
+            self.eigenvalues.extend([float(e) for e in eigs])
+
+            # The total energy is the trace of the correlation matrix
+            total_energy = sum(transpose(snapshot) * inner_product * snapshot for snapshot in snapshots_matrix)
+            retained_energy = compute_retained_energy([abs(e) for e in self.eigenvalues])
+            assert len(self.retained_energy) == 0
+            if total_energy > 0.:
+                self.retained_energy.extend([retained_energy_i / total_energy
+                                             for retained_energy_i in retained_energy])
+            else:
+                self.retained_energy.extend([1. for _ in range(Neigs)])  # trivial case, all snapshots are zero
+
+            basis_functions = BasisContainerType(self.space, *self.args)
+            eigenvectors = list()
+            for N in range(Nmax):
+                eigvector = online_backend.OnlineFunction(Nsnapshots)
+                eigvector.vector()[:] = eigv[:, N]
+                eigenvectors.append(eigvector)
+                b = self.snapshots_matrix * eigvector
+                norm_b = sqrt(transpose(b) * inner_product * b)
+                if norm_b != 0.:
+                    b /= norm_b
+                basis_functions.enrich(b)
+                if tol > 0. and self.retained_energy[N] > 1. - tol:
+                    break
+            N += 1
+
+            return (self.eigenvalues[:N], eigenvectors, basis_functions, N)
+
         def print_eigenvalues(self, N=None):
             if N is None:
-                N = len(self.snapshots_matrix)
+                N = len(self.eigenvalues)
             for i in range(N):
                 print("lambda_" + str(i) + " = " + str(self.eigenvalues[i]))
 
@@ -104,3 +179,9 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
             self.retained_energy.save(output_directory, retained_energy_file)
 
     return _ProperOrthogonalDecompositionBase
+
+
+# Parameters of the randomized range finder used by the randomized POD
+_randomized_oversampling = 10
+_randomized_power_iterations = 2
+_randomized_seed = 0
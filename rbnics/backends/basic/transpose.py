@@ -122,6 +122,15 @@ def transpose(backend, wrapping, online_backend, online_wrapping,
     return _Transpose()
 
 
+# Auxiliary: backends may store a contiguous copy of the local content of the basis functions, so that products
+# involving all basis functions are carried out at once rather than one basis function at a time
+def _use_dense_basis_storage(wrapping, basis_length):
+    if isinstance(basis_length, dict):
+        basis_length = sum(basis_length.values())
+    return (basis_length > 0 and hasattr(wrapping, "dense_basis_storage_enabled")
+            and wrapping.dense_basis_storage_enabled())
+
+
 # Auxiliary: transpose of a vector
 def Vector_Transpose(backend, wrapping, online_backend, online_wrapping,
                      AdditionalIsFunction, ConvertAdditionalFunctionTypes,
@@ -253,9 +262,14 @@ def FunctionsList_Transpose(backend, wrapping, online_backend, online_wrapping,
         def __mul__(self, function):
             logger.log(DEBUG, "Begin S^T w")
             output = online_backend.OnlineVector(len(self.functions_list))
-            for (i, fun_i) in enumerate(self.functions_list):
-                output[i] = wrapping.vector_mul_vector(
-                    wrapping.function_to_vector(fun_i), wrapping.function_to_vector(function))
+            if _use_dense_basis_storage(wrapping, len(self.functions_list)):
+                output[:] = wrapping.dense_basis_transpose_mul_vector(
+                    wrapping.functions_list_dense_local_content(self.functions_list),
+                    wrapping.function_to_vector(function))
+            else:
+                for (i, fun_i) in enumerate(self.functions_list):
+                    output[i] = wrapping.vector_mul_vector(
+                        wrapping.function_to_vector(fun_i), wrapping.function_to_vector(function))
             logger.log(DEBUG, "End S^T w")
             return output
 
@@ -268,8 +282,12 @@ def FunctionsList_Transpose(backend, wrapping, online_backend, online_wrapping,
         def __mul__(self, vector):
             logger.log(DEBUG, "Begin S^T w")
             output = online_backend.OnlineVector(len(self.functions_list))
-            for (i, fun_i) in enumerate(self.functions_list):
-                output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), vector)
+            if _use_dense_basis_storage(wrapping, len(self.functions_list)):
+                output[:] = wrapping.dense_basis_transpose_mul_vector(
+                    wrapping.functions_list_dense_local_content(self.functions_list), vector)
+            else:
+                for (i, fun_i) in enumerate(self.functions_list):
+                    output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), vector)
             logger.log(DEBUG, "End S^T w")
             return output
 
@@ -305,10 +323,17 @@ def FunctionsList_Transpose__times__Matrix(backend, wrapping, online_backend, on
         def __mul__(self, other_functions_list):
             logger.log(DEBUG, "Begin S^T*A*S")
             output = online_backend.OnlineMatrix(len(self.functions_list), len(other_functions_list))
-            for (j, fun_j) in enumerate(other_functions_list):
-                matrix_times_fun_j = wrapping.matrix_mul_vector(self.matrix, wrapping.function_to_vector(fun_j))
-                for (i, fun_i) in enumerate(self.functions_list):
-                    output[i, j] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), matrix_times_fun_j)
+            if (_use_dense_basis_storage(wrapping, len(self.functions_list))
+                    and _use_dense_basis_storage(wrapping, len(other_functions_list))):
+                output[:, :] = wrapping.dense_basis_transpose_mul_matrix_mul_dense_basis(
+                    wrapping.functions_list_dense_local_content(self.functions_list), self.matrix,
+                    wrapping.functions_list_dense_local_content(other_functions_list))
+            else:
+                for (j, fun_j) in enumerate(other_functions_list):
+                    matrix_times_fun_j = wrapping.matrix_mul_vector(self.matrix, wrapping.function_to_vector(fun_j))
+                    for (i, fun_i) in enumerate(self.functions_list):
+                        output[i, j] = wrapping.vector_mul_vector(
+                            wrapping.function_to_vector(fun_i), matrix_times_fun_j)
             logger.log(DEBUG, "End S^T*A*S")
             return output
 
@@ -317,8 +342,12 @@ def FunctionsList_Transpose__times__Matrix(backend, wrapping, online_backend, on
             logger.log(DEBUG, "Begin S^T*A*v")
             output = online_backend.OnlineVector(len(self.functions_list))
             matrix_times_function = wrapping.matrix_mul_vector(self.matrix, wrapping.function_to_vector(function))
-            for (i, fun_i) in enumerate(self.functions_list):
-                output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), matrix_times_function)
+            if _use_dense_basis_storage(wrapping, len(self.functions_list)):
+                output[:] = wrapping.dense_basis_transpose_mul_vector(
+                    wrapping.functions_list_dense_local_content(self.functions_list), matrix_times_function)
+            else:
+                for (i, fun_i) in enumerate(self.functions_list):
+                    output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), matrix_times_function)
             logger.log(DEBUG, "End S^T*A*v")
             return output
 
@@ -327,8 +356,12 @@ def FunctionsList_Transpose__times__Matrix(backend, wrapping, online_backend, on
             logger.log(DEBUG, "Begin S^T*A*v")
             output = online_backend.OnlineVector(len(self.functions_list))
             matrix_times_vector = wrapping.matrix_mul_vector(self.matrix, vector)
-            for (i, fun_i) in enumerate(self.functions_list):
-                output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), matrix_times_vector)
+            if _use_dense_basis_storage(wrapping, len(self.functions_list)):
+                output[:] = wrapping.dense_basis_transpose_mul_vector(
+                    wrapping.functions_list_dense_local_content(self.functions_list), matrix_times_vector)
+            else:
+                for (i, fun_i) in enumerate(self.functions_list):
+                    output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), matrix_times_vector)
             logger.log(DEBUG, "End S^T*A*v")
             return output
 
@@ -366,12 +399,17 @@ def BasisFunctionsMatrix_Transpose(backend, wrapping, online_backend, online_wra
         def __mul__(self, function):
             logger.log(DEBUG, "Begin Z^T w")
             output = online_backend.OnlineVector(self.basis_functions_matrix._component_name_to_basis_component_length)
-            i = 0
-            for component_name in self.basis_functions_matrix._components_name:
-                for fun_i in self.basis_functions_matrix._components[component_name]:
-                    output[i] = wrapping.vector_mul_vector(
-                        wrapping.function_to_vector(fun_i), wrapping.function_to_vector(function))
-                    i += 1
+            if _use_dense_basis_storage(wrapping, self._component_name_to_basis_component_length):
+                output[:] = wrapping.dense_basis_transpose_mul_vector(
+                    wrapping.basis_functions_matrix_dense_local_content(self.basis_functions_matrix),
+                    wrapping.function_to_vector(function))
+            else:
+                i = 0
+                for component_name in self.basis_functions_matrix._components_name:
+                    for fun_i in self.basis_functions_matrix._components[component_name]:
+                        output[i] = wrapping.vector_mul_vector(
+                            wrapping.function_to_vector(fun_i), wrapping.function_to_vector(function))
+                        i += 1
             logger.log(DEBUG, "End Z^T w")
             # Assert consistency of private attributes storing the order of components and their basis length.
             assert output._component_name_to_basis_component_index == self._component_name_to_basis_component_index
@@ -387,11 +425,15 @@ def BasisFunctionsMatrix_Transpose(backend, wrapping, online_backend, online_wra
         def __mul__(self, vector):
             logger.log(DEBUG, "Begin Z^T w")
             output = online_backend.OnlineVector(self.basis_functions_matrix._component_name_to_basis_component_length)
-            i = 0
-            for component_name in self.basis_functions_matrix._components_name:
-                for fun_i in self.basis_functions_matrix._components[component_name]:
-                    output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), vector)
-                    i += 1
+            if _use_dense_basis_storage(wrapping, self._component_name_to_basis_component_length):
+                output[:] = wrapping.dense_basis_transpose_mul_vector(
+                    wrapping.basis_functions_matrix_dense_local_content(self.basis_functions_matrix), vector)
+            else:
+                i = 0
+                for component_name in self.basis_functions_matrix._components_name:
+                    for fun_i in self.basis_functions_matrix._components[component_name]:
+                        output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), vector)
+                        i += 1
             logger.log(DEBUG, "End Z^T w")
             # Assert consistency of private attributes storing the order of components and their basis length.
             assert output._component_name_to_basis_component_index == self._component_name_to_basis_component_index
@@ -444,18 +486,25 @@ def BasisFunctionsMatrix_Transpose__times__Matrix(backend, wrapping, online_back
             output = online_backend.OnlineMatrix(
                 self.basis_functions_matrix._component_name_to_basis_component_length,
                 other_basis_functions_matrix._component_name_to_basis_component_length)
-            j = 0
-            for other_component_name in other_basis_functions_matrix._components_name:
-                for fun_j in other_basis_functions_matrix._components[other_component_name]:
-                    matrix_times_fun_j = wrapping.matrix_mul_vector(
-                        self.matrix, wrapping.function_to_vector(fun_j))
-                    i = 0
-                    for self_component_name in self.basis_functions_matrix._components_name:
-                        for fun_i in self.basis_functions_matrix._components[self_component_name]:
-                            output[i, j] = wrapping.vector_mul_vector(
-                                wrapping.function_to_vector(fun_i), matrix_times_fun_j)
-                            i += 1
-                    j += 1
+            if (_use_dense_basis_storage(wrapping, self._component_name_to_basis_component_length)
+                    and _use_dense_basis_storage(
+                        wrapping, other_basis_functions_matrix._component_name_to_basis_component_length)):
+                output[:, :] = wrapping.dense_basis_transpose_mul_matrix_mul_dense_basis(
+                    wrapping.basis_functions_matrix_dense_local_content(self.basis_functions_matrix), self.matrix,
+                    wrapping.basis_functions_matrix_dense_local_content(other_basis_functions_matrix))
+            else:
+                j = 0
+                for other_component_name in other_basis_functions_matrix._components_name:
+                    for fun_j in other_basis_functions_matrix._components[other_component_name]:
+                        matrix_times_fun_j = wrapping.matrix_mul_vector(
+                            self.matrix, wrapping.function_to_vector(fun_j))
+                        i = 0
+                        for self_component_name in self.basis_functions_matrix._components_name:
+                            for fun_i in self.basis_functions_matrix._components[self_component_name]:
+                                output[i, j] = wrapping.vector_mul_vector(
+                                    wrapping.function_to_vector(fun_i), matrix_times_fun_j)
+                                i += 1
+                        j += 1
             logger.log(DEBUG, "End Z^T*A*Z")
             # Assert consistency of private attributes storing the order of components and their basis length.
             assert output._component_name_to_basis_component_index == (
@@ -472,11 +521,17 @@ def BasisFunctionsMatrix_Transpose__times__Matrix(backend, wrapping, online_back
             logger.log(DEBUG, "Begin Z^T*A*v")
             output = online_backend.OnlineVector(self.basis_functions_matrix._component_name_to_basis_component_length)
             matrix_times_function = wrapping.matrix_mul_vector(self.matrix, wrapping.function_to_vector(function))
-            i = 0
-            for component_name in self.basis_functions_matrix._components_name:
-                for fun_i in self.basis_functions_matrix._components[component_name]:
-                    output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), matrix_times_function)
-                    i += 1
+            if _use_dense_basis_storage(wrapping, self._component_name_to_basis_component_length):
+                output[:] = wrapping.dense_basis_transpose_mul_vector(
+                    wrapping.basis_functions_matrix_dense_local_content(self.basis_functions_matrix),
+                    matrix_times_function)
+            else:
+                i = 0
+                for component_name in self.basis_functions_matrix._components_name:
+                    for fun_i in self.basis_functions_matrix._components[component_name]:
+                        output[i] = wrapping.vector_mul_vector(
+                            wrapping.function_to_vector(fun_i), matrix_times_function)
+                        i += 1
             logger.log(DEBUG, "End Z^T*A*v")
             # Assert consistency of private attributes storing the order of components and their basis length.
             assert output._component_name_to_basis_component_index == self._component_name_to_basis_component_index
@@ -489,11 +544,17 @@ def BasisFunctionsMatrix_Transpose__times__Matrix(backend, wrapping, online_back
             logger.log(DEBUG, "Begin Z^T*A*v")
             output = online_backend.OnlineVector(self.basis_functions_matrix._component_name_to_basis_component_length)
             matrix_times_vector = wrapping.matrix_mul_vector(self.matrix, vector)
-            i = 0
-            for component_name in self.basis_functions_matrix._components_name:
-                for fun_i in self.basis_functions_matrix._components[component_name]:
-                    output[i] = wrapping.vector_mul_vector(wrapping.function_to_vector(fun_i), matrix_times_vector)
-                    i += 1
+            if _use_dense_basis_storage(wrapping, self._component_name_to_basis_component_length):
+                output[:] = wrapping.dense_basis_transpose_mul_vector(
+                    wrapping.basis_functions_matrix_dense_local_content(self.basis_functions_matrix),
+                    matrix_times_vector)
+            else:
+                i = 0
+                for component_name in self.basis_functions_matrix._components_name:
+                    for fun_i in self.basis_functions_matrix._components[component_name]:
+                        output[i] = wrapping.vector_mul_vector(
+                            wrapping.function_to_vector(fun_i), matrix_times_vector)
+                        i += 1
             logger.log(DEBUG, "End Z^T*A*v")
             # Assert consistency of private attributes storing the order of components and their basis length.
             assert output._component_name_to_basis_component_index == self._component_name_to_basis_component_index
@@ -4,10 +4,17 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-import cvxopt
+try:
+    import cvxopt
+except ImportError:
+    has_cvxopt = False
+else:
+    has_cvxopt = True
 from numbers import Number
-from numpy import eye, hstack, isclose, matrix as numpy_matrix, ndarray as numpy_vector, vstack, zeros
+from numpy import asarray, eye, hstack, isclose, matrix as numpy_matrix, ndarray as numpy_vector, vstack, zeros
+from scipy.optimize import linprog
 from rbnics.backends.abstract import LinearProgramSolver as AbstractLinearProgramSolver
+from rbnics.utils.config import config
 from rbnics.utils.decorators import BackendFor, list_of, tuple_of
 
 
@@ -29,12 +36,11 @@ class Error(RuntimeError):
 class LinearProgramSolver(AbstractLinearProgramSolver):
     def __init__(self, cost, inequality_constraints_matrix, inequality_constraints_vector, bounds):
         self.Q = len(cost)
-        # Store cost
-        self.cost = cvxopt.matrix(cost)
-        # Store inequality constraints matrix, also including a 2*Q x 2*Q submatrix for bound constraints
-        self.inequality_constraints_matrix = cvxopt.matrix(vstack((- inequality_constraints_matrix, - eye(self.Q),
-                                                                   eye(self.Q))))
-        # Store inequality constraints vector, also including 2*Q rows for bound constraints
+        # Choose between glpk (through cvxopt) and HiGHS (through scipy)
+        self.solver = config.get("backends", "linear program solver")
+        assert self.solver in ("glpk", "highs")
+        assert self.solver != "glpk" or has_cvxopt, "glpk linear program solver requires cvxopt"
+        # Prepare bounds
         assert len(bounds) == self.Q
         bounds_lower = zeros(self.Q)
         bounds_upper = zeros(self.Q)
@@ -46,13 +52,35 @@ class LinearProgramSolver(AbstractLinearProgramSolver):
             else:
                 bounds_lower[q] = bounds_q[1]
                 bounds_upper[q] = bounds_q[0]
-        self.inequality_constraints_vector = cvxopt.matrix(hstack((- inequality_constraints_vector,
-                                                                   bounds_lower, bounds_upper)))
+        if self.solver == "glpk":
+            # Store cost
+            self.cost = cvxopt.matrix(cost)
+            # Store inequality constraints matrix, also including a 2*Q x 2*Q submatrix for bound constraints
+            self.inequality_constraints_matrix = cvxopt.matrix(vstack((- inequality_constraints_matrix,
+                                                                       - eye(self.Q), eye(self.Q))))
+            # Store inequality constraints vector, also including 2*Q rows for bound constraints
+            self.inequality_constraints_vector = cvxopt.matrix(hstack((- inequality_constraints_vector,
+                                                                       - bounds_lower, bounds_upper)))
+        else:
+            # Store cost and inequality constraints, while bounds are passed directly to the solver
+            self.cost = cost
+            self.inequality_constraints_matrix = - asarray(inequality_constraints_matrix)
+            self.inequality_constraints_vector = - inequality_constraints_vector
+            self.bounds = list(zip(bounds_lower, bounds_upper))
 
     def solve(self):
-        result = cvxopt.solvers.lp(self.cost, self.inequality_constraints_matrix, self.inequality_constraints_vector,
-                                   solver="glpk", options={"glpk": {"msg_lev": "GLP_MSG_OFF"}})
-        if result["status"] != "optimal":
-            raise Error("Linear program solver reports convergence failure with reason", result["status"])
+        if self.solver == "glpk":
+            result = cvxopt.solvers.lp(self.cost, self.inequality_constraints_matrix,
+                                       self.inequality_constraints_vector,
+                                       solver="glpk", options={"glpk": {"msg_lev": "GLP_MSG_OFF"}})
+            if result["status"] != "optimal":
+                raise Error("Linear program solver reports convergence failure with reason", result["status"])
+            else:
+                return result["primal objective"]
         else:
-            return result["primal objective"]
+            result = linprog(self.cost, A_ub=self.inequality_constraints_matrix,
+                             b_ub=self.inequality_constraints_vector, bounds=self.bounds, method="highs")
+            if result.status != 0:
+                raise Error("Linear program solver reports convergence failure with reason", result.message)
+            else:
+                return result.fun
@@ -8,6 +8,7 @@
 from rbnics.backends.dolfin.abs import abs
 from rbnics.backends.dolfin.affine_expansion_storage import AffineExpansionStorage
 from rbnics.backends.dolfin.assign import assign
+from rbnics.backends.dolfin.axpy import axpy
 from rbnics.backends.dolfin.basis_functions_matrix import BasisFunctionsMatrix
 from rbnics.backends.dolfin.copy import copy
 from rbnics.backends.dolfin.eigen_solver import EigenSolver
@@ -53,6 +54,7 @@ __all__ = [
     "abs",
     "AffineExpansionStorage",
     "assign",
+    "axpy",
     "BasisFunctionsMatrix",
     "copy",
     "EigenSolver",
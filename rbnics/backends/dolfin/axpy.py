@@ -0,0 +1,33 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numbers import Number
+from rbnics.backends.dolfin.function import Function
+from rbnics.backends.dolfin.matrix import Matrix
+from rbnics.backends.dolfin.vector import Vector
+from rbnics.backends.dolfin.wrapping import to_petsc4py
+from rbnics.utils.decorators import backend_for, overload
+
+
+@backend_for("dolfin", inputs=((Function.Type(), Matrix.Type(), Vector.Type()), Number,
+                               (Function.Type(), Matrix.Type(), Vector.Type())))
+def axpy(object_to, a, object_from):
+    _axpy(object_to, a, object_from)
+
+
+@overload
+def _axpy(object_to: Function.Type(), a: Number, object_from: Function.Type()):
+    object_to.vector().axpy(a, object_from.vector())
+
+
+@overload
+def _axpy(object_to: Matrix.Type(), a: Number, object_from: Matrix.Type()):
+    to_petsc4py(object_to).axpy(a, to_petsc4py(object_from), to_petsc4py(object_to).Structure.SAME_NONZERO_PATTERN)
+
+
+@overload
+def _axpy(object_to: Vector.Type(), a: Number, object_from: Vector.Type()):
+    to_petsc4py(object_to).axpy(a, to_petsc4py(object_from))
@@ -152,6 +152,46 @@ class EigenSolver(AbstractEigenSolver):
                 parameters.pop("linear_solver")
         self.eigen_solver.parameters.update(parameters)
 
+    def set_initial_space(self, initial_space):
+        # Helper functions
+        cpp_code = """
+            #include <pybind11/pybind11.h>
+            #include <pybind11/stl.h>
+            #include <dolfin/la/PETScVector.h>
+            #include <dolfin/la/SLEPcEigenSolver.h>
+
+            void set_initial_space(std::shared_ptr<dolfin::SLEPcEigenSolver> eigen_solver,
+                                   std::vector<std::shared_ptr<dolfin::PETScVector>> initial_space)
+            {
+                std::vector<Vec> initial_space_vecs;
+                for (auto & initial_vector: initial_space)
+                    initial_space_vecs.push_back(initial_vector->vec());
+                PetscErrorCode ierr = EPSSetInitialSpace(eigen_solver->eps(), initial_space_vecs.size(),
+                                                         initial_space_vecs.data());
+                if (ierr != 0)
+                    throw std::runtime_error("Error in set_initial_space: error code " + std::to_string(ierr));
+            }
+
+            PYBIND11_MODULE(SIGNATURE, m)
+            {
+                m.def("set_initial_space", &set_initial_space);
+            }
+        """
+
+        set_initial_space = compile_cpp_code(cpp_code).set_initial_space
+
+        # Condense input vectors, storing a copy which is kept alive until the solver is set up
+        self._initial_space = list()
+        for function in initial_space:
+            vector = as_backend_type(function.vector()).vec()
+            if hasattr(self, "_is"):  # there were Dirichlet BCs
+                condensed_vector = vector.getSubVector(self._is)
+                self._initial_space.append(PETScVector(condensed_vector.copy()))
+                vector.restoreSubVector(self._is, condensed_vector)
+            else:
+                self._initial_space.append(PETScVector(vector.copy()))
+        set_initial_space(self.eigen_solver, self._initial_space)
+
     def solve(self, n_eigs=None):
         assert n_eigs is not None
         self.eigen_solver.solve(n_eigs)
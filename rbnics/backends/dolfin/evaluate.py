@@ -72,11 +72,25 @@ def evaluate(expression, at=None, **kwargs):
 def _evaluate(
     expression: (
         Matrix.Type(),
-        Vector.Type(),
-        TensorsList
+        Vector.Type()
     ),
     at: ReducedMesh,
     **kwargs
+):
+    assert (len(kwargs) == 0
+            or (len(kwargs) == 1 and "index" in kwargs))
+    index = kwargs.get("index", None)
+    if index is None:
+        return evaluate_base(expression, at)
+    else:
+        return evaluate_base(expression, at, index)
+
+
+@overload
+def _evaluate(
+    expression: TensorsList,
+    at: ReducedMesh,
+    **kwargs
 ):
     assert len(kwargs) == 0
     return evaluate_base(expression, at)
@@ -84,10 +98,25 @@ def _evaluate(
 
 @overload
 def _evaluate(
-    expression: (
-        Function.Type(),
-        FunctionsList
+    expression: Function.Type(),
+    at: (
+        ReducedMesh,
+        ReducedVertices
     ),
+    **kwargs
+):
+    assert (len(kwargs) == 0
+            or (len(kwargs) == 1 and "index" in kwargs))
+    index = kwargs.get("index", None)
+    if index is None:
+        return evaluate_base(expression, at)
+    else:
+        return evaluate_base(expression, at, index)
+
+
+@overload
+def _evaluate(
+    expression: FunctionsList,
     at: (
         ReducedMesh,
         ReducedVertices
@@ -4,14 +4,18 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from mpi4py.MPI import Comm, CONGRUENT, IDENT, LAND
+from numpy import array_equal
+from petsc4py import PETSc
 from ufl import Form
-from dolfin import assemble, DirichletBC, PETScLUSolver
+from dolfin import assemble, DirichletBC
 from rbnics.backends.abstract import LinearSolver as AbstractLinearSolver, LinearProblemWrapper
 from rbnics.backends.dolfin.evaluate import evaluate
 from rbnics.backends.dolfin.function import Function
 from rbnics.backends.dolfin.matrix import Matrix
 from rbnics.backends.dolfin.parametrized_tensor_factory import ParametrizedTensorFactory
 from rbnics.backends.dolfin.vector import Vector
+from rbnics.backends.dolfin.wrapping import get_default_linear_solver, to_petsc4py
 from rbnics.backends.dolfin.wrapping.dirichlet_bc import ProductOutputDirichletBC
 from rbnics.utils.decorators import BackendFor, dict_of, list_of, overload
 
@@ -27,10 +31,14 @@ class LinearSolver(AbstractLinearSolver):
                dict_of(str, ProductOutputDirichletBC), None))
     def __init__(self, lhs, solution, rhs, bcs=None):
         self.solution = solution
+        self._bcs = bcs
         self._init_lhs(lhs, bcs)
         self._init_rhs(rhs, bcs)
         self._apply_bcs(bcs)
         self._linear_solver = "default"
+        self._factorizations = list()  # factorizations of this solver, if they are not shared with other solvers
+        self._shared_factorizations = None
+        self._factorization = None  # setup by the first call to solve(), and reused by subsequent calls
         self.monitor = None
 
     @overload(LinearProblemWrapper, Function.Type())
@@ -97,14 +105,127 @@ class LinearSolver(AbstractLinearSolver):
             for bc in bcs[key]:
                 bc.apply(self.lhs, self.rhs)
 
+    @overload((list_of(DirichletBC), ProductOutputDirichletBC))
+    def _apply_bcs_to_rhs(self, bcs):
+        for bc in bcs:
+            bc.apply(self.rhs)
+
+    @overload((dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC)))
+    def _apply_bcs_to_rhs(self, bcs):
+        for key in bcs:
+            for bc in bcs[key]:
+                bc.apply(self.rhs)
+
+    @overload(None)
+    def _apply_bcs_to_rhs(self, bcs):
+        pass
+
+    @overload((Form, ParametrizedTensorFactory, Vector.Type()), )
+    def set_rhs(self, rhs):
+        self._init_rhs(rhs, self._bcs)
+        self._apply_bcs_to_rhs(self._bcs)
+
     def set_parameters(self, parameters):
-        assert len(parameters) in (0, 1)
-        if len(parameters) == 1:
-            assert "linear_solver" in parameters
+        assert all(key in ("factorizations", "linear_solver") for key in parameters)
         self._linear_solver = parameters.get("linear_solver", "default")
+        self._shared_factorizations = parameters.get("factorizations", None)
+        self._factorization = None
 
     def solve(self):
-        solver = PETScLUSolver(self._linear_solver)
-        solver.solve(self.lhs, self.solution.vector(), self.rhs)
+        # The factorization of lhs is looked up among the ones computed by previous solves, and then reused
+        # by subsequent calls as long as it is not updated for a different matrix and lhs is not changed
+        lhs = to_petsc4py(self.lhs)
+        if (self._factorization is None or self._factorization[1] != self._factorization[0].version
+                or self._factorization[2] != lhs.stateGet()):
+            if self._shared_factorizations is not None:
+                factorization = _get_factorization(
+                    lhs, self._linear_solver, self._shared_factorizations, _shared_factorizations_size)
+            else:
+                factorization = _get_factorization(lhs, self._linear_solver, self._factorizations, 1)
+            self._factorization = (factorization, factorization.version, lhs.stateGet())
+        self._factorization[0].solve(to_petsc4py(self.rhs), to_petsc4py(self.solution.vector()))
+        self.solution.vector().apply("insert")
         if self.monitor is not None:
             self.monitor(self.solution)
+
+
+# Factorizations may be shared among linear solvers by providing the same list in the "factorizations" parameter,
+# which is owned by the caller (e.g. a problem during the offline phase) and released by calling destroy() on
+# each of its items. A matrix which is equal to a previously factorized one (e.g. an inner product matrix) is not
+# factorized again, while a matrix with the same nonzero pattern of a previously factorized one (e.g. the same
+# operator for a different parameter) reuses its symbolic factorization
+class _Factorization(object):
+    def __init__(self, lhs, nonzero_pattern, linear_solver):
+        self.linear_solver = linear_solver
+        self.version = 0  # increased every time the factorized matrix is changed or destroyed
+        self.solves = 0  # number of solves since the factorized matrix was last changed
+        self._comm = lhs.getComm().tompi4py()
+        self._sizes = lhs.getSizes()
+        self._nonzero_pattern = nonzero_pattern  # values are only stored in the copy of lhs
+        self._lhs = lhs.duplicate(copy=True)
+        self._ksp = PETSc.KSP().create(lhs.getComm())
+        self._ksp.setType("preonly")
+        self._ksp.getPC().setType("lu")
+        if hasattr(self._ksp.getPC(), "setFactorSolverType"):  # PETSc >= 3.9
+            self._ksp.getPC().setFactorSolverType(linear_solver)
+        else:
+            self._ksp.getPC().setFactorSolverPackage(linear_solver)
+        self._ksp.setOperators(self._lhs)
+
+    def has_same_nonzero_pattern(self, lhs, nonzero_pattern):
+        if Comm.Compare(self._comm, lhs.getComm().tompi4py()) not in (IDENT, CONGRUENT):
+            return False
+        # Local sizes may differ only on some processes, hence their comparison is reduced as well
+        return self._comm.allreduce(
+            self._sizes == lhs.getSizes() and array_equal(self._nonzero_pattern[0], nonzero_pattern[0])
+            and array_equal(self._nonzero_pattern[1], nonzero_pattern[1]), op=LAND)
+
+    def has_same_values(self, lhs):
+        # Matrices are assumed to have the same nonzero pattern
+        return self._lhs.equal(lhs)
+
+    def update(self, lhs, nonzero_pattern):
+        # Only values are copied, so that PETSc reuses the symbolic factorization
+        lhs.copy(self._lhs, structure=PETSc.Mat.Structure.SAME_NONZERO_PATTERN)
+        self._nonzero_pattern = nonzero_pattern
+        self.version += 1
+        self.solves = 0
+
+    def solve(self, rhs, solution):
+        self._ksp.solve(rhs, solution)
+        self.solves += 1
+
+    def destroy(self):
+        self._ksp.destroy()
+        self._lhs.destroy()
+        self.version += 1
+
+
+def _get_factorization(lhs, linear_solver, factorizations, factorizations_size):
+    if linear_solver == "default":
+        linear_solver = get_default_linear_solver()
+    (ai, aj, _) = lhs.getValuesCSR()
+    nonzero_pattern = (ai, aj)
+    same_nonzero_pattern = [
+        factorization for factorization in factorizations
+        if factorization.linear_solver == linear_solver
+        and factorization.has_same_nonzero_pattern(lhs, nonzero_pattern)]
+    same_values = [factorization for factorization in same_nonzero_pattern if factorization.has_same_values(lhs)]
+    if len(same_values) > 0:
+        factorization = same_values[0]
+        factorizations.remove(factorization)
+    elif len(same_nonzero_pattern) > 0 and len(factorizations) >= factorizations_size:
+        # Replace the factorization with the same nonzero pattern which has been used the least, so that
+        # factorizations of matrices which are used for several solves (e.g. inner products) are preserved
+        factorization = min(same_nonzero_pattern, key=lambda factorization: factorization.solves)
+        factorizations.remove(factorization)
+        factorization.update(lhs, nonzero_pattern)
+    else:
+        factorization = _Factorization(lhs, nonzero_pattern, linear_solver)
+        if len(factorizations) >= factorizations_size:
+            factorizations.pop(0).destroy()
+    factorizations.append(factorization)  # the list is sorted from the least to the most recently used
+    return factorization
+
+
+_shared_factorizations_size = 2
@@ -22,6 +22,10 @@ from rbnics.backends.dolfin.wrapping.counterclockwise import counterclockwise
 from rbnics.backends.dolfin.wrapping.create_submesh import (
     convert_functionspace_to_submesh, convert_meshfunctions_to_submesh, create_submesh,
     map_functionspaces_between_mesh_and_submesh)
+from rbnics.backends.dolfin.wrapping.dense_basis_storage import (
+    basis_functions_matrix_dense_local_content, dense_basis_mul_online_vector, dense_basis_storage_enabled,
+    dense_basis_transpose_mul_matrix_mul_dense_basis, dense_basis_transpose_mul_vector,
+    functions_list_dense_local_content)
 from rbnics.backends.dolfin.wrapping.dirichlet_bc import DirichletBC
 from rbnics.backends.dolfin.wrapping.dofs_parallel_io_helpers import (
     build_dof_map_writer_mapping, build_dof_map_reader_mapping)
@@ -96,6 +100,7 @@ __all__ = [
     "assemble_operator_for_restriction",
     "assemble_operator_for_stability_factor",
     "assemble_operator_for_supremizers",
+    "basis_functions_matrix_dense_local_content",
     "basis_functions_matrix_mul_online_matrix",
     "basis_functions_matrix_mul_online_vector",
     "build_dof_map_reader_mapping",
@@ -109,6 +114,10 @@ __all__ = [
     "convert_functionspace_to_submesh",
     "convert_meshfunctions_to_submesh",
     "create_submesh",
+    "dense_basis_mul_online_vector",
+    "dense_basis_storage_enabled",
+    "dense_basis_transpose_mul_matrix_mul_dense_basis",
+    "dense_basis_transpose_mul_vector",
     "DirichletBC",
     "evaluate_and_vectorize_sparse_matrix_at_dofs",
     "evaluate_basis_functions_matrix_at_dofs",
@@ -131,6 +140,7 @@ __all__ = [
     "function_from_ufl_operators",
     "function_load",
     "function_save",
+    "functions_list_dense_local_content",
     "functions_list_mul_online_matrix",
     "functions_list_mul_online_vector",
     "FunctionSpace",
@@ -4,7 +4,11 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import asarray
 from dolfin import Function, FunctionSpace
+from rbnics.backends.dolfin.wrapping.dense_basis_storage import (basis_functions_matrix_dense_local_content,
+                                                                 dense_basis_mul_online_vector,
+                                                                 dense_basis_storage_enabled)
 
 
 def basis_functions_matrix_mul_online_matrix(basis_functions_matrix, online_matrix, BasisFunctionsMatrixType):
@@ -13,6 +17,17 @@ def basis_functions_matrix_mul_online_matrix(basis_functions_matrix, online_matr
 
     output = BasisFunctionsMatrixType(space)
     assert isinstance(online_matrix.M, dict)
+    if dense_basis_storage_enabled() and sum(
+            basis_functions_matrix._component_name_to_basis_component_length.values()) > 0:
+        basis_functions_matrix_content = basis_functions_matrix_dense_local_content(basis_functions_matrix)
+        online_matrix_content = asarray(online_matrix)
+        j = 0
+        for col_component_name in basis_functions_matrix._components_name:
+            for _ in range(online_matrix.M[col_component_name]):
+                output.enrich(dense_basis_mul_online_vector(
+                    Function(space), basis_functions_matrix_content, online_matrix_content[:, j]), copy=False)
+                j += 1
+        return output
     j = 0
     for col_component_name in basis_functions_matrix._components_name:
         for _ in range(online_matrix.M[col_component_name]):
@@ -37,6 +52,9 @@ def basis_functions_matrix_mul_online_vector(basis_functions_matrix, online_vect
     output = Function(space)
     if sum(basis_functions_matrix._component_name_to_basis_component_length.values()) == 0:
         return output
+    elif dense_basis_storage_enabled():
+        return dense_basis_mul_online_vector(
+            output, basis_functions_matrix_dense_local_content(basis_functions_matrix), online_vector)
     else:
         i = 0
         for component_name in basis_functions_matrix._components_name:
@@ -0,0 +1,90 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from mpi4py.MPI import SUM
+from numpy import asarray, dot, empty, vstack
+from petsc4py import PETSc
+from rbnics.backends.dolfin.wrapping.get_mpi_comm import get_mpi_comm
+from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
+from rbnics.utils.config import config
+
+
+def dense_basis_storage_enabled():
+    return config.get("backends", "dense basis storage")
+
+
+# Return the local dofs of all functions in the functions list as rows of a contiguous array. If the functions list
+# is a slice of another functions list, a view of the array of the latter is returned. Otherwise, the array is
+# stored in the functions list and only rows corresponding to functions appended in the meantime are filled in,
+# growing the allocated storage geometrically
+def functions_list_dense_local_content(functions_list):
+    functions = tuple(functions_list)
+    if functions_list._dense_local_content_source is not None:
+        (source_functions_list, start) = functions_list._dense_local_content_source
+        stop = start + len(functions)
+        if (stop <= len(source_functions_list)
+                and all(source_function is function
+                        for (source_function, function) in zip(source_functions_list._list[start:stop], functions))):
+            return functions_list_dense_local_content(source_functions_list)[start:stop]
+    (stored_functions, stored_content) = functions_list._dense_local_content
+    if (len(stored_functions) > len(functions)
+            or any(stored_function is not function
+                   for (stored_function, function) in zip(stored_functions, functions))):
+        stored_functions = ()
+    if len(stored_functions) < len(functions):
+        new_rows = [function.vector().get_local() for function in functions[len(stored_functions):]]
+        if stored_content is None or stored_content.shape[0] < len(functions):
+            new_content = empty((max(len(functions), 2 * len(stored_functions)), new_rows[0].shape[0]),
+                                dtype=new_rows[0].dtype)
+            if len(stored_functions) > 0:
+                new_content[:len(stored_functions)] = stored_content[:len(stored_functions)]
+            stored_content = new_content
+        stored_content[len(stored_functions):len(functions)] = new_rows
+    functions_list._dense_local_content = (functions, stored_content)
+    if stored_content is None:
+        return None
+    else:
+        return stored_content[:len(functions)]
+
+
+def basis_functions_matrix_dense_local_content(basis_functions_matrix):
+    components_content = [
+        functions_list_dense_local_content(basis_functions_matrix._components[component_name])
+        for component_name in basis_functions_matrix._components_name]
+    components_content = [content for content in components_content if content is not None]
+    if len(components_content) == 0:
+        return None
+    elif len(components_content) == 1:
+        return components_content[0]
+    else:
+        return vstack(components_content)
+
+
+# Compute B^T v, where the local content of B is provided as a contiguous array, with a single reduction
+def dense_basis_transpose_mul_vector(basis_content, vector):
+    return get_mpi_comm(vector).allreduce(dot(basis_content, vector.get_local()), op=SUM)
+
+
+# Compute B1^T A B2 with a single matrix-matrix product and a single reduction
+def dense_basis_transpose_mul_matrix_mul_dense_basis(basis_content, matrix, other_basis_content):
+    mat = to_petsc4py(matrix)
+    # PETSc dense matrices are stored by columns: the transpose of the (C-ordered) local content has the
+    # required layout, and it is passed without copies
+    other_basis_mat = PETSc.Mat().createDense(
+        (mat.getSizes()[1], (PETSc.DECIDE, other_basis_content.shape[0])), array=other_basis_content.T,
+        comm=mat.getComm())
+    matrix_times_other_basis_mat = mat.matMult(other_basis_mat)
+    output = dot(basis_content, matrix_times_other_basis_mat.getDenseArray())
+    other_basis_mat.destroy()
+    matrix_times_other_basis_mat.destroy()
+    return get_mpi_comm(matrix).allreduce(output, op=SUM)
+
+
+# Compute B c, where the local content of B is provided as a contiguous array, with a single matrix-vector product
+def dense_basis_mul_online_vector(output, basis_content, online_vector):
+    output.vector().set_local(dot(asarray(online_vector, dtype=basis_content.dtype), basis_content))
+    output.vector().apply("insert")
+    return output
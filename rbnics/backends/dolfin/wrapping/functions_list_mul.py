@@ -4,7 +4,11 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import asarray
 from dolfin import Function, FunctionSpace
+from rbnics.backends.dolfin.wrapping.dense_basis_storage import (dense_basis_mul_online_vector,
+                                                                 dense_basis_storage_enabled,
+                                                                 functions_list_dense_local_content)
 
 
 def functions_list_mul_online_matrix(functions_list, online_matrix, FunctionsListType):
@@ -13,7 +17,15 @@ def functions_list_mul_online_matrix(functions_list, online_matrix, FunctionsLis
 
     output = FunctionsListType(space)
     assert isinstance(online_matrix.M, int)
-    for j in range(online_matrix.M):
+    assert isinstance(online_matrix.N, int)
+    if dense_basis_storage_enabled() and len(functions_list) > 0:
+        functions_list_content = functions_list_dense_local_content(functions_list)
+        online_matrix_content = asarray(online_matrix)
+        for j in range(online_matrix.N):
+            output.enrich(dense_basis_mul_online_vector(
+                Function(space), functions_list_content, online_matrix_content[:, j]), copy=False)
+        return output
+    for j in range(online_matrix.N):
         assert len(online_matrix[:, j]) == len(functions_list)
         output_j = Function(space)
         for (i, fun_i) in enumerate(functions_list):
@@ -30,6 +42,9 @@ def functions_list_mul_online_vector(functions_list, online_vector):
     output = Function(space)
     if len(functions_list) == 0:
         return output
+    elif dense_basis_storage_enabled():
+        return dense_basis_mul_online_vector(output, functions_list_dense_local_content(functions_list),
+                                             online_vector)
     else:
         for (i, fun_i) in enumerate(functions_list):
             output.vector().add_local(fun_i.vector().get_local() * online_vector[i])
@@ -4,8 +4,30 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from mpi4py.MPI import SUM
+from numpy import dot
+from rbnics.backends.abstract import FunctionsList as AbstractFunctionsList
+from rbnics.backends.dolfin.wrapping.dense_basis_storage import (dense_basis_storage_enabled,
+                                                                 functions_list_dense_local_content)
+from rbnics.backends.dolfin.wrapping.get_mpi_comm import get_mpi_comm
+from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
 
-def gram_schmidt_projection_step(new_basis, inner_product, old_basis, transpose):
-    new_basis.vector().add_local(- (transpose(new_basis) * inner_product * old_basis) * old_basis.vector().get_local())
-    new_basis.vector().apply("add")
+
+# Project new_basis onto the orthogonal complement of all old_basis functions at once: the inner products
+# are computed with a single reduction, and the update is fused. The old basis is never copied: either its
+# dense local content (if stored) or the underlying PETSc vectors are used directly
+def gram_schmidt_projection_step(new_basis, inner_product, old_basis):
+    if len(old_basis) == 0:
+        return new_basis
+    inner_product_new_basis = inner_product * new_basis.vector()
+    if dense_basis_storage_enabled() and isinstance(old_basis, AbstractFunctionsList):
+        old_basis_content = functions_list_dense_local_content(old_basis)
+        coefficients = get_mpi_comm(new_basis).allreduce(
+            dot(old_basis_content, inner_product_new_basis.get_local()), op=SUM)
+        new_basis.vector().add_local(- dot(coefficients, old_basis_content))
+        new_basis.vector().apply("add")
+    else:
+        old_basis = [to_petsc4py(b.vector()) for b in old_basis]
+        coefficients = to_petsc4py(inner_product_new_basis).mDot(old_basis)
+        to_petsc4py(new_basis.vector()).maxpy(- coefficients, old_basis)
     return new_basis
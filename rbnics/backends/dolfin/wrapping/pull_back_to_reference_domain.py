@@ -648,6 +648,7 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
         from rbnics.eim.problems import DEIM, EIM, ExactParametrizedFunctions
         from rbnics.scm.problems import ExactStabilityFactor, SCM
         from rbnics.shape_parametrization.problems import AffineShapeParametrization, ShapeParametrization
+        from rbnics.problems.base import ParametrizedProblem
         assert (
             all([Algorithm not in ParametrizedDifferentialProblem_DerivedClass.ProblemDecorators
                  for Algorithm in (DEIM, EIM, ExactParametrizedFunctions, ExactStabilityFactor, SCM)])), (
@@ -894,6 +895,13 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
                 else:
                     return ParametrizedDifferentialProblem_DerivedClass.compute_theta(self, term)
 
+            def compute_theta_batch(self, term, mu_array):
+                if term in self._pulled_back_theta_factors or term in self._stability_factor_terms_blacklist:
+                    # pulled back thetas are evaluated by compute_theta for one parameter at a time
+                    return ParametrizedProblem.compute_theta_batch(self, term, mu_array)
+                else:
+                    return ParametrizedDifferentialProblem_DerivedClass.compute_theta_batch(self, term, mu_array)
+
             def _map_facet_id_to_subdomain_id(self, **kwargs):
                 mesh = self.V.mesh()
                 mpi_comm = mesh.mpi_comm()
@@ -6,14 +6,16 @@
 
 import os
 from numbers import Number
+from numpy import asarray, ndarray, stack
 from numpy import empty as AffineExpansionStorageContent_Base, nditer as AffineExpansionStorageContent_Iterator
 from rbnics.backends.abstract import (AffineExpansionStorage as AbstractAffineExpansionStorage,
                                       BasisFunctionsMatrix as AbstractBasisFunctionsMatrix,
                                       FunctionsList as AbstractFunctionsList)
 from rbnics.backends.online.basic.wrapping import slice_to_array
 from rbnics.utils.cache import Cache
+from rbnics.utils.config import config
 from rbnics.utils.decorators import overload, tuple_of
-from rbnics.utils.io import (ComponentNameToBasisComponentIndexDict, Folders, OnlineSizeDict,
+from rbnics.utils.io import (ArchiveIO, ComponentNameToBasisComponentIndexDict, Folders, OnlineSizeDict,
                              TextIO as ContentItemShapeIO, TextIO as ContentItemTypeIO, TextIO as DictIO,
                              TextIO as ScalarContentIO)
 
@@ -54,6 +56,19 @@ def AffineExpansionStorage(backend, wrapping):
             self._largest_key = (arg1 - 1, arg2 - 1)
 
         def save(self, directory, filename):
+            # Save content to a single archive file, if every item can be stored as an array
+            if self._content.size > 0:
+                it = AffineExpansionStorageContent_Iterator(
+                    self._content, flags=["c_index", "multi_index", "refs_ok"], op_flags=["readonly"])
+                archive_content = self._archive_content(self._content[it.multi_index], it)
+                if archive_content is not None:
+                    archive_content["component_name_to_basis_component_index"] = (
+                        self._component_name_to_basis_component_index)
+                    archive_content["component_name_to_basis_component_length"] = (
+                        self._component_name_to_basis_component_length)
+                    ArchiveIO.save_file(archive_content, directory, filename)
+                    return
+            # Otherwise, save content to a folder, with one file for each item.
             # Get full directory name
             full_directory = Folders.Folder(os.path.join(str(directory), filename))
             full_directory.create()
@@ -70,6 +85,61 @@ def AffineExpansionStorage(backend, wrapping):
             # Save dicts
             self._save_dicts(full_directory)
 
+        @overload(backend.Matrix.Type(), AffineExpansionStorageContent_Iterator)
+        def _archive_content(self, item, it):
+            return {
+                "content_item_type": "matrix",
+                "content_item_shape": (item.M, item.N),
+                "content": self._stack_content(it, lambda item: item)
+            }
+
+        @overload(backend.Vector.Type(), AffineExpansionStorageContent_Iterator)
+        def _archive_content(self, item, it):
+            return {
+                "content_item_type": "vector",
+                "content_item_shape": item.N,
+                "content": self._stack_content(it, lambda item: item)
+            }
+
+        @overload(backend.Function.Type(), AffineExpansionStorageContent_Iterator)
+        def _archive_content(self, item, it):
+            return {
+                "content_item_type": "function",
+                "content_item_shape": item.N,
+                "content": self._stack_content(it, lambda item: item.vector())
+            }
+
+        @overload(Number, AffineExpansionStorageContent_Iterator)
+        def _archive_content(self, item, it):
+            return {
+                "content_item_type": "scalar",
+                "content_item_shape": None,
+                "content": self._stack_content(it, lambda item: item)
+            }
+
+        @overload(AbstractFunctionsList, AffineExpansionStorageContent_Iterator)
+        def _archive_content(self, item, it):
+            return None  # functions lists are stored in their own files
+
+        @overload(AbstractBasisFunctionsMatrix, AffineExpansionStorageContent_Iterator)
+        def _archive_content(self, item, it):
+            return None  # basis functions matrices are stored in their own files
+
+        @overload(None, AffineExpansionStorageContent_Iterator)
+        def _archive_content(self, item, it):
+            return {
+                "content_item_type": "empty",
+                "content_item_shape": None
+            }
+
+        def _stack_content(self, it, to_tensor):
+            items = list()
+            while not it.finished:
+                items.append(asarray(to_tensor(self._content[it.multi_index])))
+                it.iternext()
+            assert all(item.shape == items[0].shape for item in items)
+            return stack(items).reshape(self._content.shape + items[0].shape)
+
         @overload(backend.Matrix.Type(), AffineExpansionStorageContent_Iterator, Folders.Folder)
         def _save_content_item_type_shape(self, item, it, full_directory):
             ContentItemTypeIO.save_file("matrix", full_directory, "content_item_type")
@@ -172,19 +242,43 @@ def AffineExpansionStorage(backend, wrapping):
                             else:
                                 return False
                         it.iternext()
-            # Get full directory name
-            full_directory = Folders.Folder(os.path.join(str(directory), filename))
             # Exit in the trivial case of empty affine expansion
             if self._content.size == 0:
                 return True
-            # Load content item type and shape
-            reference_item = self._load_content_item_type_shape(full_directory)
-            # Initialize iterator
-            it = AffineExpansionStorageContent_Iterator(self._content, flags=["c_index", "multi_index", "refs_ok"])
-            # Load content
-            self._load_content(reference_item, it, full_directory)
-            # Load dicts
-            self._load_dicts(full_directory)
+            if ArchiveIO.exists_file(directory, filename):
+                # Load content from a single archive file, possibly memory-mapping it so that only the parts
+                # which are actually used (e.g. the [:N, :N] slices of reduced operators) are read from disk
+                if config.get("reduced problems", "memory map operators"):
+                    mmap_mode = "c"  # copy-on-write, so that the archive file is never modified
+                else:
+                    mmap_mode = None
+                archive_content = ArchiveIO.load_file(directory, filename, globals={
+                    "ComponentNameToBasisComponentIndexDict": ComponentNameToBasisComponentIndexDict,
+                    "OnlineSizeDict": OnlineSizeDict}, mmap_mode=mmap_mode)
+                # Get content item type and shape
+                reference_item = self._content_item_from_type_shape(
+                    archive_content["content_item_type"], archive_content["content_item_shape"])
+                # Initialize iterator
+                it = AffineExpansionStorageContent_Iterator(
+                    self._content, flags=["c_index", "multi_index", "refs_ok"])
+                # Load content
+                self._load_archive_content(reference_item, it, archive_content.get("content"))
+                # Load dicts
+                self._set_dicts(archive_content["component_name_to_basis_component_index"],
+                                archive_content["component_name_to_basis_component_length"])
+            else:
+                # Load content from a folder, with one file for each item.
+                # Get full directory name
+                full_directory = Folders.Folder(os.path.join(str(directory), filename))
+                # Load content item type and shape
+                reference_item = self._load_content_item_type_shape(full_directory)
+                # Initialize iterator
+                it = AffineExpansionStorageContent_Iterator(
+                    self._content, flags=["c_index", "multi_index", "refs_ok"])
+                # Load content
+                self._load_content(reference_item, it, full_directory)
+                # Load dicts
+                self._load_dicts(full_directory)
             # Reset precomputed slices
             self._precomputed_slices.clear()
             self._prepare_trivial_precomputed_slice(reference_item)
@@ -195,19 +289,21 @@ def AffineExpansionStorage(backend, wrapping):
             assert ContentItemTypeIO.exists_file(full_directory, "content_item_type")
             content_item_type = ContentItemTypeIO.load_file(full_directory, "content_item_type")
             assert ContentItemShapeIO.exists_file(full_directory, "content_item_shape")
+            content_item_shape = ContentItemShapeIO.load_file(
+                full_directory, "content_item_shape", globals={"OnlineSizeDict": OnlineSizeDict})
+            return self._content_item_from_type_shape(content_item_type, content_item_shape)
+
+        def _content_item_from_type_shape(self, content_item_type, content_item_shape):
             assert content_item_type in (
                 "matrix", "vector", "function", "scalar", "functions_list", "basis_functions_matrix", "empty")
             if content_item_type == "matrix":
-                (M, N) = ContentItemShapeIO.load_file(
-                    full_directory, "content_item_shape", globals={"OnlineSizeDict": OnlineSizeDict})
+                (M, N) = content_item_shape
                 return backend.Matrix(M, N)
             elif content_item_type == "vector":
-                N = ContentItemShapeIO.load_file(
-                    full_directory, "content_item_shape", globals={"OnlineSizeDict": OnlineSizeDict})
+                N = content_item_shape
                 return backend.Vector(N)
             elif content_item_type == "function":
-                N = ContentItemShapeIO.load_file(
-                    full_directory, "content_item_shape", globals={"OnlineSizeDict": OnlineSizeDict})
+                N = content_item_shape
                 return backend.Function(N)
             elif content_item_type == "scalar":
                 return 0.
@@ -269,15 +365,51 @@ def AffineExpansionStorage(backend, wrapping):
         def _load_content(self, item, it, full_directory):
             pass
 
+        @overload(backend.Matrix.Type(), AffineExpansionStorageContent_Iterator, ndarray)
+        def _load_archive_content(self, item, it, content):
+            while not it.finished:
+                self._content[it.multi_index] = wrapping.tensor_copy(item)
+                self._content[it.multi_index][:, :] = content[it.multi_index]
+                it.iternext()
+
+        @overload(backend.Vector.Type(), AffineExpansionStorageContent_Iterator, ndarray)
+        def _load_archive_content(self, item, it, content):
+            while not it.finished:
+                self._content[it.multi_index] = wrapping.tensor_copy(item)
+                self._content[it.multi_index][:] = content[it.multi_index]
+                it.iternext()
+
+        @overload(backend.Function.Type(), AffineExpansionStorageContent_Iterator, ndarray)
+        def _load_archive_content(self, item, it, content):
+            while not it.finished:
+                self._content[it.multi_index] = wrapping.function_copy(item)
+                self._content[it.multi_index].vector()[:] = content[it.multi_index]
+                it.iternext()
+
+        @overload(Number, AffineExpansionStorageContent_Iterator, ndarray)
+        def _load_archive_content(self, item, it, content):
+            while not it.finished:
+                self._content[it.multi_index] = content[it.multi_index].item()
+                it.iternext()
+
+        @overload(None, AffineExpansionStorageContent_Iterator, None)
+        def _load_archive_content(self, item, it, content):
+            pass
+
         def _load_dicts(self, full_directory):
             assert DictIO.exists_file(full_directory, "component_name_to_basis_component_index")
-            self._component_name_to_basis_component_index = DictIO.load_file(
+            component_name_to_basis_component_index = DictIO.load_file(
                 full_directory, "component_name_to_basis_component_index",
                 globals={"ComponentNameToBasisComponentIndexDict": ComponentNameToBasisComponentIndexDict})
             assert DictIO.exists_file(full_directory, "component_name_to_basis_component_length")
-            self._component_name_to_basis_component_length = DictIO.load_file(
+            component_name_to_basis_component_length = DictIO.load_file(
                 full_directory, "component_name_to_basis_component_length",
                 globals={"OnlineSizeDict": OnlineSizeDict})
+            self._set_dicts(component_name_to_basis_component_index, component_name_to_basis_component_length)
+
+        def _set_dicts(self, component_name_to_basis_component_index, component_name_to_basis_component_length):
+            self._component_name_to_basis_component_index = component_name_to_basis_component_index
+            self._component_name_to_basis_component_length = component_name_to_basis_component_length
             it = AffineExpansionStorageContent_Iterator(
                 self._content, flags=["multi_index", "refs_ok"], op_flags=["readonly"])
             while not it.finished:
@@ -4,7 +4,10 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numbers import Number
+from numpy import asarray, empty, memmap, ndindex, stack
 from rbnics.backends.online.basic import AffineExpansionStorage as BasicAffineExpansionStorage
+from rbnics.backends.online.basic.wrapping import slice_to_array, slice_to_size
 from rbnics.backends.online.numpy.copy import function_copy, tensor_copy
 from rbnics.backends.online.numpy.function import Function
 from rbnics.backends.online.numpy.matrix import Matrix
@@ -21,4 +24,171 @@ AffineExpansionStorage_Base = BasicAffineExpansionStorage(backend, wrapping)
 @BackendFor("numpy", inputs=((int, tuple_of(Matrix.Type()), tuple_of(Vector.Type())), (int, None)))
 class AffineExpansionStorage(AffineExpansionStorage_Base):
     def __init__(self, arg1, arg2=None):
+        self._dense_content = None  # contiguous storage of the content, lazily built by dense_content()
+        self._dense_content_views = None  # (item, view) pairs of items whose content is a view of _dense_content
         AffineExpansionStorage_Base.__init__(self, arg1, arg2)
+
+    def __setitem__(self, key, item):
+        AffineExpansionStorage_Base.__setitem__(self, key, item)
+        self._dense_content = None
+        self._dense_content_views = None
+
+    def load(self, directory, filename):
+        dense_content = self._dense_content
+        dense_content_views = self._dense_content_views
+        self._dense_content = None  # may be replaced by the memory-mapped content in _load_archive_content
+        self._dense_content_views = None
+        return_value = AffineExpansionStorage_Base.load(self, directory, filename)
+        if not return_value:
+            self._dense_content = dense_content
+            self._dense_content_views = dense_content_views
+        return return_value
+
+    def _load_archive_content(self, item, it, content):
+        if isinstance(content, memmap) and isinstance(item, (Matrix.Type(), Vector.Type())):
+            # Store items as views of the memory-mapped content, rather than as copies, so that
+            # only the parts of the content which are actually used are read from disk
+            while not it.finished:
+                if isinstance(item, Matrix.Type()):
+                    self._content[it.multi_index] = Matrix.Type()(item.M, item.N, content[it.multi_index])
+                else:
+                    self._content[it.multi_index] = Vector.Type()(item.N, content[it.multi_index])
+                it.iternext()
+            self._bind_dense_content(content)
+        else:
+            AffineExpansionStorage_Base._load_archive_content(self, item, it, content)
+
+    def __getitem__(self, key):
+        if isinstance(key, (slice, tuple)) and all([isinstance(key_i, slice) for key_i in _as_tuple(key)]):
+            output = self._dense_getitem(_as_tuple(key))
+            if output is not None:
+                return output
+        return AffineExpansionStorage_Base.__getitem__(self, key)
+
+    def _dense_getitem(self, key):
+        """
+        return the subtensors of size "key" for every element in content as views of the dense content,
+        rather than as copies. The resulting storage is kept in the precomputed slices cache.
+        Returns None if the slice cannot be represented by a view (e.g. for multiple components).
+        """
+        dense_content = self.dense_content()
+        if dense_content is None or self._content.size == 0:
+            return None
+        first_item = self._content[self._smallest_key]
+        if not isinstance(first_item, (Matrix.Type(), Vector.Type())):
+            return None
+        slices = slice_to_array(first_item, key, self._component_name_to_basis_component_length,
+                                self._component_name_to_basis_component_index)
+        if slices in self._precomputed_slices:
+            return self._precomputed_slices[slices]
+        if isinstance(first_item, Vector.Type()):
+            slices_tuple = (slices, )
+        else:
+            slices_tuple = slices
+        assert len(slices_tuple) == len(key)
+        dense_key = list()
+        for slice_ in slices_tuple:
+            if len(slice_) > 0 and tuple(range(slice_[0], slice_[0] + len(slice_))) != slice_:
+                return None  # not contiguous, e.g. in case of multiple components
+            elif len(slice_) > 0:
+                dense_key.append(slice(slice_[0], slice_[0] + len(slice_)))
+            else:
+                dense_key.append(slice(0, 0))
+        dense_key = (Ellipsis, ) + tuple(dense_key)
+        if dense_content[dense_key].shape == dense_content.shape:
+            return self
+        output = AffineExpansionStorage.__new__(type(self), *self._content.shape)
+        output.__init__(*self._content.shape)
+        for index in ndindex(*self._content.shape):
+            item = self._content[index]
+            item_key = key if isinstance(item, Matrix.Type()) else key[0]
+            output_item = _slice_item_as_view(item, item_key, dense_content[index][dense_key[1:]])
+            output[index] = output_item
+        output._bind_dense_content(dense_content[dense_key])
+        self._precomputed_slices[slices] = output
+        return output
+
+    def dense_content(self):
+        """
+        return a contiguous array of shape content.shape + item.shape (e.g. Q x N x N for an affine expansion
+        of Q matrices of size N x N) storing all items, or None if items are not matrices, vectors or scalars.
+        Matrix and vector items are rebound to views of the dense content, so that modifying them in place
+        also modifies the dense content.
+        """
+        if self._dense_content is not None and not self._dense_content_is_bound():
+            # some item has been rebound to a different storage, e.g. because it has been stored in another
+            # affine expansion storage: its values are not tracked by the dense content anymore
+            self._dense_content = None
+            self._dense_content_views = None
+            self._precomputed_slices.clear()
+            self._prepare_trivial_precomputed_slice(self._content[self._largest_key])
+        if self._dense_content is None and self._content is not None:
+            if self._content.size == 0:
+                return None
+            items = list()
+            for index in ndindex(*self._content.shape):
+                item = self._content[index]
+                if not isinstance(item, (Matrix.Type(), Vector.Type(), Number)):
+                    return None
+                items.append(asarray(item))
+            if any(item.shape != items[0].shape for item in items):
+                return None
+            self._bind_dense_content(stack(items).reshape(self._content.shape + items[0].shape))
+        return self._dense_content
+
+    def _bind_dense_content(self, dense_content):
+        self._dense_content = dense_content
+        self._dense_content_views = list()
+        for index in ndindex(*self._content.shape):
+            item = self._content[index]
+            if isinstance(item, (Matrix.Type(), Vector.Type())):
+                item.content = dense_content[index]
+                self._dense_content_views.append((item, item.content))
+
+    def _dense_content_is_bound(self):
+        return all(item.content is view for (item, view) in self._dense_content_views)
+
+    def __array__(self, dtype=None):
+        # Stack all (matrix, vector or scalar) items in a single array, e.g. of shape (Q, M, N) for an
+        # affine expansion of Q matrices of size M x N
+        shape = self._content.shape
+        if self._content.size == 0:
+            return empty(shape, dtype)
+        dense_content = self.dense_content()
+        if dense_content is not None:
+            return asarray(dense_content, dtype)
+        items = list()
+        for index in ndindex(*shape):
+            item = self._content[index]
+            if isinstance(item, Function.Type()):
+                item = item.vector()
+            items.append(asarray(item, dtype))
+        return stack(items).reshape(shape + items[0].shape)
+
+
+def _as_tuple(key):
+    if isinstance(key, tuple):
+        return key
+    else:
+        return (key, )
+
+
+def _slice_item_as_view(item, key, content):
+    if isinstance(item, Matrix.Type()):
+        size = slice_to_size(item, key, item._component_name_to_basis_component_length)
+        output = Matrix.Type()(size[0], size[1], content)
+        output._component_name_to_basis_component_index = item._component_name_to_basis_component_index
+        if (item._component_name_to_basis_component_length[0] is None
+                and item._component_name_to_basis_component_length[1] is None):
+            output._component_name_to_basis_component_length = (None, None)
+        else:
+            output._component_name_to_basis_component_length = tuple(size)
+    else:
+        size = slice_to_size(item, key, item._component_name_to_basis_component_length)
+        output = Vector.Type()(size[0], content)
+        output._component_name_to_basis_component_index = item._component_name_to_basis_component_index
+        if item._component_name_to_basis_component_length is None:
+            output._component_name_to_basis_component_length = None
+        else:
+            output._component_name_to_basis_component_length = size[0]
+    return output
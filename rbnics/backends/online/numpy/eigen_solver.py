@@ -4,8 +4,9 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from numpy import real, imag
+from numpy import asarray, real, imag
 from scipy.linalg import eig, eigh
+from scipy.sparse.linalg import eigsh
 from rbnics.backends.abstract import FunctionsList as AbstractFunctionsList
 from rbnics.backends.abstract import EigenSolver as AbstractEigenSolver
 from rbnics.backends.online.numpy.function import Function
@@ -28,19 +29,42 @@ class EigenSolver(AbstractEigenSolver):
         self.parameters = dict()
         self.eigs = None
         self.eigv = None
+        self.initial_space = None
         assert bcs is None  # the case bcs != None has not been implemented yet
 
     def set_parameters(self, parameters):
         self.parameters.update(parameters)
 
+    def set_initial_space(self, initial_space):
+        # LAPACK does not use an initial guess, which is only provided to ARPACK
+        self.initial_space = initial_space
+
     def solve(self, n_eigs=None):
         assert "problem_type" in self.parameters
+        assert "spectrum" in self.parameters
+        if n_eigs is not None and n_eigs >= self.A.N:
+            n_eigs = None
         if self.parameters["problem_type"] in ("hermitian", "gen_hermitian"):
-            eigs, eigv = eigh(self.A, self.B)
+            if n_eigs is None:
+                eigs, eigv = eigh(self.A, self.B)
+            elif (self.parameters["spectrum"] == "largest real" and self.A.N >= _iterative_eigensolver_threshold
+                    and n_eigs <= self.A.N // _iterative_eigensolver_ratio):
+                # Only few of the largest eigenvalues are required: use ARPACK
+                if self.initial_space is not None and len(self.initial_space) > 0:
+                    v0 = asarray(self.initial_space[0].vector())
+                else:
+                    v0 = None
+                eigs, eigv = eigsh(asarray(self.A), n_eigs, None if self.B is None else asarray(self.B), which="LA",
+                                   v0=v0)
+            elif self.parameters["spectrum"] == "largest real":
+                eigs, eigv = eigh(self.A, self.B, subset_by_index=[self.A.N - n_eigs, self.A.N - 1])
+            elif self.parameters["spectrum"] == "smallest real":
+                eigs, eigv = eigh(self.A, self.B, subset_by_index=[0, n_eigs - 1])
+            else:
+                eigs, eigv = eigh(self.A, self.B)
         else:
             eigs, eigv = eig(self.A, self.B)
 
-        assert "spectrum" in self.parameters
         if self.parameters["spectrum"] == "largest real":
             idx = eigs.argsort()  # sort by increasing value
             idx = idx[::-1]  # reverse the order
@@ -65,3 +89,9 @@ class EigenSolver(AbstractEigenSolver):
         eigv_i_real_fun = Function(eigv_i_real)
         eigv_i_imag_fun = Function(eigv_i_imag)
         return (eigv_i_real_fun, eigv_i_imag_fun)
+
+
+# Matrices of at least this size are solved with ARPACK when only a small fraction of the largest
+# eigenvalues is required, rather than with LAPACK
+_iterative_eigensolver_threshold = 1000
+_iterative_eigensolver_ratio = 10
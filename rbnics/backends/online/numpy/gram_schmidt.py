@@ -9,11 +9,11 @@ from rbnics.backends.basic import GramSchmidt as BasicGramSchmidt
 from rbnics.backends.online.numpy.function import Function
 from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.transpose import transpose
-from rbnics.backends.online.numpy.wrapping import gram_schmidt_projection_step
+from rbnics.backends.online.numpy.wrapping import function_extend_or_restrict, gram_schmidt_projection_step
 from rbnics.utils.decorators import BackendFor, ModuleWrapper
 
 backend = ModuleWrapper(Function, transpose)
-wrapping = ModuleWrapper(gram_schmidt_projection_step)
+wrapping = ModuleWrapper(function_extend_or_restrict, gram_schmidt_projection_step)
 GramSchmidt_Base = BasicGramSchmidt(backend, wrapping)
 
 
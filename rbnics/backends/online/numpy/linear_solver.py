@@ -4,7 +4,9 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from numpy.linalg import solve
+from numpy import array_equal, asarray, diag
+from numpy.linalg import LinAlgError, solve
+from scipy.linalg import cho_factor, cho_solve, lu_factor, lu_solve
 from rbnics.backends.abstract import LinearProblemWrapper
 from rbnics.backends.online.basic import LinearSolver as BasicLinearSolver
 from rbnics.backends.online.numpy.function import Function
@@ -23,11 +25,57 @@ LinearSolver_Base = BasicLinearSolver(backend, wrapping)
                              (Vector.Type(), DelayedTransposeWithArithmetic, None),
                              ThetaType + DictOfThetaType + (None,)))
 class LinearSolver(LinearSolver_Base):
+    _reuse_factorization = False
+
     def set_parameters(self, parameters):
-        assert len(parameters) == 0, "NumPy linear solver does not accept parameters yet"
+        assert all(key == "reuse_factorization" for key in parameters), (
+            "NumPy linear solver only accepts the reuse_factorization parameter")
+        self._reuse_factorization = parameters.get("reuse_factorization", False)
 
     def solve(self):
-        solution = solve(self.lhs, self.rhs)
+        if self._reuse_factorization:
+            solution = _factorize(asarray(self.lhs))(asarray(self.rhs))
+        else:
+            solution = solve(self.lhs, self.rhs)
         self.solution.vector()[:] = solution
         if self.monitor is not None:
             self.monitor(self.solution)
+
+
+# Factorizations of the most recent left-hand sides are cached, so that an operator which is assembled again
+# with the same content (e.g. at every time step of a linear problem with time independent operators, or in
+# every projection on the reduced space) is factorized only once. Since operators are assembled from scratch
+# at every solve, the cache is indexed by the content of the left-hand side rather than by its identity.
+# This is only carried out by solvers which have been asked to reuse factorizations, since in all other cases
+# (e.g. a new parameter, or a Newton iteration) the left-hand side is expected to change at every solve
+def _factorize(lhs):
+    for (index, (cached_lhs, cached_solve)) in enumerate(_factorizations):
+        if cached_lhs.shape == lhs.shape and array_equal(cached_lhs, lhs):
+            # Move to the end of the list, which is sorted from the least to the most recently used
+            _factorizations.append(_factorizations.pop(index))
+            return cached_solve
+    # Prefer a Cholesky factorization for symmetric operators, falling back to LU if it fails
+    cached_solve = None
+    if array_equal(lhs, lhs.T):
+        try:
+            factorization = cho_factor(lhs)
+        except LinAlgError:
+            pass
+        else:
+            def cached_solve(rhs):
+                return cho_solve(factorization, rhs)
+    if cached_solve is None:
+        factorization = lu_factor(lhs)
+        if (diag(factorization[0]) == 0.).any():  # lu_factor only warns in case of singular matrices
+            raise LinAlgError("Singular matrix")
+
+        def cached_solve(rhs):
+            return lu_solve(factorization, rhs)
+    if len(_factorizations) >= _factorizations_cache_size:
+        _factorizations.pop(0)
+    _factorizations.append((lhs.copy(), cached_solve))
+    return cached_solve
+
+
+_factorizations_cache_size = 4
+_factorizations = list()
@@ -4,6 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numbers import Number
+from numpy import asarray, tensordot
 from rbnics.backends.online.basic import product as basic_product
 from rbnics.backends.online.numpy.affine_expansion_storage import AffineExpansionStorage
 from rbnics.backends.online.numpy.function import Function
@@ -22,4 +24,35 @@ wrapping = ModuleWrapper(DelayedTransposeWithArithmetic=DelayedTransposeWithArit
 # even though this one actually carries out both the sum and the product!
 @backend_for("numpy", inputs=(ThetaType, (AffineExpansionStorage, NonAffineExpansionStorage), ThetaType + (None,)))
 def product(thetas, operators, thetas2=None):
+    if isinstance(operators, AffineExpansionStorage):
+        dense_operators = operators.dense_content()
+        if dense_operators is not None:
+            return ProductOutput(_dense_product(thetas, operators, dense_operators, thetas2))
     return product_base(thetas, operators, thetas2)
+
+
+# Carry out the sum of the product as a single tensor contraction on the contiguous storage of the operators
+def _dense_product(thetas, operators, dense_operators, thetas2):
+    order = operators.order()
+    assert order in (1, 2)
+    if order == 1:
+        assert thetas2 is None
+        assert len(thetas) == len(operators)
+        first_operator = operators[0]
+        output_content = tensordot(asarray(thetas), dense_operators, axes=1)
+    elif order == 2:
+        assert thetas2 is not None
+        first_operator = operators[0, 0]
+        output_content = tensordot(asarray(thetas2), tensordot(asarray(thetas), dense_operators, axes=1), axes=(0, 0))
+    else:
+        raise ValueError("product(): invalid operands.")
+    if isinstance(first_operator, Matrix.Type()):
+        output = Matrix.Type()(first_operator.M, first_operator.N, output_content)
+        first_operator._arithmetic_operations_preserve_attributes(output, other_order=0)
+    elif isinstance(first_operator, Vector.Type()):
+        output = Vector.Type()(first_operator.N, output_content)
+        first_operator._arithmetic_operations_preserve_attributes(output, other_order=0)
+    else:
+        assert isinstance(first_operator, Number)
+        output = output_content.item()
+    return output
@@ -110,6 +110,8 @@ class _ScipyImplicitEuler(object):
                     rhs = - self.residual_eval(t, self.zero, self.minus_solution_previous_over_dt)
                     bcs_t = self.bc_eval(t)
                     LinearSolver.__init__(self_, lhs, self.solution, rhs, bcs_t)
+                    # The left-hand side is often the same at every time step: reuse its factorization
+                    LinearSolver.set_parameters(self_, {"reuse_factorization": True})
 
             self.solver_generator = _LinearSolver
         elif problem_type == "nonlinear":
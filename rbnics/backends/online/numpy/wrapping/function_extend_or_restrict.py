@@ -0,0 +1,21 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+
+def function_extend_or_restrict(function, function_components, V, V_components, weight, copy):
+    # Online functions are not split into components, so that they can only be copied and/or weighted
+    assert function_components is None
+    assert V_components is None
+    if weight is None and not copy:
+        return function
+    original_vector = function.vector()
+    v = type(original_vector)(original_vector.N, original_vector.content.copy())
+    if weight is not None:
+        v *= weight
+    # Preserve auxiliary attributes related to basis functions matrix
+    v._component_name_to_basis_component_index = original_vector._component_name_to_basis_component_index
+    v._component_name_to_basis_component_length = original_vector._component_name_to_basis_component_length
+    return type(function)(v)
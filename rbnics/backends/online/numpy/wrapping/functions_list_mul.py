@@ -4,10 +4,29 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import asarray, dot
+
 
 def functions_list_mul_online_matrix(functions_list, online_matrix, FunctionsListType):
-    raise RuntimeError("TODO")  # TODO
+    output = FunctionsListType(functions_list.space)
+    if len(functions_list) == 0:
+        return output
+    # Compute all output functions with a single matrix-matrix product
+    output_content = dot(_functions_list_content(functions_list), asarray(online_matrix))
+    for j in range(output_content.shape[1]):
+        output.enrich(_function_like(functions_list[0], output_content[:, j].copy()), copy=False)
+    return output
 
 
 def functions_list_mul_online_vector(functions_list, online_vector):
-    raise RuntimeError("TODO")  # TODO
+    assert len(functions_list) > 0
+    return _function_like(functions_list[0], dot(_functions_list_content(functions_list), asarray(online_vector)))
+
+
+def _functions_list_content(functions_list):
+    return asarray([asarray(function.vector()) for function in functions_list]).T
+
+
+def _function_like(function, content):
+    vector = function.vector()
+    return type(function)(type(vector)(vector.N, content))
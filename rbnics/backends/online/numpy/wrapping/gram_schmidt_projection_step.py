@@ -4,7 +4,15 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import array, asarray, dot
 
-def gram_schmidt_projection_step(new_basis, inner_product, old_basis, transpose):
-    new_basis.vector()[:] -= (transpose(new_basis) * inner_product * old_basis) * old_basis.vector()
+
+# Project new_basis onto the orthogonal complement of all old_basis functions at once
+def gram_schmidt_projection_step(new_basis, inner_product, old_basis):
+    old_basis = [asarray(b.vector()) for b in old_basis]
+    if len(old_basis) == 0:
+        return new_basis
+    old_basis = array(old_basis)
+    coefficients = dot(old_basis, dot(asarray(inner_product), asarray(new_basis.vector())))
+    new_basis.vector()[:] -= dot(coefficients, old_basis)
     return new_basis
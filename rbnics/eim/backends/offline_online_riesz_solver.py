@@ -48,9 +48,13 @@ def OfflineOnlineRieszSolver(problem_name):
                 args = (problem._riesz_solve_inner_product, problem._riesz_solve_storage, rhs,
                         problem._riesz_solve_homogeneous_dirichlet_bc)
                 if not self.delay:
-                    solver = LinearSolver(*args)
-                    solver.set_parameters(problem._linear_solver_parameters)
-                    solver.solve()
+                    # Reuse the factorization of the inner product stored in the problem, as in RieszSolver
+                    if problem._riesz_solve_linear_solver is None:
+                        problem._riesz_solve_linear_solver = LinearSolver(*args)
+                        problem._riesz_solve_linear_solver.set_parameters(problem._linear_solver_parameters)
+                    else:
+                        problem._riesz_solve_linear_solver.set_rhs(rhs)
+                    problem._riesz_solve_linear_solver.solve()
                     return problem._riesz_solve_storage
                 else:
                     solver = DelayedLinearSolver(*args)
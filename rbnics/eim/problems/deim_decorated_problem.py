@@ -12,6 +12,7 @@ from rbnics.eim.problems.eim_approximation import EIMApproximation as DEIMApprox
 from rbnics.eim.problems.time_dependent_eim_approximation import (
     TimeDependentEIMApproximation as TimeDependentDEIMApproximation)
 from rbnics.eim.utils.decorators import DefineSymbolicParameters
+from rbnics.problems.base import ParametrizedProblem
 from rbnics.utils.decorators import overload, PreserveClassName, ProblemDecoratorFor, tuple_of
 from rbnics.utils.test import PatchInstanceMethod
 
@@ -195,6 +196,14 @@ def DEIMDecoratedProblem(
                     deim_forms.append(non_deim_form)
                 return tuple(deim_forms)
 
+            def compute_theta_batch(self, term, mu_array):
+                if term in self.DEIM_approximations:
+                    # compute_theta may have been replaced by its DEIM approximation, which is evaluated
+                    # for one parameter at a time
+                    return ParametrizedProblem.compute_theta_batch(self, term, mu_array)
+                else:
+                    return ParametrizedDifferentialProblem_DerivedClass.compute_theta_batch(self, term, mu_array)
+
             def _compute_theta_DEIM(self, term):
                 original_thetas = ParametrizedDifferentialProblem_DerivedClass.compute_theta(self, term)
                 deim_thetas = list()
@@ -13,6 +13,7 @@ from rbnics.eim.problems.eim_approximation import EIMApproximation
 from rbnics.eim.problems.time_dependent_eim_approximation import TimeDependentEIMApproximation
 from rbnics.eim.utils.decorators import DefineSymbolicParameters
 from rbnics.eim.utils.io import AffineExpansionSeparatedFormsStorage
+from rbnics.problems.base import ParametrizedProblem
 from rbnics.utils.decorators import overload, PreserveClassName, ProblemDecoratorFor, tuple_of
 from rbnics.utils.test import PatchInstanceMethod
 
@@ -210,6 +211,14 @@ def EIMDecoratedProblem(
                         eim_forms.append(unchanged_form)
                 return tuple(eim_forms)
 
+            def compute_theta_batch(self, term, mu_array):
+                if term in self.separated_forms:
+                    # compute_theta may have been replaced by its EIM approximation, which is evaluated
+                    # for one parameter at a time
+                    return ParametrizedProblem.compute_theta_batch(self, term, mu_array)
+                else:
+                    return ParametrizedDifferentialProblem_DerivedClass.compute_theta_batch(self, term, mu_array)
+
             def _compute_theta_EIM(self, term):
                 original_thetas = ParametrizedDifferentialProblem_DerivedClass.compute_theta(self, term)
                 eim_thetas = list()
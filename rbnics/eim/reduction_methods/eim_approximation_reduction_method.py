@@ -6,7 +6,7 @@
 
 import os
 from rbnics.reduction_methods.base import ReductionMethod
-from rbnics.backends import abs, evaluate, max
+from rbnics.backends import abs, axpy, copy, evaluate, max
 from rbnics.utils.decorators import snapshot_links_to_cache
 from rbnics.utils.io import (ErrorAnalysisTable, Folders, GreedySelectedParametersList, GreedyErrorEstimatorsList,
                              SpeedupAnalysisTable, TextBox, TextLine, Timer)
@@ -18,6 +18,7 @@ class EIMApproximationReductionMethod(ReductionMethod):
 
     # Default initialization of members
     def __init__(self, EIM_approximation):
+        from rbnics.utils.config import config  # cannot import at global scope
         # Call the parent initialization
         ReductionMethod.__init__(self, EIM_approximation.folder_prefix)
 
@@ -27,6 +28,18 @@ class EIMApproximationReductionMethod(ReductionMethod):
         # Declare a new container to store the snapshots
         self.snapshots_container = self.EIM_approximation.parametrized_expression.create_snapshots_container()
         self._training_set_parameters_to_snapshots_container_index = dict()
+        # Snapshots may also be read back from the disk cache of the EIM approximation when needed, rather than
+        # being stored in the snapshots container. The RAM cache limits of EIM then bound the required memory.
+        self._out_of_core_snapshots = config.get("EIM", "out of core snapshots")
+        assert not self._out_of_core_snapshots or "disk" in config.get("EIM", "cache"), (
+            "Out of core snapshots require the disk cache of EIM to be enabled")
+        # The interpolation error of each snapshot may also be stored and updated incrementally during the greedy,
+        # rather than being computed from scratch for each snapshot at every iteration. This is faster, but
+        # requires to keep a copy of each snapshot in addition to the snapshots container, thus doubling the memory
+        # required by the greedy.
+        self._incremental_interpolation_errors = config.get("EIM", "incremental interpolation errors")
+        self._interpolation_errors = list()
+        self._interpolation_errors_N = 0
         # I/O
         self.folder["snapshots"] = os.path.join(self.folder_prefix, "snapshots")
         self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
@@ -181,13 +194,17 @@ class EIMApproximationReductionMethod(ReductionMethod):
     # Finalize data structures required after the offline phase
     def _finalize_offline(self):
         self.EIM_approximation.init("online")
+        # Release the interpolation errors of training snapshots, which are only needed by the greedy
+        self._interpolation_errors = list()
+        self._interpolation_errors_N = 0
 
     def _print_greedy_interpolation_solve_message(self):
         print("solve interpolation for mu =", self.EIM_approximation.mu)
 
     # Update the snapshots container
     def add_to_snapshots(self, snapshot):
-        self.snapshots_container.enrich(snapshot)
+        if not self._out_of_core_snapshots:
+            self.snapshots_container.enrich(snapshot)
 
     # Update basis (greedy version)
     def update_basis_greedy(self, error, maximum_error):
@@ -203,7 +220,13 @@ class EIMApproximationReductionMethod(ReductionMethod):
     # Update basis (POD version)
     def compute_basis_POD(self):
         POD = self.EIM_approximation.parametrized_expression.create_POD_container()
-        POD.store_snapshot(self.snapshots_container)
+        if self._out_of_core_snapshots:
+            for mu in self.training_set:
+                self.EIM_approximation.set_mu(mu)
+                self.EIM_approximation.evaluate_parametrized_expression()  # read back from the disk cache
+                POD.store_snapshot(self.EIM_approximation.snapshot)
+        else:
+            POD.store_snapshot(self.snapshots_container)
         (_, _, basis_functions, N) = POD.apply(self.Nmax, self.tol)
         self.EIM_approximation.basis_functions.enrich(basis_functions)
         self.EIM_approximation.basis_functions.save(self.EIM_approximation.folder["basis"], "basis")
@@ -228,11 +251,40 @@ class EIMApproximationReductionMethod(ReductionMethod):
 
     # Load the precomputed snapshot
     def load_snapshot(self):
+        mu_index = self._snapshot_index()
+        if self._out_of_core_snapshots:
+            self.EIM_approximation.evaluate_parametrized_expression()  # read back from the disk cache
+            return self.EIM_approximation.snapshot
+        else:
+            return self.snapshots_container[mu_index]
+
+    # Get the index of the precomputed snapshot in the snapshots container
+    def _snapshot_index(self):
         assert self.EIM_approximation.basis_generation == "Greedy"
         mu = self.EIM_approximation.mu
         mu_index = self._training_set_parameters_to_snapshots_container_index[mu]
         assert mu == self.training_set[mu_index]
-        return self.snapshots_container[mu_index]
+        return mu_index
+
+    # Update the interpolation error of each snapshot after the basis has been enriched. Since each basis function
+    # vanishes at the previously selected interpolation locations, the interpolation error is updated by a rank one
+    # correction, rather than by solving the interpolation problem for each snapshot
+    def _update_interpolation_errors(self):
+        N = self.EIM_approximation.N
+        if (N == 0 or N < self._interpolation_errors_N
+                or len(self._interpolation_errors) != len(self.snapshots_container)):
+            self._interpolation_errors = [
+                copy(self.snapshots_container[index]) for index in range(len(self.snapshots_container))]
+            self._interpolation_errors_N = 0
+        interpolation_locations = self.EIM_approximation.interpolation_locations
+        for n in range(self._interpolation_errors_N, N):
+            basis_function = self.EIM_approximation.basis_functions[n]
+            basis_function_at_location = evaluate(basis_function, interpolation_locations, index=n)
+            if basis_function_at_location != 0.:
+                for error in self._interpolation_errors:
+                    error_at_location = evaluate(error, interpolation_locations, index=n)
+                    axpy(error, - error_at_location / basis_function_at_location, basis_function)
+        self._interpolation_errors_N = N
 
     # Choose the next parameter in the offline stage in a greedy fashion
     def greedy(self):
@@ -252,19 +304,29 @@ class EIMApproximationReductionMethod(ReductionMethod):
                   abs(maximum_error_on_interpolation_locations))  # for consistency check, should be zero
 
         # Carry out the actual greedy search
-        def solve_and_computer_error(mu):
-            self.EIM_approximation.set_mu(mu)
+        if self._out_of_core_snapshots or not self._incremental_interpolation_errors:
+            # Solve the interpolation problem for each snapshot
+            def compute_error(mu):
+                self.EIM_approximation.set_mu(mu)
 
-            self.EIM_approximation.solve()
-            self.EIM_approximation.snapshot = self.load_snapshot()
-            (_, maximum_error, _) = self.EIM_approximation.compute_maximum_interpolation_error()
-            return abs(maximum_error)
+                self.EIM_approximation.solve()
+                self.EIM_approximation.snapshot = self.load_snapshot()
+                (_, maximum_error, _) = self.EIM_approximation.compute_maximum_interpolation_error()
+                return abs(maximum_error)
+        else:
+            self._update_interpolation_errors()
+
+            def compute_error(mu):
+                self.EIM_approximation.set_mu(mu)
+
+                (maximum_error, _) = max(abs(self._interpolation_errors[self._snapshot_index()]))
+                return abs(maximum_error)
 
         if self.EIM_approximation.N == 0:
             print("find initial mu")
         else:
             print("find next mu")
-        (error_max, error_argmax) = self.training_set.max(solve_and_computer_error)
+        (error_max, error_argmax) = self.training_set.max(compute_error)
         self.EIM_approximation.set_mu(self.training_set[error_argmax])
         self.greedy_selected_parameters.append(self.training_set[error_argmax])
         self.greedy_selected_parameters.save(self.folder["post_processing"], "mu_greedy")
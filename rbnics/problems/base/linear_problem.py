@@ -22,6 +22,16 @@ def LinearProblem(ParametrizedDifferentialProblem_DerivedClass):
             # Nonlinear solver parameters
             self._linear_solver_parameters = dict()
 
+        def _share_linear_solver_factorizations(self):
+            # Factorizations computed by a truth solve may be reused by the next ones (e.g. for the same operator
+            # at a different parameter), until _release_linear_solver_factorizations is called
+            if "factorizations" not in self._linear_solver_parameters:
+                self._linear_solver_parameters["factorizations"] = list()
+
+        def _release_linear_solver_factorizations(self):
+            for factorization in self._linear_solver_parameters.pop("factorizations", list()):
+                factorization.destroy()
+
         class ProblemSolver(ParametrizedDifferentialProblem_DerivedClass.ProblemSolver, LinearProblemWrapper):
             def solve(self):
                 problem = self.problem
@@ -4,7 +4,8 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from rbnics.backends import NonlinearProblemWrapper, NonlinearSolver
+from rbnics.backends import assign, NonlinearProblemWrapper, NonlinearSolver
+from rbnics.sampling import ParameterSpaceSubset
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators
 
 
@@ -21,13 +22,58 @@ def NonlinearProblem(ParametrizedDifferentialProblem_DerivedClass):
 
             # Nonlinear solver parameters
             self._nonlinear_solver_parameters = dict()
+            # Initial guess of the nonlinear solver (see set_initial_guess)
+            self._initial_guess = None
+            # Parameters for which the problem has been solved with the "closest" initial guess
+            self._solved_parameters = ParameterSpaceSubset()
+
+        def set_initial_guess(self, initial_guess):
+            """
+            Set the initial guess of the nonlinear solver.
+
+            :param initial_guess: None to start from the current content of the solution, i.e. the solution
+                of the previous solve (default), "closest" to start from the cached solution of the closest
+                parameter for which the problem has been already solved, or a function without arguments which
+                returns the initial guess for the current parameter (or None to start from the current content
+                of the solution).
+            """
+            assert initial_guess is None or initial_guess == "closest" or callable(initial_guess)
+            self._initial_guess = initial_guess
+            # Parameters solved with a previous initial guess policy are not retained
+            self._solved_parameters = ParameterSpaceSubset()
+
+        def _compute_initial_guess(self, **kwargs):
+            if self._initial_guess is None:
+                return None
+            elif self._initial_guess == "closest":
+                return self._closest_cached_solution(**kwargs)
+            else:
+                return self._initial_guess()
+
+        def _closest_cached_solution(self, **kwargs):
+            if len(self._solved_parameters) == 0:
+                return None
+            (closest_mu, ) = self._solved_parameters.closest(1, self.mu)
+            mu = self.mu
+            self.set_mu(closest_mu)
+            try:
+                closest_solution = self._solution_cache[closest_mu, kwargs]
+            except KeyError:
+                closest_solution = None
+            self.set_mu(mu)
+            return closest_solution
 
         class ProblemSolver(ParametrizedDifferentialProblem_DerivedClass.ProblemSolver, NonlinearProblemWrapper):
             def solve(self):
                 problem = self.problem
+                initial_guess = problem._compute_initial_guess(**self.kwargs)
+                if initial_guess is not None:
+                    assign(problem._solution, initial_guess)
                 solver = NonlinearSolver(self, problem._solution)
                 solver.set_parameters(problem._nonlinear_solver_parameters)
                 solver.solve()
+                if problem._initial_guess == "closest":
+                    problem._solved_parameters.append(problem.mu)
 
     # return value (a class) for the decorator
     return NonlinearProblem_Class
@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import array, empty
 from rbnics.utils.io import Folders
 
 
@@ -47,3 +48,26 @@ class ParametrizedProblem(object):
         """
         assert len(mu) == len(self.mu_range), "mu and mu_range must have the same length"
         self.mu = mu
+
+    def compute_theta_batch(self, term, mu_array):
+        """
+        Return theta multiplicative terms of the affine expansion of the problem for several parameters.
+        Problems whose thetas can be evaluated on arrays of parameters may override this method, e.g.
+           if term == "a":
+               return stack((mu_array[:, 0], mu_array[:, 1], mu_array[:, 0] * mu_array[:, 1]), axis=1)
+        while the default implementation calls compute_theta() for one parameter at a time.
+
+        :param term: the forms of the class of the problem.
+        :param mu_array: list of parameters, or array of shape (n_mu, len(self.mu)).
+        :return: computed thetas, stacked in an array of shape (n_mu, Q).
+        """
+        mu = self.mu
+        thetas = list()
+        for mu_i in mu_array:
+            self.set_mu(tuple(mu_i))
+            thetas.append(self.compute_theta(term))
+        self.set_mu(mu)
+        if len(thetas) > 0:
+            return array(thetas, dtype=float)
+        else:
+            return empty((0, len(self.compute_theta(term))))
@@ -7,10 +7,11 @@
 from abc import ABCMeta, abstractmethod
 import os
 from math import sqrt
-from numpy import isclose
+from numpy import array, asarray, empty, isclose, stack
 from rbnics.problems.base.parametrized_problem import ParametrizedProblem
 from rbnics.backends import assign, BasisFunctionsMatrix, copy, product, sum, transpose
-from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver
+from rbnics.backends.online import (OnlineAffineExpansionStorage, OnlineFunction, OnlineLinearSolver, OnlineMatrix,
+                                    OnlineVector)
 from rbnics.utils.cache import Cache
 from rbnics.utils.decorators import StoreMapFromProblemToReducedProblem, sync_setters
 from rbnics.utils.io import OnlineSizeDict
@@ -94,6 +95,9 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         self.truth_problem = truth_problem
         # Basis functions matrix: BasisFunctionsMatrix
         self.basis_functions = None
+        # Projected operators: from (term, q) to the basis functions, the truth operator and the reduced
+        # operator of the latest projection, used to update reduced operators when the basis is enriched
+        self._projected_operators = dict()
         # I/O
         self.folder["basis"] = os.path.join(self.folder_prefix, "basis")
         self.folder["reduced_operators"] = os.path.join(self.folder_prefix, "reduced_operators")
@@ -398,7 +402,10 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
             solver = OnlineLinearSolver(inner_product_N, projected_snapshot_N,
                                         transpose(basis_functions) * inner_product * snapshot,
                                         self._combined_and_homogenized_dirichlet_bc)
-        solver.set_parameters(self._linear_solver_parameters)
+        # The projection inner product does not depend on the parameter: reuse its factorization
+        linear_solver_parameters = dict(self._linear_solver_parameters)
+        linear_solver_parameters["reuse_factorization"] = True
+        solver.set_parameters(linear_solver_parameters)
         solver.solve()
         return projected_snapshot_N
 
@@ -426,6 +433,81 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         """
         self._output = NotImplemented
 
+    def solve_batch(self, mus, N=None, **kwargs):
+        """
+        Perform an online solve for all parameters in mus. self.N will be used as matrix dimension if the default
+        value is provided for N. Problems that can solve for several parameters at once (e.g. by stacking the
+        assembled reduced operators) do so, otherwise online solves are carried out one parameter at a time.
+
+        :param mus: list of parameters.
+        :param N : Dimension of the reduced problem
+        :type N : integer
+        :return: coefficients of the reduced solutions, stacked in an array of shape (len(mus), N)
+        """
+        (online_size, online_kwargs) = self._online_size_from_kwargs(N, **kwargs)
+        online_size += self.N_bc
+        solutions = self._solve_batch(mus, online_size, **online_kwargs)
+        if solutions is NotImplemented:
+            mu = self.mu
+            solutions = list()
+            for mu_i in mus:
+                self.set_mu(mu_i)
+                solutions.append(asarray(self.solve(N, **kwargs).vector()))
+            self.set_mu(mu)
+            if len(solutions) > 0:
+                solutions = stack(solutions)
+            else:
+                if isinstance(online_size, dict):
+                    online_size = sum(list(online_size.values()))  # sum from backends only accepts lists
+                solutions = empty((0, online_size))
+        return solutions
+
+    def _solve_batch(self, mus, N, **kwargs):
+        """
+        Perform an online solve for all parameters in mus at once. Internal method.
+
+        :return: coefficients of the reduced solutions, or NotImplemented if the problem does not
+            support solving for several parameters at once.
+        """
+        return NotImplemented
+
+    def compute_output_batch(self, mus, N=None, **kwargs):
+        """
+        Perform an online evaluation of the output for all parameters in mus.
+
+        :param mus: list of parameters.
+        :param N : Dimension of the reduced problem
+        :type N : integer
+        :return: reduced outputs, stacked in an array of length len(mus)
+        """
+        (online_size, online_kwargs) = self._online_size_from_kwargs(N, **kwargs)
+        online_size += self.N_bc
+        try:
+            outputs = self._compute_output_batch(mus, online_size, **online_kwargs)
+        except ValueError:  # raised by compute_theta if output computation is optional
+            return NotImplemented
+        if outputs is NotImplemented:
+            mu = self.mu
+            outputs = list()
+            for mu_i in mus:
+                self.set_mu(mu_i)
+                self.solve(N, **kwargs)
+                outputs.append(self.compute_output())
+            self.set_mu(mu)
+            if any(output is NotImplemented for output in outputs):
+                return NotImplemented
+            outputs = array(outputs, dtype=float)
+        return outputs
+
+    def _compute_output_batch(self, mus, N, **kwargs):
+        """
+        Perform an online evaluation of the output for all parameters in mus at once. Internal method.
+
+        :return: reduced outputs, or NotImplemented if the problem does not support computing outputs
+            for several parameters at once.
+        """
+        return NotImplemented
+
     def _online_size_from_kwargs(self, N, **kwargs):
         return OnlineSizeDict.generate_from_N_and_kwargs(self.components, self.N, N, **kwargs)
 
@@ -675,6 +757,16 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         """
         return self.truth_problem.compute_theta(term)
 
+    def compute_theta_batch(self, term, mu_array):
+        """
+        Return theta multiplicative terms of the affine expansion of the problem for several parameters.
+
+        :param term: the forms of the class of the problem.
+        :param mu_array: list of parameters, or array of shape (n_mu, len(self.mu)).
+        :return: computed thetas, stacked in an array of shape (n_mu, Q).
+        """
+        return self.truth_problem.compute_theta_batch(term, mu_array)
+
     # Assemble the reduced order affine expansion
     def assemble_operator(self, term, current_stage="online"):
         """
@@ -728,13 +820,9 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
                 assert self.Q[term] == self.truth_problem.Q[term]
                 for q in range(self.Q[term]):
                     assert self.terms_order[term] in (0, 1, 2)
-                    if self.terms_order[term] == 2:
-                        self.operator[term][q] = (
-                            transpose(self.basis_functions) * self.truth_problem.operator[term][q]
-                            * self.basis_functions)
-                    elif self.terms_order[term] == 1:
-                        self.operator[term][q] = (
-                            transpose(self.basis_functions) * self.truth_problem.operator[term][q])
+                    if self.terms_order[term] in (1, 2):
+                        self.operator[term][q] = self._project_truth_operator(
+                            (term, q), self.truth_problem.operator[term][q], self.terms_order[term])
                     elif self.terms_order[term] == 0:
                         self.operator[term][q] = self.truth_problem.operator[term][q]
                     else:
@@ -749,9 +837,8 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
                     # the affine expansion storage contains only the inner product matrix
                     assert len(self.truth_problem.inner_product[component]) == 1
                     # the affine expansion storage contains only the inner product matrix
-                    self.inner_product[component][0] = (
-                        transpose(self.basis_functions) * self.truth_problem.inner_product[component][0]
-                        * self.basis_functions)
+                    self.inner_product[component][0] = self._project_truth_operator(
+                        (term, 0), self.truth_problem.inner_product[component][0], 2, symmetric=True)
                     self.inner_product[component].save(self.folder["reduced_operators"], term)
                     return self.inner_product[component]
                 else:
@@ -760,8 +847,8 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
                     # the affine expansion storage contains only the inner product matrix
                     assert len(self.truth_problem.inner_product) == 1
                     # the affine expansion storage contains only the inner product matrix
-                    self.inner_product[0] = (
-                        transpose(self.basis_functions) * self.truth_problem.inner_product[0] * self.basis_functions)
+                    self.inner_product[0] = self._project_truth_operator(
+                        (term, 0), self.truth_problem.inner_product[0], 2, symmetric=True)
                     self.inner_product.save(self.folder["reduced_operators"], term)
                     return self.inner_product
             elif term.startswith("projection_inner_product"):
@@ -772,9 +859,8 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
                     # the affine expansion storage contains only the inner product matrix
                     assert len(self.truth_problem.projection_inner_product[component]) == 1
                     # the affine expansion storage contains only the inner product matrix
-                    self.projection_inner_product[component][0] = (
-                        transpose(self.basis_functions) * self.truth_problem.projection_inner_product[component][0]
-                        * self.basis_functions)
+                    self.projection_inner_product[component][0] = self._project_truth_operator(
+                        (term, 0), self.truth_problem.projection_inner_product[component][0], 2, symmetric=True)
                     self.projection_inner_product[component].save(self.folder["reduced_operators"], term)
                     return self.projection_inner_product[component]
                 else:
@@ -783,9 +869,8 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
                     # the affine expansion storage contains only the inner product matrix
                     assert len(self.truth_problem.projection_inner_product) == 1
                     # the affine expansion storage contains only the inner product matrix
-                    self.projection_inner_product[0] = (
-                        transpose(self.basis_functions) * self.truth_problem.projection_inner_product[0]
-                        * self.basis_functions)
+                    self.projection_inner_product[0] = self._project_truth_operator(
+                        (term, 0), self.truth_problem.projection_inner_product[0], 2, symmetric=True)
                     self.projection_inner_product.save(self.folder["reduced_operators"], term)
                     return self.projection_inner_product
             elif term.startswith("dirichlet_bc"):
@@ -834,6 +919,72 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         else:
             raise ValueError("Invalid stage in assemble_operator().")
 
+    def _project_truth_operator(self, key, truth_operator, order, symmetric=False):
+        """
+        Project a truth operator onto the reduced basis, i.e. compute Z^T*A*Z (order 2) or Z^T*F (order 1).
+        If the same truth operator was projected (with the same key) before the basis was enriched,
+        only the rows and columns associated to the new basis functions are computed.
+
+        :param key: a key identifying the truth operator, e.g. (term, q).
+        :param truth_operator: the truth operator to be projected.
+        :param order: the order of the truth operator.
+        :param symmetric: whether the truth operator is symmetric (e.g. an inner product).
+        :return: the reduced operator.
+        """
+        assert order in (1, 2)
+        if len(self.components) == 1:
+            basis_functions = tuple(self.basis_functions[n] for n in range(len(self.basis_functions)))
+        else:
+            basis_functions = None  # the new basis functions would not be the last rows and columns
+        previous = self._projected_operators.get(key)
+        if (basis_functions is not None and previous is not None
+                and previous[1] is truth_operator
+                and isinstance(previous[2], (OnlineMatrix.Type(), OnlineVector.Type()))
+                and 0 < len(previous[0]) <= len(basis_functions)
+                and all(previous_function is function
+                        for (previous_function, function) in zip(previous[0], basis_functions))):
+            if len(previous[0]) == len(basis_functions):
+                reduced_operator = previous[2]
+            else:
+                reduced_operator = self._project_truth_operator_update(
+                    previous[2], truth_operator, order, len(previous[0]), symmetric)
+        else:
+            if order == 2:
+                reduced_operator = transpose(self.basis_functions) * truth_operator * self.basis_functions
+            else:
+                reduced_operator = transpose(self.basis_functions) * truth_operator
+        if basis_functions is not None:
+            self._projected_operators[key] = (basis_functions, truth_operator, reduced_operator)
+        return reduced_operator
+
+    def _project_truth_operator_update(self, previous_reduced_operator, truth_operator, order, N_previous,
+                                       symmetric):
+        assert len(self.components) == 1
+        component = self.components[0]
+        N = OnlineSizeDict()
+        N[component] = len(self.basis_functions)
+        N_old = OnlineSizeDict()
+        N_old[component] = N_previous
+        new_basis_functions = self.basis_functions[N_previous:]
+        if order == 2:
+            reduced_operator = OnlineMatrix(N, N)
+            reduced_operator[:N_old, :N_old] = previous_reduced_operator
+            # New columns
+            reduced_operator[:N, N_old:N] = transpose(self.basis_functions) * truth_operator * new_basis_functions
+            # New rows
+            if symmetric:
+                for i in range(N_previous, N[component]):
+                    for j in range(N_previous):
+                        reduced_operator[i, j] = reduced_operator[j, i]
+            else:
+                reduced_operator[N_old:N, :N_old] = (
+                    transpose(new_basis_functions) * truth_operator * self.basis_functions[:N_previous])
+        else:
+            reduced_operator = OnlineVector(N)
+            reduced_operator[:N_old] = previous_reduced_operator
+            reduced_operator[N_old:N] = transpose(new_basis_functions) * truth_operator
+        return reduced_operator
+
     def _lifting_truth_solve(self, term, i):
         # Since lifting solves for different values of i are associated to the same parameter
         # but with a patched call to compute_theta(), which returns the i-th component, we set
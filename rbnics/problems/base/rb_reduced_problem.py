@@ -8,8 +8,11 @@ import os
 from abc import ABCMeta, abstractmethod
 from numbers import Number
 from rbnics.backends import BasisFunctionsMatrix, Function, FunctionsList, LinearSolver, transpose
-from rbnics.backends.online import OnlineAffineExpansionStorage
+from rbnics.backends.abstract import (BasisFunctionsMatrix as AbstractBasisFunctionsMatrix,
+                                      FunctionsList as AbstractFunctionsList)
+from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineMatrix, OnlineVector
 from rbnics.utils.decorators import overload, PreserveClassName, RequiredBaseDecorators
+from rbnics.utils.io import OnlineSizeDict
 
 
 @RequiredBaseDecorators(None)
@@ -42,6 +45,11 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             self._riesz_solve_storage = Function(self.truth_problem.V)
             self._riesz_solve_inner_product = None  # setup by init()
             self._riesz_solve_homogeneous_dirichlet_bc = None  # setup by init()
+            self._riesz_solve_linear_solver = None  # setup by the first Riesz solve, and reused during offline stage
+            # Products between the error estimation inner product and the Riesz representors, and error estimation
+            # operators of the latest assembly, used to only compute contributions associated to new representors
+            self._error_estimation_inner_product_times_riesz = dict()  # from (term, q) to (representors, products)
+            self._assembled_error_estimation_operators = dict()  # from (term, q0, q1) to (representors, operator)
             self._error_estimation_inner_product = None  # setup by init()
             # I/O
             self.folder["error_estimation"] = os.path.join(self.folder_prefix, "error_estimation")
@@ -86,6 +94,11 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             if current_stage == "online":
                 for term in self.riesz_terms:
                     self.riesz[term].load(self.folder["error_estimation"], "riesz_" + term)
+                # Release the factorization of the inner product used for Riesz solves, and the auxiliary
+                # storage for the assembly of error estimation operators
+                self._riesz_solve_linear_solver = None
+                self._error_estimation_inner_product_times_riesz.clear()
+                self._assembled_error_estimation_operators.clear()
             elif current_stage == "offline":
                 pass  # Nothing else to be done
             else:
@@ -127,6 +140,18 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             raise NotImplementedError("The method estimate_relative_error() is problem-specific"
                                       + " and needs to be overridden.")
 
+        def solve_and_estimate_error_batch(self, mus):
+            """
+            It returns an error bound for each parameter in mus, after solving the reduced problem for it.
+            Problems that can carry out these operations on several parameters at once override this method.
+            """
+            error_estimators = list()
+            for mu in mus:
+                self.set_mu(mu)
+                self.solve()
+                error_estimators.append(self.estimate_error())
+            return error_estimators
+
         def estimate_error_output(self):
             """
             It returns an error bound for the current output.
@@ -208,10 +233,16 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             @overload
             def solve(self, rhs: object):
                 problem = self.problem
-                solver = LinearSolver(problem._riesz_solve_inner_product, problem._riesz_solve_storage, rhs,
-                                      problem._riesz_solve_homogeneous_dirichlet_bc)
-                solver.set_parameters(problem._linear_solver_parameters)
-                solver.solve()
+                # The linear solver is stored in the problem, so that the factorization of the inner product
+                # is computed only once, and then reused for every right-hand side
+                if problem._riesz_solve_linear_solver is None:
+                    problem._riesz_solve_linear_solver = LinearSolver(
+                        problem._riesz_solve_inner_product, problem._riesz_solve_storage, rhs,
+                        problem._riesz_solve_homogeneous_dirichlet_bc)
+                    problem._riesz_solve_linear_solver.set_parameters(problem._linear_solver_parameters)
+                else:
+                    problem._riesz_solve_linear_solver.set_rhs(rhs)
+                problem._riesz_solve_linear_solver.solve()
                 return problem._riesz_solve_storage
 
             @overload
@@ -239,23 +270,20 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                     for q0 in range(self.Q[term[0]]):
                         for q1 in range(self.Q[term[1]]):
                             self.error_estimation_operator[term][q0, q1] = (
-                                transpose(self.riesz[term[0]][q0]) * self._error_estimation_inner_product
-                                * self.riesz[term[1]][q1])
+                                self._assemble_error_estimation_operator_22(term, q0, q1))
                 elif self.terms_order[term[0]] == 2 and self.terms_order[term[1]] == 1:
                     for q0 in range(self.Q[term[0]]):
                         for q1 in range(self.Q[term[1]]):
                             assert len(self.riesz[term[1]][q1]) == 1
                             self.error_estimation_operator[term][q0, q1] = (
-                                transpose(self.riesz[term[0]][q0]) * self._error_estimation_inner_product
-                                * self.riesz[term[1]][q1][0])
+                                self._assemble_error_estimation_operator_21(term, q0, q1))
                 elif self.terms_order[term[0]] == 1 and self.terms_order[term[1]] == 1:
                     for q0 in range(self.Q[term[0]]):
                         assert len(self.riesz[term[0]][q0]) == 1
                         for q1 in range(self.Q[term[1]]):
                             assert len(self.riesz[term[1]][q1]) == 1
                             self.error_estimation_operator[term][q0, q1] = (
-                                transpose(self.riesz[term[0]][q0][0]) * self._error_estimation_inner_product
-                                * self.riesz[term[1]][q1][0])
+                                self._assemble_error_estimation_operator_11(term, q0, q1))
                 else:
                     raise ValueError("Invalid term order for assemble_error_estimation_operators().")
                 self.error_estimation_operator[term].save(
@@ -264,5 +292,104 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             else:
                 raise ValueError("Invalid stage in assemble_error_estimation_operators().")
 
+        def _assemble_error_estimation_operator_22(self, term, q0, q1):
+            representors0 = self._riesz_representors(term[0], q0)
+            representors1 = self._riesz_representors(term[1], q1)
+            if representors0 is None or representors1 is None:
+                return (transpose(self.riesz[term[0]][q0]) * self._error_estimation_inner_product
+                        * self.riesz[term[1]][q1])
+            products0 = self._error_estimation_inner_product_times_riesz_representors(term[0], q0, representors0)
+            products1 = self._error_estimation_inner_product_times_riesz_representors(term[1], q1, representors1)
+            (N0, N1) = (self._riesz_size(representors0), self._riesz_size(representors1))
+            error_estimation_operator = OnlineMatrix(N0, N1)
+            # Keep the block associated to the Riesz representors which were available in the previous assembly
+            previous = self._assembled_error_estimation_operators.get((term, q0, q1))
+            if (previous is not None and isinstance(previous[2], OnlineMatrix.Type())
+                    and _is_prefix(previous[0], representors0) and _is_prefix(previous[1], representors1)):
+                (N0_old, N1_old) = (len(previous[0]), len(previous[1]))
+                error_estimation_operator[:self._riesz_size(previous[0]), :self._riesz_size(previous[1])] = (
+                    previous[2])
+            else:
+                (N0_old, N1_old) = (0, 0)
+            # Compute new columns, using the stored products between the inner product and the representors
+            for j in range(N1_old, len(representors1)):
+                error_estimation_operator[:N0, j] = transpose(self.riesz[term[0]][q0]) * products1[j]
+            # Compute new rows, exploiting the symmetry of the inner product
+            if N1_old > 0:
+                for i in range(N0_old, len(representors0)):
+                    error_estimation_operator[i, :self._riesz_size(representors1[:N1_old])] = (
+                        transpose(self.riesz[term[1]][q1][:N1_old]) * products0[i])
+            self._assembled_error_estimation_operators[(term, q0, q1)] = (
+                representors0, representors1, error_estimation_operator)
+            return error_estimation_operator
+
+        def _assemble_error_estimation_operator_21(self, term, q0, q1):
+            representors0 = self._riesz_representors(term[0], q0)
+            representors1 = self._riesz_representors(term[1], q1)
+            if representors0 is None or representors1 is None:
+                return (transpose(self.riesz[term[0]][q0]) * self._error_estimation_inner_product
+                        * self.riesz[term[1]][q1][0])
+            products1 = self._error_estimation_inner_product_times_riesz_representors(term[1], q1, representors1)
+            previous = self._assembled_error_estimation_operators.get((term, q0, q1))
+            if (previous is not None and isinstance(previous[2], OnlineVector.Type())
+                    and _is_prefix(previous[0], representors0) and previous[1] == representors1):
+                N0_old = len(previous[0])
+                error_estimation_operator = OnlineVector(self._riesz_size(representors0))
+                error_estimation_operator[:self._riesz_size(previous[0])] = previous[2]
+                if N0_old < len(representors0):
+                    error_estimation_operator[self._riesz_size(previous[0]):self._riesz_size(representors0)] = (
+                        transpose(self.riesz[term[0]][q0][N0_old:]) * products1[0])
+            else:
+                error_estimation_operator = transpose(self.riesz[term[0]][q0]) * products1[0]
+            self._assembled_error_estimation_operators[(term, q0, q1)] = (
+                representors0, representors1, error_estimation_operator)
+            return error_estimation_operator
+
+        def _assemble_error_estimation_operator_11(self, term, q0, q1):
+            representors1 = self._riesz_representors(term[1], q1)
+            if representors1 is None:
+                return (transpose(self.riesz[term[0]][q0][0]) * self._error_estimation_inner_product
+                        * self.riesz[term[1]][q1][0])
+            products1 = self._error_estimation_inner_product_times_riesz_representors(term[1], q1, representors1)
+            return transpose(self.riesz[term[0]][q0][0]) * products1[0]
+
+        def _riesz_representors(self, term, q):
+            """
+            Return the Riesz representors of the q-th affine term as a tuple of functions, or None if they
+            cannot be extracted one at a time (e.g. for problems with several components).
+            """
+            riesz_term_q = self.riesz[term][q]
+            if len(self.components) > 1 or not isinstance(riesz_term_q, (
+                    AbstractBasisFunctionsMatrix, AbstractFunctionsList)):
+                return None
+            return tuple(riesz_term_q[n] for n in range(len(riesz_term_q)))
+
+        def _riesz_size(self, representors):
+            assert len(self.components) == 1
+            size = OnlineSizeDict()
+            size[self.components[0]] = len(representors)
+            return size
+
+        def _error_estimation_inner_product_times_riesz_representors(self, term, q, representors):
+            """
+            Return the products between the error estimation inner product and the Riesz representors
+            of the q-th affine term, computing only the products associated to new representors.
+            """
+            (previous_representors, previous_products) = self._error_estimation_inner_product_times_riesz.get(
+                (term, q), ((), ()))
+            if not _is_prefix(previous_representors, representors):
+                (previous_representors, previous_products) = ((), ())
+            products = previous_products + tuple(
+                self._error_estimation_inner_product * representor
+                for representor in representors[len(previous_representors):])
+            self._error_estimation_inner_product_times_riesz[(term, q)] = (representors, products)
+            return products
+
     # return value (a class) for the decorator
     return RBReducedProblem_Class
+
+
+def _is_prefix(previous_representors, representors):
+    return (len(previous_representors) <= len(representors)
+            and all(previous_representor is representor
+                    for (previous_representor, representor) in zip(previous_representors, representors)))
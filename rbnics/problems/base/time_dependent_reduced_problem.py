@@ -266,6 +266,31 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
 
         class ProblemSolver(
                 ParametrizedReducedDifferentialProblem_DerivedClass.ProblemSolver, TimeDependentProblemWrapper):
+            def __init__(self, problem, N, **kwargs):
+                ParametrizedReducedDifferentialProblem_DerivedClass.ProblemSolver.__init__(self, problem, N, **kwargs)
+                # Operators assembled during the current solve, together with the thetas they were assembled with
+                self._assembled_operators = dict()
+
+            def _assemble_operator(self, term):
+                # Operators are assembled at every time step, but in many cases their thetas do not depend on time:
+                # avoid to assemble them again, and return the same object, if thetas did not change
+                problem = self.problem
+                thetas = problem.compute_theta(term)
+                if term in self._assembled_operators:
+                    (assembled_thetas, assembled_operator) = self._assembled_operators[term]
+                    if assembled_thetas == thetas:
+                        return assembled_operator
+                N = self.N
+                assert problem.terms_order[term] in (1, 2)
+                if problem.terms_order[term] == 2:
+                    assembled_operator = sum(product(thetas, problem.operator[term][:N, :N]))
+                elif problem.terms_order[term] == 1:
+                    assembled_operator = sum(product(thetas, problem.operator[term][:N]))
+                else:
+                    raise ValueError("Invalid value for order of term " + term)
+                self._assembled_operators[term] = (thetas, assembled_operator)
+                return assembled_operator
+
             def set_time(self, t):
                 problem = self.problem
                 problem.set_time(t)
@@ -307,7 +332,10 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
                     solver = OnlineLinearSolver(
                         inner_product_N, projected_initial_condition,
                         sum(product(all_initial_conditions_thetas, all_initial_conditions)))
-                    solver.set_parameters(problem._linear_solver_parameters)
+                    # The projection inner product does not depend on the parameter: reuse its factorization
+                    linear_solver_parameters = dict(problem._linear_solver_parameters)
+                    linear_solver_parameters["reuse_factorization"] = True
+                    solver.set_parameters(linear_solver_parameters)
                     solver.solve()
                     return projected_initial_condition
                 else:
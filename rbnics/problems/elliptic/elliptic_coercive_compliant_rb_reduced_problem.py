@@ -5,7 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from math import sqrt
-from numpy import isclose
+from numpy import isclose, sqrt as array_sqrt
 from rbnics.problems.elliptic.elliptic_coercive_compliant_problem import EllipticCoerciveCompliantProblem
 from rbnics.problems.elliptic.elliptic_coercive_compliant_reduced_problem import EllipticCoerciveCompliantReducedProblem
 from rbnics.problems.elliptic.elliptic_coercive_rb_reduced_problem import EllipticCoerciveRBReducedProblem
@@ -26,6 +26,13 @@ class EllipticCoerciveCompliantRBReducedProblem(EllipticCoerciveCompliantRBReduc
         assert beta >= 0.
         return sqrt(abs(eps2) / beta)
 
+    # Return an error bound for each parameter in mus, solving the reduced problem for all of them at once
+    def solve_and_estimate_error_batch(self, mus):
+        if not self._has_affine_single_component_operators():
+            return EllipticCoerciveCompliantRBReducedProblem_Base.solve_and_estimate_error_batch(self, mus)
+        (eps2, beta) = self._get_residual_norm_squared_and_stability_factor_lower_bound_batch(mus)
+        return array_sqrt(abs(eps2) / beta)
+
     # Return an error bound for the current compliant output
     def estimate_error_output(self):
         return self.estimate_error()**2
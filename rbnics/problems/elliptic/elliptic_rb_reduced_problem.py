@@ -5,8 +5,9 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from math import sqrt
-from numpy import isclose
+from numpy import asarray, einsum, empty, isclose, newaxis, sqrt as array_sqrt
 from rbnics.backends import product, sum, transpose
+from rbnics.backends.online import OnlineAffineExpansionStorage
 from rbnics.problems.base import LinearRBReducedProblem, ParametrizedReducedDifferentialProblem
 from rbnics.problems.elliptic.elliptic_problem import EllipticProblem
 from rbnics.problems.elliptic.elliptic_reduced_problem import EllipticReducedProblem
@@ -39,6 +40,13 @@ class EllipticRBReducedProblem(EllipticRBReducedProblem_Base):
         assert beta >= 0.
         return sqrt(abs(eps2)) / beta
 
+    # Return an error bound for each parameter in mus, solving the reduced problem for all of them at once
+    def solve_and_estimate_error_batch(self, mus):
+        if not self._has_affine_single_component_operators():
+            return EllipticRBReducedProblem_Base.solve_and_estimate_error_batch(self, mus)
+        (eps2, beta) = self._get_residual_norm_squared_and_stability_factor_lower_bound_batch(mus)
+        return array_sqrt(abs(eps2)) / beta
+
     # Return a relative error bound for the current solution
     def estimate_relative_error(self):
         return NotImplemented
@@ -62,3 +70,46 @@ class EllipticRBReducedProblem(EllipticRBReducedProblem_Base):
                 + (transpose(self._solution)
                    * sum(product(theta_a, self.error_estimation_operator["a", "a"][:N, :N], theta_a))
                    * self._solution))
+
+    # Check if reduced operators and error estimation operators can be stacked to solve the reduced problem
+    # and estimate the error for several parameters at once
+    def _has_affine_single_component_operators(self):
+        return (self._can_solve_batch(self._online_size_with_bc())
+                and all(isinstance(self.error_estimation_operator[term], OnlineAffineExpansionStorage)
+                        for term in self.error_estimation_terms))
+
+    def _online_size_with_bc(self):
+        (N, _) = self._online_size_from_kwargs(None)
+        N += self.N_bc
+        return N
+
+    # Return the numerator and the denominator of the error bound for each parameter in mus, where the
+    # numerator is computed for reduced solutions obtained for all parameters at once
+    def _get_residual_norm_squared_and_stability_factor_lower_bound_batch(self, mus):
+        N = self._online_size_with_bc()
+        solutions = self._solve_batch(mus, N)
+        theta_a = self.compute_theta_batch("a", mus)
+        theta_f = self.compute_theta_batch("f", mus)
+        (n_mus, Q_a) = theta_a.shape
+        Q_f = theta_f.shape[1]
+        N_int = solutions.shape[1]
+        error_estimation_operator_ff = asarray(self.error_estimation_operator["f", "f"])
+        error_estimation_operator_af = asarray(self.error_estimation_operator["a", "f"][:N])
+        error_estimation_operator_aa = asarray(self.error_estimation_operator["a", "a"][:N, :N])
+        # Combine thetas and solutions as a (n_mus, Q_a * N_int) array, so that contractions with
+        # the af and aa blocks become matrix-matrix products
+        theta_a_solutions = (theta_a[:, :, newaxis] * solutions[:, newaxis, :]).reshape(n_mus, Q_a * N_int)
+        eps2 = (einsum("mp,pq,mq->m", theta_f, error_estimation_operator_ff, theta_f)
+                + 2.0 * einsum("mq,mq->m", theta_a_solutions @ error_estimation_operator_af.transpose(
+                    0, 2, 1).reshape(Q_a * N_int, Q_f), theta_f)
+                + einsum("mi,mi->m", theta_a_solutions @ error_estimation_operator_aa.transpose(
+                    0, 2, 1, 3).reshape(Q_a * N_int, Q_a * N_int), theta_a_solutions))
+        assert all((eps2 >= 0.) | isclose(eps2, 0.))
+        beta = empty(n_mus)
+        mu = self.mu
+        for (i, mu_i) in enumerate(mus):
+            self.set_mu(mu_i)
+            beta[i] = self.truth_problem.get_stability_factor_lower_bound()
+        self.set_mu(mu)
+        assert all(beta >= 0.)
+        return (eps2, beta)
@@ -4,8 +4,12 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from numpy import asarray, einsum, newaxis
+from numpy.linalg import solve
 from rbnics.problems.base import LinearReducedProblem
 from rbnics.backends import product, sum, transpose
+from rbnics.backends.online import OnlineAffineExpansionStorage
+from rbnics.utils.io import OnlineSizeDict
 
 
 def EllipticReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
@@ -27,6 +31,37 @@ def EllipticReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                 N = self.N
                 return sum(product(problem.compute_theta("f"), problem.operator["f"][:N]))
 
+        # Perform an online solve for all parameters in mus at once (internal)
+        def _solve_batch(self, mus, N, **kwargs):
+            if not self._can_solve_batch(N, **kwargs):
+                return NotImplemented
+            theta_a = self.compute_theta_batch("a", mus)
+            theta_f = self.compute_theta_batch("f", mus)
+            lhs = einsum("mq,qij->mij", theta_a, asarray(self.operator["a"][:N, :N]))
+            rhs = theta_f @ asarray(self.operator["f"][:N])
+            if self.dirichlet_bc and not self.dirichlet_bc_are_homogeneous:
+                theta_bc = self.compute_theta_batch("dirichlet_bc", mus)
+                for i in range(theta_bc.shape[1]):
+                    lhs[:, i, :] = 0.
+                    lhs[:, i, i] = 1.
+                    rhs[:, i] = theta_bc[:, i]
+            if N[self.components[0]] == 0:  # trivial case
+                return rhs
+            return solve(lhs, rhs[..., newaxis])[..., 0]
+
+        # Check if reduced operators can be stacked to solve the reduced problem for several parameters at once
+        def _can_solve_batch(self, N, **kwargs):
+            return (len(self.components) == 1 and isinstance(N, OnlineSizeDict) and len(kwargs) == 0
+                    and all(isinstance(self.operator[term], OnlineAffineExpansionStorage) for term in ("a", "f")))
+
+        # Perform an online evaluation of the output for all parameters in mus at once (internal)
+        def _compute_output_batch(self, mus, N, **kwargs):
+            theta_s = self.compute_theta_batch("s", mus)
+            solutions = self._solve_batch(mus, N, **kwargs)
+            if solutions is NotImplemented or not isinstance(self.operator["s"], OnlineAffineExpansionStorage):
+                return NotImplemented
+            return einsum("mi,mi->m", solutions, theta_s @ asarray(self.operator["s"][:N]))
+
         # Perform an online evaluation of the output
         def _compute_output(self, N):
             self._output = transpose(self._solution) * sum(product(self.compute_theta("s"), self.operator["s"][:N]))
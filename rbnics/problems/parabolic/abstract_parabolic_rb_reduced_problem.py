@@ -44,6 +44,19 @@ def AbstractParabolicRBReducedProblem(AbstractParabolicReducedProblem_DerivedCla
             #
             return error_bound_over_time
 
+        # Return an error bound for each parameter in mus. The steady implementation, which solves the reduced
+        # problem for several parameters at once, does not account for time, hence parameters are processed
+        # one at a time
+        def solve_and_estimate_error_batch(self, mus):
+            mu = self.mu
+            error_estimators = list()
+            for mu_i in mus:
+                self.set_mu(mu_i)
+                self.solve()
+                error_estimators.append(self.estimate_error())
+            self.set_mu(mu)
+            return error_estimators
+
         # Return an error bound for the current solution
         def estimate_relative_error(self):
             return NotImplemented
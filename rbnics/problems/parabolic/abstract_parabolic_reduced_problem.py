@@ -16,22 +16,17 @@ def AbstractParabolicReducedProblem(EllipticReducedProblem_DerivedClass):
 
         class ProblemSolver(AbstractParabolicReducedProblem_Base.ProblemSolver):
             def residual_eval(self, t, solution, solution_dot):
-                problem = self.problem
-                N = self.N
                 assembled_operator = dict()
-                assembled_operator["m"] = sum(product(problem.compute_theta("m"), problem.operator["m"][:N, :N]))
-                assembled_operator["a"] = sum(product(problem.compute_theta("a"), problem.operator["a"][:N, :N]))
-                assembled_operator["f"] = sum(product(problem.compute_theta("f"), problem.operator["f"][:N]))
+                for term in ("m", "a", "f"):
+                    assembled_operator[term] = self._assemble_operator(term)
                 return (assembled_operator["m"] * solution_dot
                         + assembled_operator["a"] * solution
                         - assembled_operator["f"])
 
             def jacobian_eval(self, t, solution, solution_dot, solution_dot_coefficient):
-                problem = self.problem
-                N = self.N
                 assembled_operator = dict()
-                assembled_operator["m"] = sum(product(problem.compute_theta("m"), problem.operator["m"][:N, :N]))
-                assembled_operator["a"] = sum(product(problem.compute_theta("a"), problem.operator["a"][:N, :N]))
+                for term in ("m", "a"):
+                    assembled_operator[term] = self._assemble_operator(term)
                 return (assembled_operator["m"] * solution_dot_coefficient
                         + assembled_operator["a"])
 
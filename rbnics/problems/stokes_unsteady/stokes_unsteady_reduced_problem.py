@@ -5,7 +5,6 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from rbnics.problems.base import LinearTimeDependentReducedProblem
-from rbnics.backends import product, sum
 
 
 def AbstractCFDUnsteadyReducedProblem(AbstractCFDUnsteadyReducedProblem_Base):
@@ -21,30 +20,17 @@ def StokesUnsteadyReducedProblem(StokesReducedProblem_DerivedClass):
 
         class ProblemSolver(StokesUnsteadyReducedProblem_Base.ProblemSolver):
             def residual_eval(self, t, solution, solution_dot):
-                problem = self.problem
-                N = self.N
                 assembled_operator = dict()
                 for term in ("m", "a", "b", "bt", "f", "g"):
-                    assert problem.terms_order[term] in (1, 2)
-                    if problem.terms_order[term] == 2:
-                        assembled_operator[term] = sum(product(
-                            problem.compute_theta(term), problem.operator[term][:N, :N]))
-                    elif problem.terms_order[term] == 1:
-                        assembled_operator[term] = sum(product(
-                            problem.compute_theta(term), problem.operator[term][:N]))
-                    else:
-                        raise ValueError("Invalid value for order of term " + term)
+                    assembled_operator[term] = self._assemble_operator(term)
                 return (assembled_operator["m"] * solution_dot
                         + (assembled_operator["a"] + assembled_operator["b"] + assembled_operator["bt"]) * solution
                         - assembled_operator["f"] - assembled_operator["g"])
 
             def jacobian_eval(self, t, solution, solution_dot, solution_dot_coefficient):
-                problem = self.problem
-                N = self.N
                 assembled_operator = dict()
                 for term in ("m", "a", "b", "bt"):
-                    assembled_operator[term] = sum(product(
-                        problem.compute_theta(term), problem.operator[term][:N, :N]))
+                    assembled_operator[term] = self._assemble_operator(term)
                 return (assembled_operator["m"] * solution_dot_coefficient
                         + assembled_operator["a"] + assembled_operator["b"] + assembled_operator["bt"])
 
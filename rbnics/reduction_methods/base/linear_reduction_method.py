@@ -12,7 +12,23 @@ def LinearReductionMethod(DifferentialProblemReductionMethod_DerivedClass):
 
     @PreserveClassName
     class LinearReductionMethod_Class(DifferentialProblemReductionMethod_DerivedClass):
-        pass
+
+        def _init_offline(self):
+            # Call parent to initialize inner product and reduced problem
+            output = DifferentialProblemReductionMethod_DerivedClass._init_offline(self)
+
+            # Share factorizations among truth linear solves of the offline phase
+            self.truth_problem._share_linear_solver_factorizations()
+
+            # Return
+            return output
+
+        def _finalize_offline(self):
+            # Release factorizations of truth linear solves, so that they do not use memory after the offline phase
+            self.truth_problem._release_linear_solver_factorizations()
+
+            # Call parent
+            DifferentialProblemReductionMethod_DerivedClass._finalize_offline(self)
 
     # return value (a class) for the decorator
     return LinearReductionMethod_Class
@@ -12,7 +12,53 @@ def NonlinearReductionMethod(DifferentialProblemReductionMethod_DerivedClass):
 
     @PreserveClassName
     class NonlinearReductionMethod_Class(DifferentialProblemReductionMethod_DerivedClass):
-        pass
+
+        # Default initialization of members
+        def __init__(self, truth_problem, **kwargs):
+            # Call to parent
+            DifferentialProblemReductionMethod_DerivedClass.__init__(self, truth_problem, **kwargs)
+
+            # Initial guess of truth nonlinear solves during the offline phase (see set_truth_initial_guess)
+            self.truth_initial_guess = None
+
+        def set_truth_initial_guess(self, truth_initial_guess):
+            """
+            It sets the initial guess of truth nonlinear solves during the offline phase.
+
+            :param truth_initial_guess: None to start from the truth solution of the previous solve (default),
+                "closest" to start from the cached truth solution of the closest parameter already solved, or
+                "reduced" to start from the reduced solution for the same parameter, reconstructed with the current
+                basis (if not empty).
+            """
+            assert truth_initial_guess in (None, "closest", "reduced")
+            self.truth_initial_guess = truth_initial_guess
+
+        def _init_offline(self):
+            # Call parent to initialize inner product and reduced problem
+            output = DifferentialProblemReductionMethod_DerivedClass._init_offline(self)
+
+            # Set the initial guess of truth solves, which also resets the parameters solved so far
+            if self.truth_initial_guess == "reduced":
+                self.truth_problem.set_initial_guess(self._reconstructed_reduced_solution)
+            else:
+                self.truth_problem.set_initial_guess(self.truth_initial_guess)
+
+            # Return
+            return output
+
+        def _finalize_offline(self):
+            # Restore the default initial guess of truth solves, so that error and speedup analyses are not affected.
+            # This also releases the parameters solved during the offline phase
+            self.truth_problem.set_initial_guess(None)
+
+            # Call parent
+            DifferentialProblemReductionMethod_DerivedClass._finalize_offline(self)
+
+        def _reconstructed_reduced_solution(self):
+            if self.reduced_problem.N == 0:
+                return None
+            reduced_solution = self.reduced_problem.solve()
+            return self.reduced_problem.basis_functions[:reduced_solution.N] * reduced_solution
 
     # return value (a class) for the decorator
     return NonlinearReductionMethod_Class
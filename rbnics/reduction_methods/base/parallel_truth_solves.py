@@ -0,0 +1,69 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from mpi4py.MPI import COMM_WORLD
+
+
+class ParallelTruthSolves(object):
+    """
+    Pool of worker processes carrying out truth solves. Worker processes are forked, so that they inherit
+    the (possibly non picklable) truth problem, and store their solutions in the disk cache of the truth
+    problem, from which they can be loaded by a subsequent call to truth_problem.solve().
+
+    :param truth_problem: the truth problem to be solved.
+    :param workers: number of worker processes.
+    """
+
+    def __init__(self, truth_problem, workers):
+        from rbnics.utils.config import config  # cannot import at global scope
+        assert workers > 0
+        assert "disk" in config.get("problems", "cache"), (
+            "Parallel truth solves require the disk cache of problems to be enabled")
+        assert COMM_WORLD.size == 1, (
+            "Parallel truth solves are only available for serial runs")
+        self.truth_problem = truth_problem
+        self.workers = workers
+        self._executor = None
+        self._futures = list()
+
+    def __enter__(self):
+        global _truth_problem
+        assert _truth_problem is None, "Only one pool of parallel truth solves can be active at a time"
+        _truth_problem = self.truth_problem
+        self._executor = ProcessPoolExecutor(self.workers, mp_context=get_context("fork"))
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        global _truth_problem
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        self._futures = list()
+        _truth_problem = None
+
+    def submit(self, mu):
+        """
+        Submit a truth solve for the parameter mu.
+
+        :return: future corresponding to the truth solve.
+        """
+        assert self._executor is not None
+        future = self._executor.submit(_truth_solve, mu)
+        self._futures.append(future)
+        return future
+
+
+# Truth problem inherited by the worker processes of the active ParallelTruthSolves pool
+_truth_problem = None
+
+
+def _truth_solve(mu):
+    # Solve and store the solution in the disk cache, which is shared with the parent process
+    _truth_problem.set_mu(mu)
+    _truth_problem.solve()
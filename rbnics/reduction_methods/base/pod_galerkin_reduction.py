@@ -5,8 +5,10 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import os
+from contextlib import contextmanager
 from numbers import Number
 from rbnics.backends import ProperOrthogonalDecomposition
+from rbnics.reduction_methods.base.parallel_truth_solves import ParallelTruthSolves
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators, snapshot_links_to_cache
 from rbnics.utils.io import ErrorAnalysisTable, OnlineSizeDict, SpeedupAnalysisTable, TextBox, TextLine, Timer
 
@@ -44,6 +46,22 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             else:
                 self.tol = 0.
 
+            # Number of worker processes to be used for truth solves during the offline stage
+            # (None means that truth solves are carried out in the current process)
+            self.snapshots_workers = None
+
+        def set_snapshots_workers(self, snapshots_workers):
+            """
+            It enables the computation of truth snapshots on several worker processes during the offline stage.
+            Each worker stores its solutions in the truth problem disk cache, from which they are then loaded
+            (in the same order of the training set) to update the snapshots matrix.
+
+            :param snapshots_workers: number of worker processes, or None to carry out truth solves
+                in the current process.
+            """
+            assert snapshots_workers is None or snapshots_workers > 0
+            self.snapshots_workers = snapshots_workers
+
         def set_tolerance(self, tol, **kwargs):
             """
             It sets tolerance to be used as stopping criterion.
@@ -122,20 +140,23 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase begins", fill="="))
             print("")
 
-            for (mu_index, mu) in enumerate(self.training_set):
-                print(TextLine(str(mu_index), fill="#"))
+            with self._parallel_truth_solves() as truth_solves:
+                for (mu_index, mu) in enumerate(self.training_set):
+                    print(TextLine(str(mu_index), fill="#"))
 
-                self.truth_problem.set_mu(mu)
+                    self.truth_problem.set_mu(mu)
 
-                print("truth solve for mu =", self.truth_problem.mu)
-                snapshot = self.truth_problem.solve()
-                self.truth_problem.export_solution(self.folder["snapshots"], "truth_" + str(mu_index), snapshot)
-                snapshot = self.postprocess_snapshot(snapshot, mu_index)
+                    print("truth solve for mu =", self.truth_problem.mu)
+                    if truth_solves is not None:
+                        truth_solves[mu_index].result()  # solution will be then loaded from the disk cache
+                    snapshot = self.truth_problem.solve()
+                    self.truth_problem.export_solution(self.folder["snapshots"], "truth_" + str(mu_index), snapshot)
+                    snapshot = self.postprocess_snapshot(snapshot, mu_index)
 
-                print("update snapshots matrix")
-                self.update_snapshots_matrix(snapshot)
+                    print("update snapshots matrix")
+                    self.update_snapshots_matrix(snapshot)
 
-                print("")
+                    print("")
 
             print(TextLine("perform POD", fill="#"))
             self.compute_basis_functions()
@@ -148,6 +169,18 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase ends", fill="="))
             print("")
 
+        @contextmanager
+        def _parallel_truth_solves(self):
+            """
+            Submit truth solves for all parameters in the training set to a pool of worker processes,
+            and yield the corresponding futures (or None if snapshots_workers has not been set).
+            """
+            if self.snapshots_workers is None:
+                yield None
+            else:
+                with ParallelTruthSolves(self.truth_problem, self.snapshots_workers) as parallel_truth_solves:
+                    yield [parallel_truth_solves.submit(mu) for mu in self.training_set]
+
         def update_snapshots_matrix(self, snapshot):
             """
             It updates the snapshots matrix.
@@ -5,9 +5,11 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import os
+from contextlib import contextmanager
 from math import sqrt
 from logging import DEBUG, getLogger
 from rbnics.backends import GramSchmidt
+from rbnics.reduction_methods.base.parallel_truth_solves import ParallelTruthSolves
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators, snapshot_links_to_cache
 from rbnics.utils.io import (ErrorAnalysisTable, GreedySelectedParametersList, GreedyErrorEstimatorsList,
                              OnlineSizeDict, SpeedupAnalysisTable, TextBox, TextLine, Timer)
@@ -42,8 +44,47 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
             self.greedy_selected_parameters = GreedySelectedParametersList()
             self.greedy_error_estimators = GreedyErrorEstimatorsList()
+            # Number of training parameters for which the error estimator is evaluated at once during the
+            # greedy (None means that parameters are processed one at a time)
+            self.greedy_batch_size = None
+            # Number of the most promising candidates of each greedy iteration for which a truth solve is
+            # speculatively started on worker processes, and corresponding number of worker processes
+            self.prefetched_truth_solves = 0
+            self.prefetched_truth_solves_workers = None
+            self._prefetched_truth_solves_pool = None
+            self._prefetched_truth_solves_futures = dict()  # from mu to future
+            self._greedy_candidates = list()  # of (error estimator, mu)
             self.label = "RB"
 
+        def set_greedy_batch_size(self, greedy_batch_size):
+            """
+            It enables the evaluation of the error estimator for several training parameters at once
+            during the greedy. The selected parameter is the same one of the default (serial) evaluation.
+
+            :param greedy_batch_size: maximum number of parameters to be processed at once,
+                or None to process parameters one at a time.
+            """
+            assert greedy_batch_size is None or greedy_batch_size > 0
+            self.greedy_batch_size = greedy_batch_size
+
+        def set_prefetched_truth_solves(self, prefetched_truth_solves, workers=None):
+            """
+            It enables speculative truth solves during the offline stage: after each greedy iteration, truth
+            solves for the parameters with the largest error estimators (other than the selected one) are started
+            on worker processes, while the current iteration proceeds. If one of them is selected by a subsequent
+            greedy iteration, its truth solution is loaded from the disk cache of the truth problem.
+
+            :param prefetched_truth_solves: number of candidates to be prefetched at each iteration,
+                or 0 to disable prefetching.
+            :param workers: number of worker processes (defaults to the number of prefetched candidates).
+            """
+            assert prefetched_truth_solves >= 0
+            assert workers is None or workers > 0
+            self.prefetched_truth_solves = prefetched_truth_solves
+            if workers is None and prefetched_truth_solves > 0:
+                workers = prefetched_truth_solves
+            self.prefetched_truth_solves_workers = workers
+
         def _init_offline(self):
             # Call parent to initialize inner product and reduced problem
             output = DifferentialProblemReductionMethod_DerivedClass._init_offline(self)
@@ -80,46 +121,90 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase begins", fill="="))
             print("")
 
-            # Initialize first parameter to be used
-            self.reduced_problem.build_reduced_operators()
-            self.reduced_problem.build_error_estimation_operators()
-            (absolute_error_estimator_max, relative_error_estimator_max) = self.greedy()
-            print("initial maximum absolute error estimator over training set =", absolute_error_estimator_max)
-            print("initial maximum relative error estimator over training set =", relative_error_estimator_max)
+            with self._prefetched_truth_solves_context():
+                # Initialize first parameter to be used
+                self.reduced_problem.build_reduced_operators()
+                self.reduced_problem.build_error_estimation_operators()
+                (absolute_error_estimator_max, relative_error_estimator_max) = self.greedy()
+                self._prefetch_truth_solves()
+                print("initial maximum absolute error estimator over training set =", absolute_error_estimator_max)
+                print("initial maximum relative error estimator over training set =", relative_error_estimator_max)
 
-            print("")
+                print("")
 
-            iteration = 0
-            while self.reduced_problem.N < self.Nmax and relative_error_estimator_max >= self.tol:
-                print(TextLine("N = " + str(self.reduced_problem.N), fill="#"))
+                iteration = 0
+                while self.reduced_problem.N < self.Nmax and relative_error_estimator_max >= self.tol:
+                    print(TextLine("N = " + str(self.reduced_problem.N), fill="#"))
 
-                print("truth solve for mu =", self.truth_problem.mu)
-                snapshot = self.truth_problem.solve()
-                self.truth_problem.export_solution(self.folder["snapshots"], "truth_" + str(iteration), snapshot)
-                snapshot = self.postprocess_snapshot(snapshot, iteration)
+                    print("truth solve for mu =", self.truth_problem.mu)
+                    self._wait_for_prefetched_truth_solve()
+                    snapshot = self.truth_problem.solve()
+                    self.truth_problem.export_solution(self.folder["snapshots"], "truth_" + str(iteration), snapshot)
+                    snapshot = self.postprocess_snapshot(snapshot, iteration)
 
-                print("update basis matrix")
-                self.update_basis_matrix(snapshot)
-                iteration += 1
+                    print("update basis matrix")
+                    self.update_basis_matrix(snapshot)
+                    iteration += 1
 
-                print("build reduced operators")
-                self.reduced_problem.build_reduced_operators()
+                    print("build reduced operators")
+                    self.reduced_problem.build_reduced_operators()
 
-                print("reduced order solve")
-                self.reduced_problem.solve()
+                    print("reduced order solve")
+                    self.reduced_problem.solve()
 
-                print("build operators for error estimation")
-                self.reduced_problem.build_error_estimation_operators()
+                    print("build operators for error estimation")
+                    self.reduced_problem.build_error_estimation_operators()
 
-                (absolute_error_estimator_max, relative_error_estimator_max) = self.greedy()
-                print("maximum absolute error estimator over training set =", absolute_error_estimator_max)
-                print("maximum relative error estimator over training set =", relative_error_estimator_max)
+                    (absolute_error_estimator_max, relative_error_estimator_max) = self.greedy()
+                    self._prefetch_truth_solves()
+                    print("maximum absolute error estimator over training set =", absolute_error_estimator_max)
+                    print("maximum relative error estimator over training set =", relative_error_estimator_max)
 
-                print("")
+                    print("")
 
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase ends", fill="="))
             print("")
 
+        @contextmanager
+        def _prefetched_truth_solves_context(self):
+            if self.prefetched_truth_solves > 0:
+                with ParallelTruthSolves(
+                        self.truth_problem, self.prefetched_truth_solves_workers) as prefetched_truth_solves_pool:
+                    self._prefetched_truth_solves_pool = prefetched_truth_solves_pool
+                    try:
+                        yield
+                    finally:
+                        self._prefetched_truth_solves_pool = None
+                        self._prefetched_truth_solves_futures.clear()
+            else:
+                yield
+
+        def _prefetch_truth_solves(self):
+            """
+            It starts speculative truth solves for the most promising candidates of the latest greedy iteration.
+            """
+            if self._prefetched_truth_solves_pool is not None:
+                selected_mu = self.truth_problem.mu
+                candidates = sorted(self._greedy_candidates, key=lambda candidate: candidate[0], reverse=True)
+                prefetched = 0
+                for (_, mu) in candidates:
+                    if prefetched == self.prefetched_truth_solves:
+                        break
+                    elif mu != selected_mu and mu not in self._prefetched_truth_solves_futures:
+                        logger.log(DEBUG, "Prefetching truth solve for mu = " + str(mu))
+                        self._prefetched_truth_solves_futures[mu] = self._prefetched_truth_solves_pool.submit(mu)
+                        prefetched += 1
+            self._greedy_candidates = list()
+
+        def _wait_for_prefetched_truth_solve(self):
+            """
+            If a truth solve for the current parameter has been prefetched, wait for it to be stored
+            in the disk cache of the truth problem.
+            """
+            if self.truth_problem.mu in self._prefetched_truth_solves_futures:
+                logger.log(DEBUG, "Waiting for prefetched truth solve for mu = " + str(self.truth_problem.mu))
+                self._prefetched_truth_solves_futures.pop(self.truth_problem.mu).result()
+
         def update_basis_matrix(self, snapshot):
             """
             It updates basis matrix.
@@ -177,12 +262,46 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 logger.log(DEBUG, "Error estimator for mu = " + str(mu) + " is " + str(error_estimator))
                 return error_estimator
 
+            def solve_and_estimate_error_batch(mus):
+                error_estimators = self.reduced_problem.solve_and_estimate_error_batch(mus)
+                for (mu, error_estimator) in zip(mus, error_estimators):
+                    logger.log(DEBUG, "Error estimator for mu = " + str(mu) + " is " + str(error_estimator))
+                return error_estimators
+
             if self.reduced_problem.N == 0:
                 print("find initial mu")
             else:
                 print("find next mu")
 
-            return self.training_set.max(solve_and_estimate_error)
+            return self._greedy_max(solve_and_estimate_error, solve_and_estimate_error_batch)
+
+        def _greedy_max(self, solve_and_estimate_error, solve_and_estimate_error_batch=None):
+            """
+            It evaluates the error estimator over the training set (one parameter at a time, or in batches if
+            the greedy batch size has been set), storing the candidates if truth solves are to be prefetched.
+
+            :return: max error estimator and the respective parameter index.
+            """
+            if self.prefetched_truth_solves > 0:
+                def solve_and_estimate_error_and_store_candidate(mu):
+                    error_estimator = solve_and_estimate_error(mu)
+                    self._greedy_candidates.append((error_estimator, mu))
+                    return error_estimator
+
+                def solve_and_estimate_error_batch_and_store_candidates(mus):
+                    error_estimators = solve_and_estimate_error_batch(mus)
+                    self._greedy_candidates.extend(zip(error_estimators, mus))
+                    return error_estimators
+            else:
+                solve_and_estimate_error_and_store_candidate = solve_and_estimate_error
+                solve_and_estimate_error_batch_and_store_candidates = solve_and_estimate_error_batch
+
+            self._greedy_candidates = list()
+            if self.greedy_batch_size is None or solve_and_estimate_error_batch is None:
+                return self.training_set.max(solve_and_estimate_error_and_store_candidate)
+            else:
+                return self.training_set.vectorized_max(
+                    solve_and_estimate_error_batch_and_store_candidates, batch_size=self.greedy_batch_size)
 
         def error_analysis(self, N_generator=None, filename=None, **kwargs):
             """
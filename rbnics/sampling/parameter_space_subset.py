@@ -4,11 +4,11 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-import operator  # to find closest parameters
 from math import sqrt
 from mpi4py.MPI import COMM_WORLD
 from numpy import zeros as array
-from numpy import argmax
+from numpy import argmax, asarray, atleast_1d
+from scipy.spatial import cKDTree
 from rbnics.sampling.distributions import CompositeDistribution, UniformDistribution
 from rbnics.utils.decorators import overload
 from rbnics.utils.io import ExportableList
@@ -20,6 +20,11 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
         ExportableList.__init__(self, "text")
         self.mpi_comm = COMM_WORLD
         self.distributed_max = True
+        # Counter of the modifications of the parameters, used to detect if the KD-tree needs to be rebuilt
+        self._modifications = 0
+        # KD-tree for nearest neighbours queries, built lazily, together with the counter of modifications at
+        # the time it was built
+        self._kdtree = (None, None)
 
     @overload
     def __getitem__(self, key: int):
@@ -32,6 +37,27 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
         output._list = self._list[key]
         return output
 
+    def __setitem__(self, key, item):
+        ExportableList.__setitem__(self, key, item)
+        self._modifications += 1
+
+    def append(self, element):
+        ExportableList.append(self, element)
+        self._modifications += 1
+
+    def extend(self, other_list):
+        ExportableList.extend(self, other_list)
+        self._modifications += 1
+
+    def clear(self):
+        ExportableList.clear(self)
+        self._modifications += 1
+
+    def load(self, directory, filename):
+        import_successful = ExportableList.load(self, directory, filename)
+        self._modifications += 1
+        return import_successful
+
     # Method for generation of parameter space subsets
     def generate(self, box, n, sampling=None):
         if len(box) > 0:
@@ -48,20 +74,45 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
         else:
             for i in range(n):
                 self._list.append(tuple())
+        self._modifications += 1
 
     def max(self, generator, postprocessor=None):
-        if postprocessor is None:
-            def postprocessor(value):
-                return value
+        local_list_indices = self._local_list_indices()
+        values = array(len(local_list_indices))
+        for i in range(len(local_list_indices)):
+            values[i] = generator(self._list[local_list_indices[i]])
+        return self._values_max(values, local_list_indices, postprocessor)
+
+    def vectorized_max(self, generator, postprocessor=None, batch_size=None):
+        """
+        Same as max(), but generator is called on a list of (at most batch_size) parameters at a time,
+        and is expected to return the corresponding list of values.
+        """
+        local_list_indices = self._local_list_indices()
+        if batch_size is None:
+            batch_size = max(len(local_list_indices), 1)
+        assert batch_size > 0
+        values = array(len(local_list_indices))
+        for batch_begin in range(0, len(local_list_indices), batch_size):
+            batch_indices = local_list_indices[batch_begin:batch_begin + batch_size]
+            batch_values = generator([self._list[i] for i in batch_indices])
+            assert len(batch_values) == len(batch_indices)
+            values[batch_begin:batch_begin + len(batch_indices)] = batch_values
+        return self._values_max(values, local_list_indices, postprocessor)
+
+    def _local_list_indices(self):
         if self.distributed_max:
-            local_list_indices = list(range(self.mpi_comm.rank, len(self._list), self.mpi_comm.size))
             # start from index rank and take steps of length equal to size
+            return list(range(self.mpi_comm.rank, len(self._list), self.mpi_comm.size))
         else:
-            local_list_indices = list(range(len(self._list)))
-        values = array(len(local_list_indices))
+            return list(range(len(self._list)))
+
+    def _values_max(self, values, local_list_indices, postprocessor=None):
+        if postprocessor is None:
+            def postprocessor(value):
+                return value
         values_with_postprocessing = array(len(local_list_indices))
         for i in range(len(local_list_indices)):
-            values[i] = generator(self._list[local_list_indices[i]])
             values_with_postprocessing[i] = postprocessor(values[i])
         if self.distributed_max:
             local_i_max = argmax(values_with_postprocessing)
@@ -82,6 +133,7 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
     def diff(self, other_set):
         output = ParameterSpaceSubset()
         output.distributed_max = self.distributed_max
+        other_set = set(other_set)
         output._list = [mu for mu in self._list if mu not in other_set]
         return output
 
@@ -100,10 +152,27 @@ class ParameterSpaceSubset(ExportableList):  # equivalent to a list of tuples
         if M == 0:
             return output
 
-        parameters_and_distances = list()
-        for xi_i in self:
-            distance = sqrt(sum([(x - y)**2 for (x, y) in zip(mu, xi_i)]))
-            parameters_and_distances.append((xi_i, distance))
-        parameters_and_distances.sort(key=operator.itemgetter(1))
-        output._list = [xi_i for (xi_i, _) in parameters_and_distances[:M]]
+        # Trivial case 3: all parameters are at the same distance from mu
+        if len(mu) == 0:
+            output._list = self._list[:M]
+            return output
+
+        # The KD-tree may break ties between parameters at the same distance from mu in any order: query all
+        # parameters up to the distance of the M-th closest one (with a small tolerance to account for round-off),
+        # and sort them by distance, breaking ties by position in this set
+        kdtree = self._get_kdtree()
+        mu_array = asarray(mu, dtype=float)
+        (distances, _) = kdtree.query(mu_array, k=M)
+        maximum_distance = atleast_1d(distances)[-1]
+        candidate_indices = kdtree.query_ball_point(mu_array, r=maximum_distance * (1. + 1.e-10) + 1.e-14)
+        candidate_distances_and_indices = sorted(
+            (sqrt(sum([(x - y)**2 for (x, y) in zip(mu, self._list[i])])), i) for i in candidate_indices)
+        output._list = [self._list[i] for (_, i) in candidate_distances_and_indices[:M]]
         return output
+
+    def _get_kdtree(self):
+        (kdtree_modifications, kdtree) = self._kdtree
+        if kdtree_modifications != self._modifications:  # parameters have been changed since the KD-tree was built
+            kdtree = cKDTree(asarray(self._list, dtype=float))
+            self._kdtree = (self._modifications, kdtree)
+        return kdtree
@@ -9,6 +9,7 @@ import hashlib
 from numpy import isclose
 from rbnics.problems.base import ParametrizedProblem
 from rbnics.backends import AffineExpansionStorage, assign, copy, EigenSolver, export, Function, import_, product, sum
+from rbnics.sampling import ParameterSpaceSubset
 from rbnics.utils.cache import Cache
 from rbnics.utils.decorators import sync_setters
 
@@ -38,6 +39,8 @@ class ParametrizedStabilityFactorEigenProblem(ParametrizedProblem):
         # Solution
         self._eigenvalue = 0.
         self._eigenvector = Function(truth_problem.stability_factor_V)
+        # Parameters for which the eigenproblem has been solved, to warm start the eigensolver
+        self._solved_parameters = ParameterSpaceSubset()
         # I/O
         self.folder["cache"] = os.path.join(folder_prefix, "cache")
 
@@ -84,6 +87,9 @@ class ParametrizedStabilityFactorEigenProblem(ParametrizedProblem):
         )
 
     def init(self):
+        # Parameters solved before this (re)initialization, e.g. during the offline phase, are not retained
+        self._solved_parameters = ParameterSpaceSubset()
+
         # Store the left and right hand side operators
         if self.operator["stability_factor_left_hand_matrix"] is None:
             # init was not called already
@@ -145,6 +151,9 @@ class ParametrizedStabilityFactorEigenProblem(ParametrizedProblem):
         eigensolver_parameters["spectrum"] = self.spectrum + " real"
         eigensolver_parameters.update(self.eigensolver_parameters)
         eigensolver.set_parameters(eigensolver_parameters)
+        initial_space = self._initial_space()
+        if initial_space is not None:
+            eigensolver.set_initial_space(initial_space)
         eigensolver.solve(1)
 
         r, c = eigensolver.get_eigenvalue(0)  # real and complex part of the eigenvalue
@@ -154,6 +163,21 @@ class ParametrizedStabilityFactorEigenProblem(ParametrizedProblem):
 
         self._eigenvalue = r
         assign(self._eigenvector, r_vector)
+        if self.expansion_index is None and self.mu not in self._solved_parameters:
+            self._solved_parameters.append(self.mu)
+
+    def _initial_space(self):
+        # Use the eigenvector of the closest parameter for which the eigenproblem has been already solved,
+        # provided that it is still available in cache
+        if self.expansion_index is not None or len(self._solved_parameters) == 0:
+            return None
+        (closest_mu, ) = self._solved_parameters.closest(1, self.mu)
+        try:
+            closest_eigenvector = self._eigenvector_cache[closest_mu, self.spectrum]
+        except KeyError:
+            return None
+        else:
+            return [closest_eigenvector]
 
     def _cache_key(self):
         if self.expansion_index is None:
@@ -6,7 +6,7 @@
 
 import os
 import hashlib
-from numpy import isclose
+from numpy import asarray, dot, isclose
 from rbnics.backends import export, import_, LinearProgramSolver
 from rbnics.backends.common.linear_program_solver import Error as LinearProgramSolverError, Matrix, Vector
 from rbnics.problems.base import ParametrizedProblem
@@ -45,6 +45,11 @@ class SCMApproximation(ParametrizedProblem):
         # Storage for online computations
         self._stability_factor_lower_bound = 0.
         self._stability_factor_upper_bound = 0.
+        # Rows (and corresponding RHS) of the constraints of the linear program for the lower bound, which
+        # only depend on N and on the selected (or unselected) parameter associated to each row. Dicts, over N,
+        # of dicts from parameter to pair of theta and RHS
+        self._selected_parameters_constraints = dict()
+        self._unselected_parameters_constraints = dict()
 
         # I/O
         self.folder["cache"] = os.path.join(self.folder_prefix, "reduced_cache")
@@ -104,6 +109,9 @@ class SCMApproximation(ParametrizedProblem):
         self.truth_problem.init()
         # Init exact stability factor computations
         self.stability_factor_calculator.init()
+        # Reset constraints of the linear program, since selected parameters may change
+        self._selected_parameters_constraints.clear()
+        self._unselected_parameters_constraints.clear()
         # Read/Initialize reduced order data structures
         if current_stage == "online":
             self.bounding_box_min.load(self.folder["reduced_operators"], "bounding_box_min")
@@ -141,7 +149,34 @@ class SCMApproximation(ParametrizedProblem):
             self._stability_factor_lower_bound_cache[self.mu, N] = self._stability_factor_lower_bound
         return self._stability_factor_lower_bound
 
-    def _get_stability_factor_lower_bound(self, N):
+    # Get lower bounds for the stability factor for several parameters at once
+    def get_stability_factor_lower_bound_batch(self, mus, N=None):
+        if N is None:
+            N = self.N
+        mu_bak = self.mu
+        # Look up cached lower bounds first
+        stability_factor_lower_bounds = list()
+        uncached_indices = list()
+        for (i, mu) in enumerate(mus):
+            self.set_mu(mu)
+            try:
+                stability_factor_lower_bounds.append(self._stability_factor_lower_bound_cache[self.mu, N])
+            except KeyError:
+                stability_factor_lower_bounds.append(None)
+                uncached_indices.append(i)
+        # Compute thetas for all remaining parameters at once, and then solve a linear program for each of them
+        if len(uncached_indices) > 0:
+            thetas = self.truth_problem.compute_theta_batch(
+                "stability_factor_left_hand_matrix", [mus[i] for i in uncached_indices])
+            for (i, current_theta) in zip(uncached_indices, thetas):
+                self.set_mu(mus[i])
+                self._get_stability_factor_lower_bound(N, current_theta)
+                self._stability_factor_lower_bound_cache[self.mu, N] = self._stability_factor_lower_bound
+                stability_factor_lower_bounds[i] = self._stability_factor_lower_bound
+        self.set_mu(mu_bak)
+        return stability_factor_lower_bounds
+
+    def _get_stability_factor_lower_bound(self, N, current_theta=None):
         assert N <= len(self.greedy_selected_parameters)
         Q = self.truth_problem.Q["stability_factor_left_hand_matrix"]
         M_e = N
@@ -162,48 +197,36 @@ class SCMApproximation(ParametrizedProblem):
         constraints_vector = Vector(M_e + M_p + 1)
 
         # 2a. Add constraints: a constraint is added for the closest samples to mu among the selected parameters
-        mu_bak = self.mu
         closest_selected_parameters = self._closest_selected_parameters(M_e, N, self.mu)
-        for (j, omega) in enumerate(closest_selected_parameters):
-            # Overwrite parameter values
-            self.set_mu(omega)
 
-            # Compute theta
-            current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
+        def evaluate_stability_factor():
+            (stability_factor, _) = self.evaluate_stability_factor()
+            return stability_factor
 
-            # Assemble the LHS of the constraint
-            for q in range(Q):
-                constraints_matrix[j, q] = current_theta[q]
-
-            # Assemble the RHS of the constraint: note that computations for this call may be already cached
-            (constraints_vector[j], _) = self.evaluate_stability_factor()
-        self.set_mu(mu_bak)
+        if M_e > 0:
+            (constraints_matrix[:M_e, :], constraints_vector[:M_e]) = self._get_constraints(
+                self._selected_parameters_constraints.setdefault(N, dict()), closest_selected_parameters,
+                evaluate_stability_factor)
 
         # 2b. Add constraints: also constrain the closest point in the complement of selected parameters,
         #                      with RHS depending on previously computed lower bounds
-        mu_bak = self.mu
         closest_selected_parameters_complement = self._closest_unselected_parameters(M_p, N, self.mu)
-        for (j, nu) in enumerate(closest_selected_parameters_complement):
-            # Overwrite parameter values
-            self.set_mu(nu)
-
-            # Compute theta
-            current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
-
-            # Assemble the LHS of the constraint
-            for q in range(Q):
-                constraints_matrix[M_e + j, q] = current_theta[q]
 
-            # Assemble the RHS of the constraint: note that computations for this call may be already cached
+        def get_previous_stability_factor_lower_bound():
             if N > 1:
-                constraints_vector[M_e + j] = self.get_stability_factor_lower_bound(N - 1)
+                return self.get_stability_factor_lower_bound(N - 1)
             else:
-                constraints_vector[M_e + j] = 0.
-        self.set_mu(mu_bak)
+                return 0.
+
+        if M_p > 0:
+            (constraints_matrix[M_e:M_e + M_p, :], constraints_vector[M_e:M_e + M_p]) = self._get_constraints(
+                self._unselected_parameters_constraints.setdefault(N, dict()), closest_selected_parameters_complement,
+                get_previous_stability_factor_lower_bound)
 
         # 2c. Add constraints: also constrain the stability factor for mu to be positive
-        # Compute theta
-        current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
+        # Compute theta, unless it has been already provided
+        if current_theta is None:
+            current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
 
         # Assemble the LHS of the constraint
         for q in range(Q):
@@ -229,6 +252,22 @@ class SCMApproximation(ParametrizedProblem):
 
         self._stability_factor_lower_bound = stability_factor_lower_bound
 
+    def _get_constraints(self, constraints, parameters, compute_rhs):
+        # Rows of the constraints only depend on the parameter associated to them, and not on mu: compute
+        # (thetas all at once, and RHS one parameter at a time) only the ones which have not been computed yet
+        missing_parameters = [parameter for parameter in parameters if parameter not in constraints]
+        if len(missing_parameters) > 0:
+            thetas = self.truth_problem.compute_theta_batch("stability_factor_left_hand_matrix", missing_parameters)
+            mu_bak = self.mu
+            for (parameter, theta) in zip(missing_parameters, thetas):
+                # Overwrite parameter values
+                self.set_mu(parameter)
+                # Assemble the RHS of the constraint: note that computations for this call may be already cached
+                constraints[parameter] = (theta, compute_rhs())
+            self.set_mu(mu_bak)
+        return (asarray([constraints[parameter][0] for parameter in parameters]),
+                asarray([constraints[parameter][1] for parameter in parameters]))
+
     # Get an upper bound for the stability factor
     def get_stability_factor_upper_bound(self, N=None):
         if N is None:
@@ -241,25 +280,23 @@ class SCMApproximation(ParametrizedProblem):
         return self._stability_factor_upper_bound
 
     def _get_stability_factor_upper_bound(self, N):
-        Q = self.truth_problem.Q["stability_factor_left_hand_matrix"]
-        upper_bound_vectors = self.upper_bound_vectors
-
-        stability_factor_upper_bound = None
         current_theta = self.truth_problem.compute_theta("stability_factor_left_hand_matrix")
+        (self._stability_factor_upper_bound, ) = self._compute_stability_factor_upper_bounds(
+            N, asarray([current_theta], dtype=float))
 
-        for j in range(N):
-            upper_bound_vector = upper_bound_vectors[j]
-
-            # Compute the cost function for fixed omega
-            obj = 0.
-            for q in range(Q):
-                obj += upper_bound_vector[q] * current_theta[q]
-
-            if stability_factor_upper_bound is None or obj < stability_factor_upper_bound:
-                stability_factor_upper_bound = obj
-
-        assert stability_factor_upper_bound is not None
-        self._stability_factor_upper_bound = stability_factor_upper_bound
+    # Get upper bounds for the stability factor for several parameters at once
+    def get_stability_factor_upper_bound_batch(self, mus, N=None):
+        if N is None:
+            N = self.N
+        thetas = self.truth_problem.compute_theta_batch("stability_factor_left_hand_matrix", mus)
+        return self._compute_stability_factor_upper_bounds(N, thetas)
+
+    def _compute_stability_factor_upper_bounds(self, N, thetas):
+        assert N > 0
+        # Evaluate the cost function for all upper bound vectors (rows) and all parameters (columns)
+        # with a single matrix-matrix product, and then minimize over the upper bound vectors
+        upper_bound_vectors = self.upper_bound_vectors.dense_content()[:N]
+        return dot(upper_bound_vectors, thetas.T).min(axis=0)
 
     def _cache_key(self, N):
         return (self.mu, N)
@@ -29,6 +29,20 @@ class SCMApproximationReductionMethod(ReductionMethod):
         self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
         self.greedy_selected_parameters = SCM_approximation.greedy_selected_parameters
         self.greedy_error_estimators = GreedyErrorEstimatorsList()
+        # Number of training parameters for which the error estimator is evaluated at once during the
+        # greedy (None means that parameters are processed one at a time)
+        self.greedy_batch_size = None
+
+    def set_greedy_batch_size(self, greedy_batch_size):
+        """
+        It enables the evaluation of the error estimator for several training parameters at once
+        during the greedy. The selected parameter is the same one of the default (serial) evaluation.
+
+        :param greedy_batch_size: maximum number of parameters to be processed at once,
+            or None to process parameters one at a time.
+        """
+        assert greedy_batch_size is None or greedy_batch_size > 0
+        self.greedy_batch_size = greedy_batch_size
 
     # OFFLINE: set the elements in the training set.
     def initialize_training_set(self, ntrain, enable_import=True, sampling=None, **kwargs):
@@ -174,11 +188,7 @@ class SCMApproximationReductionMethod(ReductionMethod):
 
     # Choose the next parameter in the offline stage in a greedy fashion
     def greedy(self):
-        def solve_and_estimate_error(mu):
-            self.SCM_approximation.set_mu(mu)
-
-            stability_factor_lower_bound = self.SCM_approximation.get_stability_factor_lower_bound()
-            stability_factor_upper_bound = self.SCM_approximation.get_stability_factor_upper_bound()
+        def compute_error_estimator(mu, stability_factor_lower_bound, stability_factor_upper_bound):
             ratio = stability_factor_lower_bound / stability_factor_upper_bound
 
             if ratio < 0. and not isclose(ratio, 0.):  # if ratio << 0
@@ -192,7 +202,25 @@ class SCMApproximationReductionMethod(ReductionMethod):
             error_estimator = 1. - ratio
             return error_estimator
 
-        (error_estimator_max, error_estimator_argmax) = self.training_set.max(solve_and_estimate_error)
+        def solve_and_estimate_error(mu):
+            self.SCM_approximation.set_mu(mu)
+
+            stability_factor_lower_bound = self.SCM_approximation.get_stability_factor_lower_bound()
+            stability_factor_upper_bound = self.SCM_approximation.get_stability_factor_upper_bound()
+            return compute_error_estimator(mu, stability_factor_lower_bound, stability_factor_upper_bound)
+
+        def solve_and_estimate_error_batch(mus):
+            stability_factor_lower_bounds = self.SCM_approximation.get_stability_factor_lower_bound_batch(mus)
+            stability_factor_upper_bounds = self.SCM_approximation.get_stability_factor_upper_bound_batch(mus)
+            return [compute_error_estimator(mu, stability_factor_lower_bound, stability_factor_upper_bound)
+                    for (mu, stability_factor_lower_bound, stability_factor_upper_bound) in zip(
+                        mus, stability_factor_lower_bounds, stability_factor_upper_bounds)]
+
+        if self.greedy_batch_size is None:
+            (error_estimator_max, error_estimator_argmax) = self.training_set.max(solve_and_estimate_error)
+        else:
+            (error_estimator_max, error_estimator_argmax) = self.training_set.vectorized_max(
+                solve_and_estimate_error_batch, batch_size=self.greedy_batch_size)
         self.SCM_approximation.set_mu(self.training_set[error_estimator_argmax])
         self.greedy_error_estimators.append(error_estimator_max)
         self.greedy_error_estimators.save(self.folder["post_processing"], "error_estimator_max")
@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 import os
+from numpy import asarray, empty
 from rbnics.backends.online import online_copy, online_export, online_import_, OnlineVector
 from rbnics.utils.decorators import list_of, overload
 from rbnics.utils.io import Folders, TextIO as ItemVectorDimensionIO, TextIO as LenIO
@@ -13,6 +14,8 @@ from rbnics.utils.io import Folders, TextIO as ItemVectorDimensionIO, TextIO as
 class UpperBoundsList(list):
     def __init__(self):
         self._list = list()
+        # Contiguous copy of the content, together with the items it was assembled from
+        self._dense_content = ((), None)
 
     def append(self, element):
         self._list.append(element)
@@ -25,6 +28,22 @@ class UpperBoundsList(list):
     def extend(self, other_list):
         self._list.extend(other_list._list)
 
+    def dense_content(self):
+        """
+        Return the vectors in the list stacked as rows of a contiguous array, which is only assembled again
+        when the list has been changed.
+        """
+        (dense_items, dense_content) = self._dense_content
+        if (len(dense_items) != len(self._list)
+                or any(dense_item is not item for (dense_item, item) in zip(dense_items, self._list))):
+            dense_items = tuple(self._list)
+            if len(dense_items) > 0:
+                dense_content = asarray([asarray(item) for item in dense_items], dtype=float)
+            else:
+                dense_content = empty((0, 0))
+            self._dense_content = (dense_items, dense_content)
+        return dense_content
+
     def save(self, directory, filename):
         # Get full directory name
         full_directory = Folders.Folder(os.path.join(str(directory), filename))
@@ -4,9 +4,13 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+import sys
+from collections import OrderedDict
 from collections.abc import MutableMapping
 from functools import wraps
 from logging import DEBUG, getLogger
+from numbers import Number
+from numpy import asarray
 from pylru import lrucache
 
 logger = getLogger("rbnics/utils/cache/cache.py")
@@ -15,6 +19,10 @@ logger = getLogger("rbnics/utils/cache/cache.py")
 class Cache(object):
     def __init__(self, config_section=None, key_generator=None, import_=None, export=None, filename_generator=None):
         self._config_section = config_section
+        # Counters for monitoring of RAM cache usage
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
         if self._config_section is None:
             self._storage = dict()
             self._key_generator = None
@@ -29,12 +37,20 @@ class Cache(object):
                 cache_size = config.get(self._config_section, "RAM cache limit")
                 assert isinstance(cache_size, str)
                 if cache_size == "unlimited":
-                    self._storage = dict()
+                    cache_size = None
                 else:
                     assert cache_size.isdigit()
                     cache_size = int(cache_size)
                     assert cache_size > 0
-                    self._storage = lrucache(cache_size)
+                cache_memory_size = config.get(self._config_section, "RAM cache memory limit")
+                assert isinstance(cache_memory_size, str)
+                cache_memory_size = memory_size_from_string(cache_memory_size)
+                if cache_memory_size is not None:
+                    self._storage = MemoryLimitedLRUStorage(cache_size, cache_memory_size, self._on_eviction)
+                elif cache_size is not None:
+                    self._storage = lrucache(cache_size, self._on_eviction)
+                else:
+                    self._storage = dict()
                 assert key_generator is not None
                 self._key_generator = key_generator
             else:
@@ -61,6 +77,25 @@ class Cache(object):
         """
         return len(self._storage)
 
+    def statistics(self):
+        """
+        Returns counters of hits, misses and evictions of RAM cache, as well as its current number of entries
+        and (if RAM cache is limited by memory usage) its current memory usage in bytes.
+        """
+        statistics = {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "entries": len(self._storage)
+        }
+        if isinstance(self._storage, MemoryLimitedLRUStorage):
+            statistics["memory"] = self._storage.memory
+        return statistics
+
+    def _on_eviction(self, key, value):
+        self._evictions += 1
+        logger.log(DEBUG, "Evicted key " + str(key) + " from cache")
+
     def clear(self):
         """
         Clears RAM cache, but not disk one.
@@ -82,6 +117,7 @@ class Cache(object):
         try:
             storage_value = self._storage[storage_key]
         except KeyError as key_error:
+            self._misses += 1
             if self._filename_generator is not None:
                 storage_filename = self._filename_generator(*args, **kwargs)
                 try:
@@ -102,6 +138,7 @@ class Cache(object):
                            + " and kwargs = " + str(kwargs) + ") from cache")
                 raise key_error
         else:
+            self._hits += 1
             logger.log(DEBUG, "Loaded key " + str(storage_key)
                        + " (corresponding to args = " + str(args)
                        + " and kwargs = " + str(kwargs) + ") from cache")
@@ -205,3 +242,108 @@ class DisabledStorage(MutableMapping):
 
     def __keytransform__(self, key):
         return key
+
+
+class MemoryLimitedLRUStorage(MutableMapping):
+    """
+    Least recently used storage, which evicts items when either the number of items or their (estimated)
+    memory usage exceed the provided limits. The most recently stored item is never evicted.
+    """
+
+    def __init__(self, size, memory_size, callback=None):
+        assert size is None or size > 0
+        assert memory_size > 0
+        self._size = size
+        self._memory_size = memory_size
+        self._callback = callback
+        self._storage = OrderedDict()  # from key to (value, memory)
+        self.memory = 0
+
+    def __getitem__(self, key):
+        (value, memory) = self._storage[key]
+        self._storage.move_to_end(key)
+        # Update memory usage, since value may have grown after being stored (e.g. in case of time series)
+        updated_memory = estimate_memory_size(value)
+        if updated_memory != memory:
+            self._storage[key] = (value, updated_memory)
+            self.memory += updated_memory - memory
+            self._evict()
+        return value
+
+    def __setitem__(self, key, value):
+        if key in self._storage:
+            (_, memory) = self._storage.pop(key)
+            self.memory -= memory
+        memory = estimate_memory_size(value)
+        self._storage[key] = (value, memory)
+        self.memory += memory
+        self._evict()
+
+    def __delitem__(self, key):
+        (_, memory) = self._storage.pop(key)
+        self.memory -= memory
+
+    def __contains__(self, key):
+        return key in self._storage
+
+    def __iter__(self):
+        return iter(self._storage)
+
+    def __len__(self):
+        return len(self._storage)
+
+    def clear(self):
+        self._storage.clear()
+        self.memory = 0
+
+    def _evict(self):
+        while len(self._storage) > 1 and (
+            self.memory > self._memory_size
+            or (self._size is not None and len(self._storage) > self._size)
+        ):
+            (key, (value, memory)) = self._storage.popitem(last=False)
+            self.memory -= memory
+            if self._callback is not None:
+                self._callback(key, value)
+
+
+def estimate_memory_size(value):
+    """
+    Returns an estimate of the memory (in bytes) required to store value.
+    """
+    if isinstance(value, Number):
+        return sys.getsizeof(value)
+    elif hasattr(value, "nbytes"):  # numpy arrays
+        return value.nbytes
+    elif hasattr(value, "vector"):  # functions
+        return estimate_memory_size(value.vector())
+    elif hasattr(value, "local_size"):  # dolfin vectors
+        return value.local_size() * 8
+    elif hasattr(value, "__array__"):  # online vectors and matrices
+        return asarray(value).nbytes
+    elif isinstance(value, dict):
+        return sum(estimate_memory_size(item) for item in value.values())
+    elif hasattr(value, "__iter__") and hasattr(value, "__len__") and not isinstance(value, (str, bytes)):
+        return sum(estimate_memory_size(item) for item in value)
+    else:
+        return sys.getsizeof(value)
+
+
+def memory_size_from_string(memory_size):
+    """
+    Converts a memory size (e.g. "unlimited", "1048576", "512MB" or "2GB") to a number of bytes,
+    or None if unlimited.
+    """
+    if memory_size == "unlimited":
+        return None
+    units = {"KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4, "B": 1}
+    for (unit, multiplier) in units.items():
+        if memory_size.upper().endswith(unit):
+            memory_size = memory_size[:-len(unit)].strip()
+            break
+    else:
+        multiplier = 1
+    assert memory_size.isdigit(), "Invalid memory size"
+    memory_size = int(memory_size) * multiplier
+    assert memory_size > 0
+    return memory_size
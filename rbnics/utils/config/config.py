@@ -17,27 +17,37 @@ class Config(object):
     # Set class defaults
     defaults = {
         "backends": {
+            "dense basis storage": False,
+            "linear program solver": "glpk",
             "online backend": "numpy",
+            "randomized POD": False,
             "required backends": None
         },
         "EIM": {
             "cache": {"disk", "RAM"},
             "disk cache limit": "unlimited",
-            "RAM cache limit": "1"
+            "incremental interpolation errors": False,
+            "out of core snapshots": False,
+            "RAM cache limit": "1",
+            "RAM cache memory limit": "unlimited"
         },
         "problems": {
             "cache": {"disk", "RAM"},
             "disk cache limit": "unlimited",
-            "RAM cache limit": "1"
+            "RAM cache limit": "1",
+            "RAM cache memory limit": "unlimited"
         },
         "reduced problems": {
             "cache": {"RAM"},
-            "RAM cache limit": "unlimited"
+            "RAM cache limit": "unlimited",
+            "RAM cache memory limit": "unlimited",
+            "memory map operators": False
         },
         "SCM": {
             "cache": {"disk", "RAM"},
             "disk cache limit": "unlimited",
-            "RAM cache limit": "1"
+            "RAM cache limit": "1",
+            "RAM cache memory limit": "unlimited"
         }
     }
 
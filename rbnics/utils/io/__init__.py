@@ -4,6 +4,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from rbnics.utils.io.archive_io import ArchiveIO
 from rbnics.utils.io.component_name_to_basis_component_index_dict import ComponentNameToBasisComponentIndexDict
 from rbnics.utils.io.csv_io import CSVIO
 from rbnics.utils.io.error_analysis_table import ErrorAnalysisTable
@@ -22,6 +23,7 @@ from rbnics.utils.io.text_line import TextLine
 from rbnics.utils.io.timer import Timer
 
 __all__ = [
+    "ArchiveIO",
     "ComponentNameToBasisComponentIndexDict",
     "CSVIO",
     "ErrorAnalysisTable",
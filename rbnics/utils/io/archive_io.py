@@ -0,0 +1,107 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import struct
+import zipfile
+import numpy
+from rbnics.utils.mpi import parallel_io
+
+
+class ArchiveIO(object):
+    """
+    Store several variables in a single (uncompressed) numpy archive file. Arrays are stored as they are,
+    while any other variable is stored through its representation, as in TextIO. An index, mapping each
+    variable name to the way it has been stored, is saved in the archive as well.
+    """
+
+    # Save a dict of variables to file
+    @staticmethod
+    def save_file(content, directory, filename):
+        if not filename.endswith(".npz"):
+            filename = filename + ".npz"
+        assert _index_name not in content
+        index = dict()
+        archive_content = dict()
+        for (name, value) in content.items():
+            if isinstance(value, numpy.ndarray):
+                index[name] = "array"
+                archive_content[name] = value
+            else:
+                index[name] = "text"
+                archive_content[name] = numpy.array(repr(value))
+        archive_content[_index_name] = numpy.array(repr(index))
+
+        def save_file_task():
+            numpy.savez(os.path.join(str(directory), filename), **archive_content)
+
+        parallel_io(save_file_task)
+
+    # Load a dict of variables from file. If mmap_mode is provided, arrays are memory-mapped (see numpy.memmap)
+    # rather than read in memory
+    @staticmethod
+    def load_file(directory, filename, globals=None, mmap_mode=None):
+        if not filename.endswith(".npz"):
+            filename = filename + ".npz"
+        if globals is None:
+            globals = dict()
+        globals.update({"__builtins__": None})
+        content = dict()
+        with numpy.load(os.path.join(str(directory), filename), allow_pickle=False) as archive:
+            index = eval(str(archive[_index_name]), {"__builtins__": None}, {})
+            for (name, storage) in index.items():
+                assert storage in ("array", "text")
+                if storage == "array":
+                    array = None
+                    if mmap_mode is not None:
+                        array = _memory_map(archive.zip, os.path.join(str(directory), filename), name, mmap_mode)
+                    if array is None:
+                        array = archive[name]
+                    content[name] = array
+                else:
+                    content[name] = eval(str(archive[name]), globals, {})
+        return content
+
+    # Check if the file exists
+    @staticmethod
+    def exists_file(directory, filename):
+        if not filename.endswith(".npz"):
+            filename = filename + ".npz"
+
+        def exists_file_task():
+            return os.path.exists(os.path.join(str(directory), filename))
+
+        return parallel_io(exists_file_task)
+
+
+_index_name = "__index__"
+
+
+def _memory_map(archive, path, name, mmap_mode):
+    # Arrays are stored uncompressed by numpy.savez, so that their data can be memory-mapped directly
+    # from the archive file, once the offset of the data in the file is determined
+    info = archive.getinfo(name + ".npy")
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    with open(path, "rb") as archive_file:
+        # Skip the local header of the archive member
+        archive_file.seek(info.header_offset)
+        local_header = archive_file.read(30)
+        (member_name_length, member_extra_length) = struct.unpack("<HH", local_header[26:30])
+        archive_file.seek(info.header_offset + 30 + member_name_length + member_extra_length)
+        # Skip the header of the npy file
+        version = numpy.lib.format.read_magic(archive_file)
+        if version == (1, 0):
+            (shape, fortran_order, dtype) = numpy.lib.format.read_array_header_1_0(archive_file)
+        elif version == (2, 0):
+            (shape, fortran_order, dtype) = numpy.lib.format.read_array_header_2_0(archive_file)
+        else:
+            return None
+        offset = archive_file.tell()
+    if dtype.hasobject or len(shape) == 0 or 0 in shape:
+        return None
+    return numpy.memmap(path, dtype=dtype, mode=mmap_mode, offset=offset, shape=shape,
+                        order="F" if fortran_order else "C")
@@ -0,0 +1,88 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import os
+import pytest
+from dolfin import dx, FunctionSpace, IntervalMesh, pi, TestFunction, TrialFunction
+from rbnics import EquispacedDistribution, ParametrizedExpression
+from rbnics.backends import ParametrizedExpressionFactory, ParametrizedTensorFactory
+from rbnics.eim.problems.eim_approximation import EIMApproximation
+from rbnics.eim.reduction_methods.eim_approximation_reduction_method import EIMApproximationReductionMethod
+from rbnics.problems.base import ParametrizedProblem
+from rbnics.utils.config import config
+
+
+@pytest.mark.parametrize("expression_type", ["Function", "Vector", "Matrix"])
+def test_eim_incremental_interpolation_errors(expression_type):
+    """
+    This test checks that the greedy selects the same parameters when interpolation errors are updated
+    incrementally and when the interpolation problem is solved for each snapshot, on the test case of
+    test_eim_approximation_01.
+    """
+
+    class MockProblem(ParametrizedProblem):
+        def __init__(self, V, **kwargs):
+            ParametrizedProblem.__init__(self, "")
+            self.V = V
+
+        def name(self):
+            return "MockProblem_incremental_interpolation_errors_" + expression_type
+
+    class ParametrizedFunctionApproximation(EIMApproximation):
+        def __init__(self, V, expression_type, folder_prefix):
+            self.V = V
+            # Parametrized function to be interpolated
+            mock_problem = MockProblem(V)
+            f = ParametrizedExpression(
+                mock_problem, "(1-x[0])*cos(3*pi*mu[0]*(1+x[0]))*exp(-mu[0]*(1+x[0]))", mu=(1., ),
+                element=V.ufl_element())
+            #
+            assert expression_type in ("Function", "Vector", "Matrix")
+            if expression_type == "Function":
+                # Call Parent constructor
+                EIMApproximation.__init__(
+                    self, mock_problem, ParametrizedExpressionFactory(f), folder_prefix, "Greedy")
+            elif expression_type == "Vector":
+                v = TestFunction(V)
+                form = f * v * dx
+                # Call Parent constructor
+                EIMApproximation.__init__(
+                    self, mock_problem, ParametrizedTensorFactory(form), folder_prefix, "Greedy")
+            elif expression_type == "Matrix":
+                u = TrialFunction(V)
+                v = TestFunction(V)
+                form = f * u * v * dx
+                # Call Parent constructor
+                EIMApproximation.__init__(
+                    self, mock_problem, ParametrizedTensorFactory(form), folder_prefix, "Greedy")
+            else:  # impossible to arrive here anyway thanks to the assert
+                raise AssertionError("Invalid expression_type")
+
+    # Create the mesh and the Finite Element space (Lagrange P1) for this test
+    mesh = IntervalMesh(100, -1., 1.)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+
+    # Perform the offline phase with and without incremental interpolation errors
+    greedy_selected_parameters = dict()
+    incremental_interpolation_errors_bak = config.get("EIM", "incremental interpolation errors")
+    for incremental_interpolation_errors in (False, True):
+        config.set("EIM", "incremental interpolation errors", incremental_interpolation_errors)
+        folder_prefix = os.path.join(
+            "test_eim_incremental_interpolation_errors_tempdir", expression_type,
+            str(incremental_interpolation_errors))
+        parametrized_function_approximation = ParametrizedFunctionApproximation(V, expression_type, folder_prefix)
+        parametrized_function_approximation.set_mu_range([(1., pi), ])
+        parametrized_function_reduction_method = EIMApproximationReductionMethod(parametrized_function_approximation)
+        parametrized_function_reduction_method.set_Nmax(20)
+        parametrized_function_reduction_method.set_tolerance(0.)
+        parametrized_function_reduction_method.initialize_training_set(51, sampling=EquispacedDistribution())
+        parametrized_function_reduction_method.offline()
+        greedy_selected_parameters[incremental_interpolation_errors] = list(
+            parametrized_function_reduction_method.greedy_selected_parameters)
+    config.set("EIM", "incremental interpolation errors", incremental_interpolation_errors_bak)
+
+    # Compare greedy choices
+    assert greedy_selected_parameters[True] == greedy_selected_parameters[False]
@@ -4,8 +4,10 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+import pytest
 from numpy import isclose
 from rbnics.backends.common.linear_program_solver import LinearProgramSolver, Matrix, Vector
+from rbnics.utils.config import config
 
 """
 Solve
@@ -21,7 +23,15 @@ with cost
 """
 
 
-def test_linear_program_solver():
+@pytest.fixture(params=["glpk", "highs"])
+def linear_program_solver(request):
+    linear_program_solver_bak = config.get("backends", "linear program solver")
+    config.set("backends", "linear program solver", request.param)
+    yield request.param
+    config.set("backends", "linear program solver", linear_program_solver_bak)
+
+
+def test_linear_program_solver(linear_program_solver):
     c = Vector(2)
     A = Matrix(2, 2)
     b = Vector(2)
@@ -37,3 +47,33 @@ def test_linear_program_solver():
     solver = LinearProgramSolver(c, A, b, bounds)
     optimal_cost = solver.solve()
     assert isclose(optimal_cost, 0.625)
+
+
+"""
+Solve
+    min    x + y
+    s.t.   x + y >= 1
+           0.3 <= x <= 2
+           0.8 <= y <= 2
+The optimal solution is
+    x = 0.3, y = 0.8
+with cost
+    1.1
+"""
+
+
+def test_linear_program_solver_nonzero_lower_bounds(linear_program_solver):
+    c = Vector(2)
+    A = Matrix(1, 2)
+    b = Vector(1)
+    bounds = [None] * 2
+
+    c[0], c[1] = 1., 1.
+    A[0, 0], A[0, 1] = 1., 1.
+    b[0] = 1.
+    bounds[0] = (0.3, 2.)
+    bounds[1] = (0.8, 2.)
+
+    solver = LinearProgramSolver(c, A, b, bounds)
+    optimal_cost = solver.solve()
+    assert isclose(optimal_cost, 1.1)
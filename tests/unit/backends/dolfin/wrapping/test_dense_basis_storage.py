@@ -0,0 +1,67 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import isclose, shares_memory
+from numpy.random import default_rng
+from dolfin import assemble, dx, FunctionSpace, inner, grad, TestFunction, TrialFunction, UnitSquareMesh
+from rbnics.backends.dolfin import Function, FunctionsList
+from rbnics.backends.dolfin.wrapping import (dense_basis_transpose_mul_matrix_mul_dense_basis,
+                                             dense_basis_transpose_mul_vector, functions_list_dense_local_content)
+
+
+def FunctionsListWithRandomContent(V, N):
+    rng = default_rng(0)
+    functions_list = FunctionsList(V)
+    for _ in range(N):
+        function = Function(V)
+        function.vector().set_local(rng.standard_normal(function.vector().local_size()))
+        function.vector().apply("insert")
+        functions_list.enrich(function)
+    return functions_list
+
+
+def test_dense_basis_transpose_mul_matrix_mul_dense_basis():
+    mesh = UnitSquareMesh(10, 10)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    A = assemble(inner(grad(u), grad(v)) * dx + u * v * dx)
+    Z = FunctionsListWithRandomContent(V, 4)
+
+    dense_output = dense_basis_transpose_mul_matrix_mul_dense_basis(
+        functions_list_dense_local_content(Z), A, functions_list_dense_local_content(Z[:3]))
+    assert dense_output.shape == (4, 3)
+    for i in range(4):
+        for j in range(3):
+            assert isclose(dense_output[i, j], Z[i].vector().inner(A * Z[j].vector()))
+
+
+def test_dense_basis_transpose_mul_vector():
+    mesh = UnitSquareMesh(10, 10)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    Z = FunctionsListWithRandomContent(V, 4)
+    w = FunctionsListWithRandomContent(V, 1)[0]
+
+    dense_output = dense_basis_transpose_mul_vector(functions_list_dense_local_content(Z), w.vector())
+    for i in range(4):
+        assert isclose(dense_output[i], Z[i].vector().inner(w.vector()))
+
+
+def test_functions_list_dense_local_content_slices():
+    mesh = UnitSquareMesh(10, 10)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    Z = FunctionsListWithRandomContent(V, 4)
+
+    content = functions_list_dense_local_content(Z)
+    sliced_content = functions_list_dense_local_content(Z[1:3])
+    assert shares_memory(content, sliced_content)
+    assert (sliced_content == content[1:3]).all()
+
+    Z.enrich(FunctionsListWithRandomContent(V, 1)[0])
+    content = functions_list_dense_local_content(Z)
+    assert content.shape[0] == 5
+    for i in range(5):
+        assert (content[i] == Z[i].vector().get_local()).all()
@@ -0,0 +1,71 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import allclose
+from numpy.random import default_rng
+from rbnics.backends.online.numpy import AffineExpansionStorage, Matrix, product, sum, Vector
+
+"""
+Check that the contiguous dense content of an affine expansion storage of matrices or vectors
+is kept up to date when its items (or slices of them) are modified in place
+"""
+
+
+def Storage(Q, N, tensor_type):
+    rng = default_rng(0)
+    items = list()
+    for _ in range(Q):
+        if tensor_type == "Matrix":
+            item = Matrix(N, N)
+            item[:, :] = rng.standard_normal((N, N))
+        else:
+            item = Vector(N)
+            item[:] = rng.standard_normal(N)
+        items.append(item)
+    return AffineExpansionStorage(tuple(items))
+
+
+def Expected(theta, storage):
+    output = 0.
+    for (q, theta_q) in enumerate(theta):
+        output = output + theta_q * storage[q].content
+    return output
+
+
+def test_numpy_affine_expansion_storage_matrix_in_place():
+    A = Storage(3, 5, "Matrix")
+    theta = (1., 2., 3.)
+    assert allclose(sum(product(theta, A)).content, Expected(theta, A))
+    A[0][0, 0] += 100.
+    A[2][1, 3] = - 7.
+    assert allclose(sum(product(theta, A)).content, Expected(theta, A))
+    # Dense slices are views as well
+    A_sliced = A[:3, :3]
+    assert allclose(sum(product(theta, A_sliced)).content, Expected(theta, A)[:3, :3])
+    A[1][2, 2] += 100.
+    assert allclose(sum(product(theta, A_sliced)).content, Expected(theta, A)[:3, :3])
+    A_sliced[0][1, 1] += 100.
+    assert allclose(sum(product(theta, A)).content, Expected(theta, A))
+
+
+def test_numpy_affine_expansion_storage_vector_in_place():
+    F = Storage(2, 5, "Vector")
+    theta = (1., - 2.)
+    assert allclose(sum(product(theta, F)).content, Expected(theta, F))
+    F[1][4] += 100.
+    assert allclose(sum(product(theta, F)).content, Expected(theta, F))
+
+
+def test_numpy_affine_expansion_storage_shared_item():
+    A = Storage(2, 4, "Matrix")
+    theta = (1., 1.)
+    assert allclose(sum(product(theta, A)).content, Expected(theta, A))
+    # Storing the same item in another storage rebinds it to the dense content of the other storage
+    B = AffineExpansionStorage((A[0], A[1]))
+    assert allclose(sum(product(theta, B)).content, Expected(theta, A))
+    A[0][0, 0] += 100.
+    assert allclose(sum(product(theta, A)).content, Expected(theta, A))
+    assert allclose(sum(product(theta, B)).content, Expected(theta, B))
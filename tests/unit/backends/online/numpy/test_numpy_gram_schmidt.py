@@ -0,0 +1,57 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import allclose, asarray, dot, eye, vander
+from numpy.random import default_rng
+from rbnics.backends.online.numpy import Function, GramSchmidt, Matrix
+
+"""
+Orthonormalize a set of nearly linearly dependent vectors with respect to a symmetric positive definite
+inner product, adding them either one at a time or in blocks
+"""
+
+
+def InnerProduct(N):
+    rng = default_rng(0)
+    X_array = rng.standard_normal((N, N))
+    X = Matrix(N, N)
+    X[:, :] = dot(X_array, X_array.T) + N * eye(N)
+    return X
+
+
+def Snapshots(N, M):
+    # Columns of a Vandermonde matrix are badly conditioned, and thus challenge the stability of Gram Schmidt
+    snapshots_array = vander(default_rng(1).uniform(0., 1., N), M, increasing=True)
+    snapshots = list()
+    for m in range(M):
+        snapshot = Function(N)
+        snapshot.vector()[:] = snapshots_array[:, m]
+        snapshots.append(snapshot)
+    return snapshots
+
+
+def check_orthonormality(basis_functions, X):
+    Z = asarray([asarray(b.vector()) for b in basis_functions])
+    assert allclose(dot(Z, dot(asarray(X), Z.T)), eye(len(basis_functions)), rtol=0., atol=1.e-10)
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 8])
+def test_numpy_gram_schmidt(block_size):
+    (N, M) = (50, 8)
+    X = InnerProduct(N)
+    snapshots = Snapshots(N, M)
+    gram_schmidt = GramSchmidt(None, X)
+    basis_functions = list()
+    for m in range(0, M, block_size):
+        if block_size == 1:
+            basis_functions.append(gram_schmidt.apply(snapshots[m], basis_functions))
+        else:
+            basis_functions.extend(gram_schmidt.apply(snapshots[m:m + block_size], basis_functions))
+    assert len(basis_functions) == M
+    check_orthonormality(basis_functions, X)
+    # Snapshots must not be changed
+    assert allclose(asarray(snapshots[1].vector()), asarray(Snapshots(N, M)[1].vector()))
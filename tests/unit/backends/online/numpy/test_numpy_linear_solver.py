@@ -0,0 +1,69 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from numpy import allclose, dot, eye
+from numpy.linalg import LinAlgError, solve
+from numpy.random import default_rng
+from rbnics.backends.online.numpy import Function, LinearSolver, Matrix, Vector
+from rbnics.backends.online.numpy.linear_solver import _factorizations
+
+"""
+Solve
+    A x = b
+for a symmetric positive definite and a nonsymmetric matrix A, with and without reusing factorizations
+"""
+
+
+def LinearSystem(N, symmetric):
+    rng = default_rng(0)
+    A_array = rng.standard_normal((N, N))
+    if symmetric:
+        A_array = dot(A_array, A_array.T) + N * eye(N)
+    A = Matrix(N, N)
+    A[:, :] = A_array
+    b = Vector(N)
+    b[:] = rng.standard_normal(N)
+    return (A, b)
+
+
+@pytest.mark.parametrize("symmetric", [True, False])
+@pytest.mark.parametrize("reuse_factorization", [True, False])
+def test_numpy_linear_solver(symmetric, reuse_factorization):
+    (A, b) = LinearSystem(20, symmetric)
+    for _ in range(2):
+        solution = Function(20)
+        solver = LinearSolver(A, solution, b)
+        solver.set_parameters({"reuse_factorization": reuse_factorization})
+        solver.solve()
+        assert allclose(solution.vector(), solve(A, b))
+
+
+def test_numpy_linear_solver_reuse_factorization():
+    (A, b) = LinearSystem(20, False)
+    solver = LinearSolver(A, Function(20), b)
+    solver.set_parameters({"reuse_factorization": True})
+    solver.solve()
+    factorizations = list(_factorizations)
+    # A copy of the same matrix is not factorized again
+    A_copy = Matrix(20, 20)
+    A_copy[:, :] = A
+    solver = LinearSolver(A_copy, Function(20), b)
+    solver.set_parameters({"reuse_factorization": True})
+    solver.solve()
+    assert len(_factorizations) == len(factorizations)
+    assert all(factorization is factorization_copy
+               for (factorization, factorization_copy) in zip(_factorizations, factorizations))
+
+
+@pytest.mark.parametrize("reuse_factorization", [True, False])
+def test_numpy_linear_solver_singular(reuse_factorization):
+    (A, b) = LinearSystem(20, False)
+    A[:, 0] = 0.
+    solver = LinearSolver(A, Function(20), b)
+    solver.set_parameters({"reuse_factorization": reuse_factorization})
+    with pytest.raises(LinAlgError):
+        solver.solve()
@@ -0,0 +1,69 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+import pytest
+from mpi4py.MPI import COMM_WORLD
+from numpy import allclose, asarray, diag, dot, eye, isclose
+from numpy.linalg import qr
+from numpy.random import default_rng
+from rbnics.backends.online.numpy import Function, Matrix, ProperOrthogonalDecomposition
+from rbnics.utils.config import config
+
+"""
+Compare the randomized POD with the exact POD on snapshots with a quickly decaying spectrum
+"""
+
+
+class Space(object):
+    mpi_comm = COMM_WORLD
+
+
+def InnerProduct(N):
+    rng = default_rng(0)
+    X_array = rng.standard_normal((N, N))
+    X = Matrix(N, N)
+    X[:, :] = dot(X_array, X_array.T) / N + eye(N)
+    return X
+
+
+def Snapshots(N, Nsnapshots):
+    rng = default_rng(1)
+    (U, _) = qr(rng.standard_normal((N, Nsnapshots)))
+    (V, _) = qr(rng.standard_normal((Nsnapshots, Nsnapshots)))
+    snapshots_array = dot(U, dot(diag([2.**(- k) for k in range(Nsnapshots)]), V.T))
+    snapshots = list()
+    for n in range(Nsnapshots):
+        snapshot = Function(N)
+        snapshot.vector()[:] = snapshots_array[:, n]
+        snapshots.append(snapshot)
+    return snapshots
+
+
+def POD(X, snapshots, Nmax, randomized):
+    randomized_bak = config.get("backends", "randomized POD")
+    config.set("backends", "randomized POD", randomized)
+    pod = ProperOrthogonalDecomposition(Space(), X)
+    for snapshot in snapshots:
+        pod.store_snapshot(snapshot)
+    (eigenvalues, _, basis_functions, N) = pod.apply(Nmax, 0.)
+    config.set("backends", "randomized POD", randomized_bak)
+    return (eigenvalues, pod.retained_energy[:N], basis_functions, N)
+
+
+@pytest.mark.parametrize("Nmax", [1, 5, 10])
+def test_numpy_randomized_proper_orthogonal_decomposition(Nmax):
+    (N, Nsnapshots) = (60, 40)
+    X = InnerProduct(N)
+    snapshots = Snapshots(N, Nsnapshots)
+    (exact_eigenvalues, exact_retained_energy, exact_basis_functions, exact_N) = POD(X, snapshots, Nmax, False)
+    (eigenvalues, retained_energy, basis_functions, N) = POD(X, snapshots, Nmax, True)
+    assert N == exact_N == Nmax
+    assert allclose(eigenvalues, exact_eigenvalues, rtol=1.e-8, atol=0.)
+    assert allclose(retained_energy, exact_retained_energy, rtol=1.e-10, atol=0.)
+    # Leading modes coincide up to their sign
+    for (basis_function, exact_basis_function) in zip(basis_functions, exact_basis_functions):
+        inner_product = dot(asarray(basis_function.vector()), dot(asarray(X), asarray(exact_basis_function.vector())))
+        assert isclose(abs(inner_product), 1., rtol=0., atol=1.e-8)
@@ -0,0 +1,134 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import allclose, asarray, eye, ones, stack
+from numpy.random import default_rng
+from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineMatrix, OnlineVector
+from rbnics.problems.base import ParametrizedReducedDifferentialProblem
+from rbnics.problems.elliptic import EllipticRBReducedProblem
+from rbnics.sampling import ParameterSpaceSubset
+from rbnics.utils.io import OnlineSizeDict
+
+"""
+Compare the batched evaluation of the error estimator of an elliptic RB reduced problem with the serial one,
+on a reduced problem whose reduced operators and error estimation operators are generated in numpy,
+and hence do not require a truth problem
+"""
+
+N = 5
+Q_a = 2
+Q_f = 2
+
+
+class TruthProblem(object):
+    terms = ["a", "f"]
+    terms_order = {"a": 2, "f": 1}
+    components = ["u"]
+    Q = {"a": Q_a, "f": Q_f}
+
+    def __init__(self):
+        self.mu = (1., 1.)
+        self.mu_range = [(0.5, 2.), (0.5, 2.)]
+
+    def name(self):
+        return "TruthProblem"
+
+    def set_mu(self, mu):
+        self.mu = mu
+
+    def set_mu_range(self, mu_range):
+        self.mu_range = mu_range
+
+    def compute_theta(self, term):
+        if term == "a":
+            return (1., self.mu[0])
+        elif term == "f":
+            return (1., self.mu[1])
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+
+    def compute_theta_batch(self, term, mus):
+        mus = asarray(mus, dtype=float)
+        if term == "a":
+            return stack((ones(len(mus)), mus[:, 0]), axis=1)
+        elif term == "f":
+            return stack((ones(len(mus)), mus[:, 1]), axis=1)
+        else:
+            raise ValueError("Invalid term for compute_theta_batch().")
+
+    def get_stability_factor_lower_bound(self):
+        return min(1., self.mu[0])
+
+
+class ReducedProblem(EllipticRBReducedProblem):
+    def __init__(self, truth_problem):
+        ParametrizedReducedDifferentialProblem.__init__(self, truth_problem)
+        self.riesz_terms = ["f", "a"]
+        self.error_estimation_terms = [("f", "f"), ("a", "f"), ("a", "a")]
+        self._linear_solver_parameters = dict()
+        self.N = N
+        self.N_bc = 0
+        self.dirichlet_bc = False
+        self.dirichlet_bc_are_homogeneous = False
+        N_dict = OnlineSizeDict()
+        N_dict["u"] = N
+        rng = default_rng(0)
+        # Reduced operators
+        self.operator["a"] = OnlineAffineExpansionStorage(Q_a)
+        for q in range(Q_a):
+            A_q = rng.standard_normal((N, N))
+            self.operator["a"][q] = OnlineMatrix(N_dict, N_dict)
+            self.operator["a"][q][:, :] = A_q @ A_q.T + N * eye(N)
+        self.operator["f"] = OnlineAffineExpansionStorage(Q_f)
+        for q in range(Q_f):
+            self.operator["f"][q] = OnlineVector(N_dict)
+            self.operator["f"][q][:] = rng.standard_normal(N)
+        # Error estimation operators, from Riesz representors in an Euclidean space of dimension 3 N
+        riesz_f = rng.standard_normal((Q_f, 3 * N))
+        riesz_a = rng.standard_normal((Q_a, N, 3 * N))
+        self.error_estimation_operator = dict()
+        self.error_estimation_operator["f", "f"] = OnlineAffineExpansionStorage(Q_f, Q_f)
+        for q_f_1 in range(Q_f):
+            for q_f_2 in range(Q_f):
+                self.error_estimation_operator["f", "f"][q_f_1, q_f_2] = riesz_f[q_f_1] @ riesz_f[q_f_2]
+        self.error_estimation_operator["a", "f"] = OnlineAffineExpansionStorage(Q_a, Q_f)
+        for q_a in range(Q_a):
+            for q_f in range(Q_f):
+                self.error_estimation_operator["a", "f"][q_a, q_f] = OnlineVector(N_dict)
+                self.error_estimation_operator["a", "f"][q_a, q_f][:] = - riesz_a[q_a] @ riesz_f[q_f]
+        self.error_estimation_operator["a", "a"] = OnlineAffineExpansionStorage(Q_a, Q_a)
+        for q_a_1 in range(Q_a):
+            for q_a_2 in range(Q_a):
+                self.error_estimation_operator["a", "a"][q_a_1, q_a_2] = OnlineMatrix(N_dict, N_dict)
+                self.error_estimation_operator["a", "a"][q_a_1, q_a_2][:, :] = riesz_a[q_a_1] @ riesz_a[q_a_2].T
+
+
+def test_elliptic_rb_reduced_problem_batch():
+    truth_problem = TruthProblem()
+    reduced_problem = ReducedProblem(truth_problem)
+    training_set = ParameterSpaceSubset()
+    training_set.generate(truth_problem.mu_range, 20)
+
+    def solve_and_estimate_error(mu):
+        reduced_problem.set_mu(mu)
+        reduced_problem.solve()
+        return reduced_problem.estimate_error()
+
+    serial_error_estimators = [solve_and_estimate_error(mu) for mu in training_set]
+    batch_error_estimators = reduced_problem.solve_and_estimate_error_batch(list(training_set))
+    assert allclose(batch_error_estimators, serial_error_estimators)
+
+    (serial_max, serial_argmax) = training_set.max(solve_and_estimate_error)
+    (batch_max, batch_argmax) = training_set.vectorized_max(
+        reduced_problem.solve_and_estimate_error_batch, batch_size=7)
+    assert serial_argmax == batch_argmax
+    assert allclose(serial_max, batch_max)
+
+    serial_solutions = list()
+    for mu in training_set:
+        reduced_problem.set_mu(mu)
+        serial_solutions.append(asarray(reduced_problem.solve().vector()))
+    assert allclose(reduced_problem.solve_batch(list(training_set)), serial_solutions)
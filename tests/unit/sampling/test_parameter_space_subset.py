@@ -0,0 +1,49 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from math import sqrt
+import operator
+from numpy import random
+from rbnics.sampling import ParameterSpaceSubset
+
+
+# Auxiliary functions
+def closest_by_stable_sort(set_, M, mu):
+    if M == len(set_):
+        return list(set_)
+    parameters_and_distances = list()
+    for xi_i in set_:
+        distance = sqrt(sum([(x - y)**2 for (x, y) in zip(mu, xi_i)]))
+        parameters_and_distances.append((xi_i, distance))
+    parameters_and_distances.sort(key=operator.itemgetter(1))
+    return [xi_i for (xi_i, _) in parameters_and_distances[:M]]
+
+
+# Test closest parameters on a grid, where several parameters are at the same distance
+def test_parameter_space_subset_closest_ties():
+    set_ = ParameterSpaceSubset()
+    set_.extend([(i, j) for i in range(3) for j in range(3)])
+    assert list(set_.closest(3, (1, 1))) == [(1, 1), (0, 1), (1, 0)]
+    for M in range(len(set_) + 1):
+        for mu in set_:
+            assert list(set_.closest(M, mu)) == closest_by_stable_sort(set_, M, mu)
+        for mu in [(0.5, 0.5), (1.5, 0.5), (-1., 3.)]:
+            assert list(set_.closest(M, mu)) == closest_by_stable_sort(set_, M, mu)
+
+
+# Test closest parameters after the set has been changed
+def test_parameter_space_subset_closest_after_changes():
+    random.seed(0)
+    set_ = ParameterSpaceSubset()
+    set_.generate([(0., 1.), (0., 1.)], 20)
+    mu = (0.5, 0.5)
+    assert list(set_.closest(5, mu)) == closest_by_stable_sort(set_, 5, mu)
+    set_.append(mu)
+    assert set_.closest(1, mu)[0] == mu
+    set_[0] = (0.49, 0.49)
+    assert list(set_.closest(5, mu)) == closest_by_stable_sort(set_, 5, mu)
+    set_.extend([(0.51, 0.5), (0.5, 0.51)])
+    assert list(set_.closest(5, mu)) == closest_by_stable_sort(set_, 5, mu)
@@ -0,0 +1,40 @@
+# Copyright (C) 2015-2022 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from numpy import zeros
+from rbnics.utils.cache import Cache
+from rbnics.utils.config import config
+
+
+def test_cache_memory_limit():
+    # Limit RAM cache to the memory required by two arrays
+    config_bak = config.get("reduced problems", "RAM cache memory limit")
+    config.set("reduced problems", "RAM cache memory limit", "16KB")
+    try:
+        cache = Cache("reduced problems", key_generator=lambda *args, **kwargs: args)
+    finally:
+        config.set("reduced problems", "RAM cache memory limit", config_bak)
+
+    # Store three arrays of 8KB each: the least recently used one is evicted
+    cache[0] = zeros(1024)
+    cache[1] = zeros(1024)
+    cache[0]
+    cache[2] = zeros(1024)
+    assert 0 in cache
+    assert 1 not in cache
+    assert 2 in cache
+
+    # Check counters
+    try:
+        cache[1]
+    except KeyError:
+        pass
+    statistics = cache.statistics()
+    assert statistics["hits"] == 1
+    assert statistics["misses"] == 1
+    assert statistics["evictions"] == 1
+    assert statistics["entries"] == 2
+    assert statistics["memory"] == 16384